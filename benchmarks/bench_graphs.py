@@ -0,0 +1,275 @@
+"""
+Benchmarks reprodutíveis dos algoritmos (src/graphs/algorithms.py) e dos carregadores (src/graphs/graph.py).
+
+Cargas de trabalho:
+	- grid        grafo sintético em grade, parecido com a malha de bairros (não dirigido, pesos 1..5)
+	- scale-free  grafo sintético livre de escala (Barabási-Albert), parecido com a malha aérea
+	- routes      data/routes.csv real (carga fixa, sempre incluída)
+
+Cada tarefa roda com aquecimento + repetições e o resultado (p50/p95/p99, min/max, desvio)
+é salvo em JSON para comparar entre commits.
+
+Exemplos:
+	python benchmarks/bench_graphs.py
+	python benchmarks/bench_graphs.py --sizes 1000 10000 --repeat 7 --json out/bench_atual.json
+	python benchmarks/bench_graphs.py --compare out/bench_base.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import math
+import platform
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+SRC_DIR = REPO_ROOT / "src"
+if str(SRC_DIR) not in sys.path:
+	sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra, bfs, dfs, bellman_ford
+from graphs.perf import medir
+
+DATA_DIR = REPO_ROOT / "data"
+OUT_DIR = REPO_ROOT / "out"
+
+ROUTES_HEADER = ["airline", "airline ID", "source airport", "source airport id", "destination apirport",
+				 "destination airport id", "codeshare", "stops", "equipment", "weight"]
+
+
+# === Geradores sintéticos ===
+
+def gerar_grid(n: int, seed: int = 42) -> tuple[list[tuple[str, str]], list[tuple[str, str, float]]]:
+	"""Grade ~sqrt(n) x sqrt(n): nós 'B<i>_<j>' agrupados em microrregiões de blocos 5x5."""
+	rng = random.Random(seed)
+	lado = max(2, math.isqrt(n))
+	nos = [(f"B{i}_{j}", f"{i // 5}.{j // 5}") for i in range(lado) for j in range(lado)]
+	arestas = []
+	for i in range(lado):
+		for j in range(lado):
+			if j + 1 < lado:
+				arestas.append((f"B{i}_{j}", f"B{i}_{j + 1}", float(rng.randint(1, 5))))
+			if i + 1 < lado:
+				arestas.append((f"B{i}_{j}", f"B{i + 1}_{j}", float(rng.randint(1, 5))))
+	return nos, arestas
+
+
+def gerar_scale_free(n: int, m: int = 3, seed: int = 42) -> list[tuple[str, str, float]]:
+	"""Barabási-Albert: cada novo nó liga-se a 'm' nós escolhidos proporcionalmente ao grau.
+
+	Como nas rotas reais, a maioria das ligações existe nos dois sentidos (ida e volta).
+	"""
+	rng = random.Random(seed)
+	arestas: list[tuple[str, str, float]] = []
+	alvos_por_grau: list[int] = list(range(m))  # lista com repetição: sorteio proporcional ao grau
+	for novo in range(m, n):
+		escolhidos: set[int] = set()
+		while len(escolhidos) < m:
+			escolhidos.add(rng.choice(alvos_por_grau))
+		for alvo in escolhidos:
+			u, v = f"N{novo}", f"N{alvo}"
+			arestas.append((u, v, 1.0))
+			if rng.random() < 0.9:
+				arestas.append((v, u, 1.0))
+			alvos_por_grau.extend((novo, alvo))
+	return arestas
+
+
+def escrever_routes_csv(arestas: list[tuple[str, str, float]], destino: Path):
+	with open(destino, "w", encoding="utf-8", newline="") as f:
+		w = csv.writer(f)
+		w.writerow(ROUTES_HEADER)
+		for u, v, peso in arestas:
+			w.writerow(["XX", "0", u, "0", v, "0", "", "0", "XXX", peso])
+
+
+def escrever_bairros_csvs(nos: list[tuple[str, str]], arestas: list[tuple[str, str, float]], pasta: Path) -> tuple[Path, Path]:
+	nodes_file = pasta / "nos.csv"
+	edges_file = pasta / "arestas.csv"
+	with open(nodes_file, "w", encoding="utf-8") as f:
+		for nome, micro in nos:
+			f.write(f"{nome} {micro}\n")
+	with open(edges_file, "w", encoding="utf-8", newline="") as f:
+		w = csv.writer(f)
+		w.writerow(["bairro_origem", "bairro_destino", "logradouro", "observacao", "peso"])
+		for u, v, peso in arestas:
+			w.writerow([u, v, "rua", "", peso])
+	return nodes_file, edges_file
+
+
+# === Tarefas ===
+
+def _carregar_routes(path: Path, directed: bool) -> Graph:
+	g = Graph(directed=directed, weighted=True)
+	g.load_routes_csv(path)
+	return g
+
+
+def _carregar_bairros(nodes_file: Path, edges_file: Path) -> Graph:
+	g = Graph(directed=False, weighted=True)
+	g.load_from_csvs(nodes_file=nodes_file, edges_file=edges_file)
+	return g
+
+
+def _par_distante(g: Graph) -> tuple[str, str]:
+	"""Origem = primeiro nó; destino = último nó alcançado pela BFS (caminho longo, determinístico)."""
+	origem = next(iter(g.nodes_data))
+	return origem, bfs(g, origem)["order"][-1]
+
+
+def tarefas_de_busca(g: Graph, bf_max_nodes: int) -> Dict[str, Callable[[], Any]]:
+	"""Tarefas de consulta sobre um grafo já carregado (nome -> função sem argumentos)."""
+	origem, destino = _par_distante(g)
+	tarefas: Dict[str, Callable[[], Any]] = {
+		"bfs": lambda: bfs(g, origem),
+		"dfs": lambda: dfs(g, origem),
+		"dijkstra": lambda: dijkstra(g, origem, destino),
+	}
+	if g.num_vertices <= bf_max_nodes:
+		tarefas["bellman-ford"] = lambda: bellman_ford(g, origem)
+	return tarefas
+
+
+def _contadores(g: Graph, nome: str) -> Dict[str, int]:
+	"""Uma execução extra instrumentada, fora da cronometragem."""
+	origem, destino = _par_distante(g)
+	stats: Dict[str, int] = {}
+	if nome == "bfs":
+		bfs(g, origem, stats=stats)
+	elif nome == "dfs":
+		dfs(g, origem, stats=stats)
+	elif nome == "dijkstra":
+		dijkstra(g, origem, destino, stats=stats)
+	elif nome == "bellman-ford":
+		bellman_ford(g, origem, stats=stats)
+	return stats
+
+
+def _git_commit() -> str | None:
+	try:
+		return subprocess.run(["git", "rev-parse", "--short", "HEAD"], cwd=REPO_ROOT,
+							  capture_output=True, text=True, check=True).stdout.strip()
+	except Exception:
+		return None
+
+
+def executar(args: argparse.Namespace) -> Dict[str, Any]:
+	resultados: List[Dict[str, Any]] = []
+
+	def _registrar(workload: str, shape: str, g: Graph | None, tarefa: str, fn: Callable[[], Any]):
+		resumo = medir(fn, repeticoes=args.repeat, aquecimento=args.warmup, memoria=args.memory)
+		linha: Dict[str, Any] = {
+			"workload": workload,
+			"shape": shape,
+			"task": tarefa,
+			"nodes": g.num_vertices if g is not None else None,
+			"edges": g.num_edges if g is not None else None,
+			**resumo,
+		}
+		if g is not None and not tarefa.startswith("load"):
+			linha["counters"] = _contadores(g, tarefa)
+		resultados.append(linha)
+		print(f"  {workload:<22} {tarefa:<18} p50={resumo['p50_ms']:>10.3f} ms  p95={resumo['p95_ms']:>10.3f} ms")
+
+	with tempfile.TemporaryDirectory() as tmp:
+		pasta = Path(tmp)
+		for n in args.sizes:
+			if "grid" in args.shapes:
+				nos, arestas = gerar_grid(n, seed=args.seed)
+				nodes_file, edges_file = escrever_bairros_csvs(nos, arestas, pasta)
+				g = _carregar_bairros(nodes_file, edges_file)
+				nome = f"grid-{n}"
+				_registrar(nome, "grid", g, "load_from_csvs", lambda: _carregar_bairros(nodes_file, edges_file))
+				for tarefa, fn in tarefas_de_busca(g, args.bf_max_nodes).items():
+					_registrar(nome, "grid", g, tarefa, fn)
+			if "scale-free" in args.shapes:
+				arestas = gerar_scale_free(n, seed=args.seed)
+				routes_file = pasta / f"routes_{n}.csv"
+				escrever_routes_csv(arestas, routes_file)
+				g = _carregar_routes(routes_file, args.directed)
+				nome = f"scale-free-{n}"
+				_registrar(nome, "scale-free", g, "load_routes_csv", lambda: _carregar_routes(routes_file, args.directed))
+				for tarefa, fn in tarefas_de_busca(g, args.bf_max_nodes).items():
+					_registrar(nome, "scale-free", g, tarefa, fn)
+
+	# Carga fixa: dataset real da Parte 2
+	routes_real = DATA_DIR / "routes.csv"
+	if routes_real.exists():
+		g = _carregar_routes(routes_real, args.directed)
+		_registrar("routes.csv", "real", g, "load_routes_csv", lambda: _carregar_routes(routes_real, args.directed))
+		for tarefa, fn in tarefas_de_busca(g, args.bf_max_nodes).items():
+			_registrar("routes.csv", "real", g, tarefa, fn)
+
+	return {
+		"meta": {
+			"commit": _git_commit(),
+			"timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+			"python": platform.python_version(),
+			"platform": platform.platform(),
+			"seed": args.seed,
+			"sizes": args.sizes,
+			"shapes": args.shapes,
+			"repeat": args.repeat,
+			"warmup": args.warmup,
+			"directed": args.directed,
+		},
+		"results": resultados,
+	}
+
+
+def comparar(atual: Dict[str, Any], base_path: Path, tolerancia: float = 0.10):
+	"""Imprime a razão p50 atual/base para cada (workload, task) presente nos dois arquivos."""
+	with open(base_path, "r", encoding="utf-8") as f:
+		base = json.load(f)
+	idx = {(r["workload"], r["task"]): r for r in base.get("results", [])}
+	print(f"\nComparação com {base_path} (commit {base.get('meta', {}).get('commit')}):")
+	for r in atual["results"]:
+		anterior = idx.get((r["workload"], r["task"]))
+		if not anterior or not anterior.get("p50_ms"):
+			continue
+		razao = r["p50_ms"] / anterior["p50_ms"]
+		marca = " <-- regressão" if razao > 1.0 + tolerancia else ""
+		print(f"  {r['workload']:<22} {r['task']:<18} {anterior['p50_ms']:>10.3f} -> {r['p50_ms']:>10.3f} ms  ({razao:.2f}x){marca}")
+
+
+def build_parser() -> argparse.ArgumentParser:
+	parser = argparse.ArgumentParser(description="Benchmarks dos algoritmos e carregadores de grafos")
+	parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 5000], help="Números de nós dos grafos sintéticos")
+	parser.add_argument("--shapes", nargs="+", default=["grid", "scale-free"], choices=["grid", "scale-free"], help="Formatos sintéticos")
+	parser.add_argument("--repeat", type=int, default=5, help="Repetições cronometradas por tarefa")
+	parser.add_argument("--warmup", type=int, default=1, help="Execuções de aquecimento descartadas")
+	parser.add_argument("--seed", type=int, default=42, help="Semente dos geradores (reprodutibilidade)")
+	parser.add_argument("--directed", action="store_true", help="Carrega os grafos de rotas como dirigidos")
+	parser.add_argument("--memory", action="store_true", help="Mede também o pico de memória (tracemalloc)")
+	parser.add_argument("--bf-max-nodes", type=int, default=5000, help="Pula Bellman-Ford em grafos maiores que isso")
+	parser.add_argument("--json", type=Path, default=None, help="Arquivo de saída (padrão: out/bench_<commit>.json)")
+	parser.add_argument("--compare", type=Path, default=None, help="JSON de uma execução anterior para comparar")
+	parser.add_argument("--tolerance", type=float, default=0.10, help="Fração de piora no p50 marcada como regressão")
+	return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+	args = build_parser().parse_args(argv)
+	print("Executando benchmarks...")
+	resultado = executar(args)
+	out_path = args.json or (OUT_DIR / f"bench_{resultado['meta']['commit'] or 'local'}.json")
+	out_path.parent.mkdir(parents=True, exist_ok=True)
+	with open(out_path, "w", encoding="utf-8") as f:
+		json.dump(resultado, f, ensure_ascii=False, indent=2)
+	print(f"Resultados salvos em: {out_path}")
+	if args.compare:
+		comparar(resultado, args.compare, args.tolerance)
+	return 0
+
+
+if __name__ == "__main__":
+	raise SystemExit(main())
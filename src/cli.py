@@ -11,8 +11,15 @@ Se nenhuma flag for fornecida, assume grafo de bairros padrão.
 Algoritmos:
 	bfs            Busca em largura a partir de um nó
 	dfs            Busca em profundidade
-	dijkstra       Caminho mínimo entre dois nós (não suporta pesos negativos)
+	dijkstra       Caminho mínimo entre dois nós (não suporta pesos negativos; --k N lista N alternativas)
 	bellman-ford   Distâncias + detecção de ciclo negativo
+	serve          Servidor HTTP/socket Unix que mantém o grafo em memória entre consultas
+	apply-deltas   Aplica um log de mudanças de rotas (add/remove/reweight) e grava um snapshot
+	triangles      Triângulos e coeficientes de agrupamento (exato ou por amostragem com --approx)
+	betweenness    Centralidade de intermediação (Brandes), com processos e amostragem opcionais
+	closeness      Proximidade e centralidade harmônica (todos os nós em CSV, ou só o top-k com --top)
+	pagerank       PageRank (ou centralidade de autovetor com --eigenvector) por iteração de potência
+	mst            Árvore/floresta geradora mínima (Kruskal ou Prim com --algorithm prim)
 
 Direcionalidade:
 	Use --directed para tratar o grafo como dirigido (necessário para cenários com pesos negativos sem gerar ciclos artificiais em arestas duplicadas).
@@ -30,26 +37,46 @@ Flags úteis:
 	--adjacencias_bairros <csv>   Usa grafo de bairros (nós em data/bairros_unique.csv)
 	--json <arquivo>              Salva saída em JSON
 	--verbose                     Mostra saída completa (ordem de visita completa)
+	--fuzzy                       Bairros: aceita prefixo/nome aproximado (ex.: "boa vis")
+	--path-cache <arquivo>        Persiste o cache de caminhos (Dijkstra) entre execuções
+	--cache-size N / --cache-ttl S  Limite de entradas e validade (segundos) do cache de caminhos
+	--tree-cache-mb M             Orçamento (MB) das árvores por origem nos lotes de Dijkstra (0 desliga)
+	--airline A,B / --max-stops N Rotas: Dijkstra/BFS/DFS só por rotas dessas companhias / com até N escalas
+	--log-level <nível>           Nível de log (DEBUG, INFO, WARNING, ERROR). Padrão: INFO
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import logging
 from pathlib import Path
 import time
 import re
-import unicodedata
 from typing import Any, Dict
 
 # Imports locais
 try:
 	from graphs.graph import Graph
-	from graphs.algorithms import dijkstra, bfs, dfs, bellman_ford
+	from graphs.algorithms import dijkstra, bfs, dfs, bellman_ford, k_shortest_paths, kruskal, prim
+	from graphs.perf import medir, pico_memoria_kb, resumir_amostras
+	from graphs.cache import PathCache, TreeCache
+	from graphs.deltas import iter_deltas, load_snapshot, write_snapshot
+	from graphs.metrics import triangle_summary, approx_triangle_summary
+	from graphs.masks import EdgeMask, compile_mask
+	from graphs.centrality import (betweenness_centrality, closeness_centrality, eigenvector_centrality,
+								   export_centrality_csv, pagerank, ranking, top_k_closeness)
 except ImportError:
 	# Permite rodar também como script direto de src/ (sem pacote)
 	from src.graphs.graph import Graph  # type: ignore
-	from src.graphs.algorithms import dijkstra, bfs, dfs, bellman_ford  # type: ignore
+	from src.graphs.algorithms import dijkstra, bfs, dfs, bellman_ford, k_shortest_paths, kruskal, prim  # type: ignore
+	from src.graphs.perf import medir, pico_memoria_kb, resumir_amostras  # type: ignore
+	from src.graphs.cache import PathCache, TreeCache  # type: ignore
+	from src.graphs.deltas import iter_deltas, load_snapshot, write_snapshot  # type: ignore
+	from src.graphs.metrics import triangle_summary, approx_triangle_summary  # type: ignore
+	from src.graphs.masks import EdgeMask, compile_mask  # type: ignore
+	from src.graphs.centrality import (betweenness_centrality, closeness_centrality, eigenvector_centrality,  # type: ignore
+									   export_centrality_csv, pagerank, ranking, top_k_closeness)
 
 
 # Caminhos padrão (relativos ao repo)
@@ -57,15 +84,10 @@ REPO_ROOT = Path(__file__).resolve().parents[1]
 DATA_DIR = REPO_ROOT / "data"
 OUT_DIR = REPO_ROOT / "out"
 
+logger = logging.getLogger("recife-graph")
 
-def _normalize_key(name: str) -> str:
-	name = (name or "").strip()
-	name = re.sub(r"\s+", " ", name)
-	name = "".join(c for c in unicodedata.normalize("NFD", name) if unicodedata.category(c) != "Mn")
-	return name.lower()
 
-
-def _get_nome_canonico(nome_bairro_raw: str, graph: Graph) -> str:
+def _get_nome_canonico(nome_bairro_raw: str, graph: Graph, fuzzy: bool = False) -> str:
 	"""
 	Mapeia um nome de bairro informado no CLI para o nome canônico no grafo,
 	lidando com acentuação e a regra especial de Setúbal/Boa Viagem.
@@ -76,15 +98,8 @@ def _get_nome_canonico(nome_bairro_raw: str, graph: Graph) -> str:
 		if "Boa Viagem" in graph.nodes_data:
 			return "Boa Viagem"
 
-	# Cria (ou reusa) mapa canônico normalizado -> original
-	if not hasattr(graph, "_canon_map_cli"):
-		try:
-			graph._canon_map_cli = {_normalize_key(n): n for n in graph.nodes_data.keys()}  # type: ignore[attr-defined]
-		except Exception:
-			graph._canon_map_cli = {}  # type: ignore[attr-defined]
-
-	nome_normalizado = _normalize_key(nome_bairro_raw)
-	return getattr(graph, "_canon_map_cli", {}).get(nome_normalizado, nome_bairro_raw.strip())
+	# Resolvedor único do grafo (mapa normalizado em cache + trie para prefixos)
+	return graph.resolve_name(nome_bairro_raw, fuzzy=fuzzy) or nome_bairro_raw.strip()
 
 
 def carregar_grafo(nodes_path: Path | None, edges_path: Path | None, directed: bool = False, weighted: bool = True) -> Graph:
@@ -108,6 +123,14 @@ def _slug(*parts: str) -> str:
 	return txt or "out"
 
 
+def _inteiro_positivo(txt: str) -> int:
+	"""Tipo do argparse para contagens que precisam ser >= 1."""
+	valor = int(txt)
+	if valor < 1:
+		raise argparse.ArgumentTypeError(f"deve ser pelo menos 1 (recebido: {valor})")
+	return valor
+
+
 def _default_json_path(command: str, *name_parts: str) -> Path:
 	OUT_DIR.mkdir(parents=True, exist_ok=True)
 	return OUT_DIR / f"{command}_{_slug(*name_parts)}.json"
@@ -138,26 +161,135 @@ def _build_graph(args: argparse.Namespace, weighted: bool, directed: bool = Fals
 	g.load_from_csvs(nodes_file=nodes_file, edges_file=edges_file)
 	return g, False
 
-def _resolve_nome(raw: str, g: Graph, is_routes: bool) -> str:
+def _graph_key(args: argparse.Namespace) -> str:
+	"""Identifica os dados de origem do grafo (arquivo, tamanho, mtime, flags) para o cache persistido."""
+	routes_path: Path | None = getattr(args, "routes", None)
+	if routes_path:
+		arquivos = [routes_path]
+	else:
+		arquivos = [DATA_DIR / "bairros_unique.csv", getattr(args, "adjacencias_bairros", None) or (DATA_DIR / "adjacencias_bairros.csv")]
+	partes = []
+	for a in arquivos:
+		st = Path(a).stat()
+		partes.append(f"{Path(a).resolve()}:{st.st_size}:{int(st.st_mtime)}")
+	partes.append(f"directed={bool(getattr(args, 'directed', False))}")
+	return "|".join(partes)
+
+
+def _abrir_cache(args: argparse.Namespace, g: Graph, arvores: bool = False) -> PathCache:
+	"""Cache LRU de caminhos do Dijkstra; recarrega do disco se --path-cache foi informado.
+
+	arvores=True (lotes de pares) liga também o cache de árvores por origem: vários destinos
+	da mesma origem saem de uma única busca completa.
+	"""
+	trees = TreeCache(g, max_bytes=int(args.tree_cache_mb * 1024 * 1024)) if arvores and args.tree_cache_mb > 0 else None
+	cache = PathCache(g, max_entries=args.cache_size, ttl=args.cache_ttl, trees=trees)
+	if args.path_cache:
+		n = cache.load(Path(args.path_cache), _graph_key(args))
+		logger.info("[cache] %d caminhos reaproveitados de %s", n, args.path_cache)
+	return cache
+
+
+def _fechar_cache(args: argparse.Namespace, cache: PathCache):
+	logger.info("[cache] %s", cache.summary())
+	if cache.trees is not None:
+		logger.info("[cache] árvores: %s", cache.trees.summary())
+	if args.path_cache:
+		cache.save(Path(args.path_cache), _graph_key(args))
+	if cache.trees is not None:
+		cache.trees.close()  # tira o listener do grafo: o cache não sobrevive ao comando
+
+
+def _mascara(args: argparse.Namespace, g: Graph) -> EdgeMask | None:
+	"""Máscara de arestas dos filtros --airline/--max-stops (None se nenhum filtro foi pedido)."""
+	cias = [c for a in (getattr(args, "airline", None) or []) for c in a.split(",") if c.strip()] or None
+	mascara = compile_mask(g, airlines=cias, max_stops=getattr(args, "max_stops", None))
+	if mascara is not None:
+		logger.info("[filtro] %d de %d entradas de adjacência permitidas", mascara.allowed, len(mascara))
+	return mascara
+
+
+def _resolve_nome(raw: str, g: Graph, is_routes: bool, fuzzy: bool = False) -> str:
 	"""Resolve nome canônico apenas para bairros; em rotas retorna cru."""
-	return raw if is_routes else _get_nome_canonico(raw, g)
+	return raw if is_routes else _get_nome_canonico(raw, g, fuzzy=fuzzy)
+
+def _log_resumo_pares(nome: str, results: list[dict[str, Any]], elapsed_s: float) -> None:
+	"""Resumo único por execução em lote (saída constante, independente do número de pares)."""
+	erros = sum(1 for r in results if "error" in r)
+	sem_caminho = sum(1 for r in results if "error" not in r and not r.get("path"))
+	logger.info(
+		"[%s] resumo: %d pares, %d sem caminho, %d com erro, %.1f ms",
+		nome, len(results), sem_caminho, erros, elapsed_s * 1000.0,
+	)
+
+
+def _k_caminhos(g: Graph, origem: str, destino: str, k: int, edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
+	"""{"cost", "path"} do melhor caminho + "paths" com as k alternativas (Yen)."""
+	caminhos = k_shortest_paths(g, origem, destino, k, edge_mask=edge_mask)
+	melhor = caminhos[0] if caminhos else {"cost": float('inf'), "path": []}
+	return {**melhor, "paths": caminhos}
+
+
+def _executar_pares(cache: PathCache, pares: list[tuple[str, str]], edge_mask: EdgeMask | None = None,
+					k: int = 1) -> list[dict[str, Any]]:
+	"""Resolve os pares agrupados por origem (a busca de cada origem é retomada, não refeita).
+
+	O resultado mantém a ordem de entrada; erros por par não abortam os demais.
+	Com edge_mask (filtros de rota) os caches são ignorados: eles guardam caminhos sem filtro.
+	Com k > 1 cada par também traz "paths" (k caminhos alternativos, sem cache).
+	"""
+	results: list[dict[str, Any]] = [{} for _ in pares]
+	for i in sorted(range(len(pares)), key=lambda i: pares[i][0]):
+		origem, destino = pares[i]
+		try:
+			if k > 1:
+				res = _k_caminhos(cache.graph, origem, destino, k, edge_mask)
+			elif edge_mask is None:
+				res = cache.dijkstra(origem, destino)
+			else:
+				res = dijkstra(cache.graph, origem, destino, edge_mask=edge_mask)
+			results[i] = {"from": origem, "to": destino, **res}
+		except Exception as e:
+			results[i] = {"from": origem, "to": destino, "error": str(e)}
+	return results
+
+
+def payload_dijkstra(g: Graph, origem: str, destino: str, cache: PathCache | None = None,
+					 edge_mask: EdgeMask | None = None, k: int = 1) -> Dict[str, Any]:
+	"""Payload JSON do Dijkstra (o mesmo gravado pelo CLI e devolvido pelo servidor).
+
+	Com k > 1 acrescenta "k" e "paths" (os k caminhos mínimos sem ciclos, algoritmo de Yen).
+	"""
+	if k > 1:
+		return {"algorithm": "dijkstra", "from": origem, "to": destino, "k": k, **_k_caminhos(g, origem, destino, k, edge_mask)}
+	if edge_mask is not None:
+		res = dijkstra(g, origem, destino, edge_mask=edge_mask)
+	else:
+		res = cache.dijkstra(origem, destino) if cache is not None else dijkstra(g, origem, destino)
+	return {"algorithm": "dijkstra", "from": origem, "to": destino, **res}
+
 
 def cmd_dijkstra(args: argparse.Namespace) -> int:
 	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
-	origem = _resolve_nome(args.start, g, is_routes)
-	destino = _resolve_nome(args.end, g, is_routes)
+	origem = _resolve_nome(args.start, g, is_routes, args.fuzzy)
+	destino = _resolve_nome(args.end, g, is_routes, args.fuzzy)
+	mascara = _mascara(args, g)
+	cache = _abrir_cache(args, g)
 	try:
-		res = dijkstra(g, origem, destino)
+		payload = payload_dijkstra(g, origem, destino, cache, edge_mask=mascara, k=args.k)
 	except Exception as e:
 		print(f"[ERRO] {e}")
 		return 2
-	caminho = " -> ".join(res.get("path", []))
-	print(f"Custo: {res.get('cost')}")
+	_fechar_cache(args, cache)
+	caminho = " -> ".join(payload.get("path", []))
+	print(f"Custo: {payload.get('cost')}")
 	print(f"Caminho: {caminho}")
+	for pos, alt in enumerate(payload.get("paths", [])[1:], start=2):
+		print(f"  {pos}. custo {alt['cost']}: {' -> '.join(alt['path'])}")
 	out_path = Path(args.json) if args.json else _default_json_path("dijkstra", origem, destino)
 	out_path.parent.mkdir(parents=True, exist_ok=True)
 	with open(out_path, "w", encoding="utf-8") as f:
-		json.dump({"algorithm": "dijkstra", "from": origem, "to": destino, **res}, f, ensure_ascii=False, indent=2)
+		json.dump(payload, f, ensure_ascii=False, indent=2)
 	print(f"Resultado salvo em: {out_path}")
 	return 0
 
@@ -178,17 +310,16 @@ def cmd_dijkstra_batch(args: argparse.Namespace) -> int:
 	if len(pairs) < 2 or len(pairs) % 2 != 0:
 		print("[ERRO] Forneça uma lista de argumentos com comprimento par: ORIGEM1 DESTINO1 ORIGEM2 DESTINO2 ...")
 		return 2
-	results: list[dict[str, Any]] = []
-	for i in range(0, len(pairs), 2):
-		orig_raw, dest_raw = pairs[i], pairs[i+1]
-		origem = _resolve_nome(orig_raw, g, is_routes)
-		destino = _resolve_nome(dest_raw, g, is_routes)
-		try:
-			res = dijkstra(g, origem, destino)
-			results.append({"from": origem, "to": destino, **res})
-		except Exception as e:
-			results.append({"from": origem, "to": destino, "error": str(e)})
+	cache = _abrir_cache(args, g, arvores=True)
+	inicio = time.perf_counter()
+	resolvidos = [
+		(_resolve_nome(pairs[i], g, is_routes, args.fuzzy), _resolve_nome(pairs[i+1], g, is_routes, args.fuzzy))
+		for i in range(0, len(pairs), 2)
+	]
+	results = _executar_pares(cache, resolvidos, edge_mask=_mascara(args, g), k=args.k)
 	print(f"[dijkstra-batch] Pares processados: {len(results)}")
+	_log_resumo_pares("dijkstra-batch", results, time.perf_counter() - inicio)
+	_fechar_cache(args, cache)
 	# Estatística simples: quantos tiveram erro
 	erros = sum(1 for r in results if "error" in r)
 	if erros:
@@ -210,15 +341,53 @@ def cmd_dijkstra_batch(args: argparse.Namespace) -> int:
 	return 0
 
 
+def _extra_bfs_rotas(g: Graph, origem: str, edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
+	"""Metadados extras para modo rotas: camadas e ciclos (detecção simples em grafo não dirigido)."""
+	from collections import deque
+	visited = {origem}
+	parent: Dict[str, str | None] = {origem: None}
+	level: Dict[str, int] = {origem: 0}
+	layers: Dict[int, list[str]] = {0: [origem]}
+	has_cycle = False
+	q = deque([origem])
+	while q:
+		u = q.popleft()
+		for edge in (edge_mask.edges(u) if edge_mask is not None else g.adj.get(u, [])):
+			v = edge["node"]
+			if v not in visited:
+				visited.add(v)
+				parent[v] = u
+				lvl = level[u] + 1
+				level[v] = lvl
+				layers.setdefault(lvl, []).append(v)
+				q.append(v)
+			elif parent[u] != v:  # aresta para nó já visitado que não é o pai => ciclo
+				has_cycle = True
+	# Constrói estrutura serializável
+	layers_serial = [layers[k] for k in sorted(layers.keys())]
+	return {
+		"layers": layers_serial,
+		"level_map": level,
+		"has_cycle": has_cycle
+	}
+
+
+def payload_bfs(g: Graph, origem: str, is_routes: bool, edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
+	"""Payload JSON da BFS (o mesmo gravado pelo CLI e devolvido pelo servidor)."""
+	res = bfs(g, origem, edge_mask=edge_mask)
+	extra = _extra_bfs_rotas(g, origem, edge_mask) if is_routes else {}
+	return {"algorithm": "bfs", "from": origem, **res, **extra}
+
+
 def cmd_bfs(args: argparse.Namespace) -> int:
 	g, is_routes = _build_graph(args, weighted=False, directed=getattr(args, "directed", False))
-	origem = _resolve_nome(args.start, g, is_routes)
+	origem = _resolve_nome(args.start, g, is_routes, args.fuzzy)
 	try:
-		res = bfs(g, origem)
+		payload = payload_bfs(g, origem, is_routes, edge_mask=_mascara(args, g))
 	except Exception as e:
 		print(f"[ERRO] {e}")
 		return 2
-	order = res.get("order", [])
+	order = payload.get("order", [])
 	print(f"Visitados: {len(order)} nós")
 	if args.verbose:
 		print(f"Ordem: {order}")
@@ -226,54 +395,63 @@ def cmd_bfs(args: argparse.Namespace) -> int:
 		preview = order[:10]
 		suffix = " …" if len(order) > 10 else ""
 		print(f"Ordem (preview): {preview}{suffix}")
-
-	# Metadados extras para modo rotas: camadas e ciclos (detecção simples em grafo não dirigido)
-	extra: Dict[str, Any] = {}
-	if is_routes:
-		from collections import deque
-		visited = {origem}
-		parent: Dict[str, str | None] = {origem: None}
-		level: Dict[str, int] = {origem: 0}
-		layers: Dict[int, list[str]] = {0: [origem]}
-		has_cycle = False
-		q = deque([origem])
-		while q:
-			u = q.popleft()
-			for edge in g.adj.get(u, []):
-				v = edge["node"]
-				if v not in visited:
-					visited.add(v)
-					parent[v] = u
-					lvl = level[u] + 1
-					level[v] = lvl
-					layers.setdefault(lvl, []).append(v)
-					q.append(v)
-				elif parent[u] != v:  # aresta para nó já visitado que não é o pai => ciclo
-					has_cycle = True
-		# Constrói estrutura serializável
-		layers_serial = [layers[k] for k in sorted(layers.keys())]
-		extra = {
-			"layers": layers_serial,
-			"level_map": level,
-			"has_cycle": has_cycle
-		}
 	out_path = Path(args.json) if args.json else _default_json_path("bfs", origem)
 	out_path.parent.mkdir(parents=True, exist_ok=True)
 	with open(out_path, "w", encoding="utf-8") as f:
-		json.dump({"algorithm": "bfs", "from": origem, **res, **extra}, f, ensure_ascii=False, indent=2)
+		json.dump(payload, f, ensure_ascii=False, indent=2)
 	print(f"Resultado salvo em: {out_path}")
 	return 0
 
 
+def _extra_dfs_rotas(g: Graph, origem: str, edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
+	"""Metadados extras para modo rotas: profundidades e ciclo (detecção via DFS)."""
+	visited: set[str] = set()
+	parent: Dict[str, str | None] = {origem: None}
+	depth: Dict[str, int] = {origem: 0}
+	has_cycle = False
+	order_dfs: list[str] = []
+
+	def _dfs(u: str):
+		visited.add(u)
+		order_dfs.append(u)
+		for edge in (edge_mask.edges(u) if edge_mask is not None else g.adj.get(u, [])):
+			v = edge["node"]
+			if v not in visited:
+				parent[v] = u
+				depth[v] = depth[u] + 1
+				_dfs(v)
+			elif parent[u] != v:  # ciclo em grafo não dirigido
+				has_cycle = True
+
+	_dfs(origem)
+	layers: Dict[int, list[str]] = {}
+	for n, d in depth.items():
+		layers.setdefault(d, []).append(n)
+	layers_serial = [layers[k] for k in sorted(layers.keys())]
+	return {
+		"layers": layers_serial,
+		"depth_map": depth,
+		"has_cycle": has_cycle,
+		"dfs_order_recomputed": order_dfs
+	}
+
+
+def payload_dfs(g: Graph, origem: str, is_routes: bool, edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
+	"""Payload JSON da DFS (o mesmo gravado pelo CLI e devolvido pelo servidor)."""
+	res = dfs(g, origem, edge_mask=edge_mask)
+	extra = _extra_dfs_rotas(g, origem, edge_mask) if is_routes else {}
+	return {"algorithm": "dfs", "from": origem, **res, **extra}
+
+
 def cmd_dfs(args: argparse.Namespace) -> int:
 	g, is_routes = _build_graph(args, weighted=False, directed=getattr(args, "directed", False))
-	origem = _resolve_nome(args.start, g, is_routes)
+	origem = _resolve_nome(args.start, g, is_routes, args.fuzzy)
 	try:
-		res = dfs(g, origem)
+		payload = payload_dfs(g, origem, is_routes, edge_mask=_mascara(args, g))
 	except Exception as e:
 		print(f"[ERRO] {e}")
 		return 2
-	order = res.get("order", [])
+	order = payload.get("order", [])
 	print(f"Visitados: {len(order)} nós")
 	if args.verbose:
 		print(f"Ordem: {order}")
@@ -281,52 +459,25 @@ def cmd_dfs(args: argparse.Namespace) -> int:
 		preview = order[:10]
 		suffix = " …" if len(order) > 10 else ""
 		print(f"Ordem (preview): {preview}{suffix}")
-
-	# Metadados extras para modo rotas: profundidades e ciclo (detecção via DFS)
-	extra: Dict[str, Any] = {}
-	if is_routes:
-		visited: set[str] = set()
-		parent: Dict[str, str | None] = {origem: None}
-		depth: Dict[str, int] = {origem: 0}
-		has_cycle = False
-		order_dfs: list[str] = []
-
-		def _dfs(u: str):
-			visited.add(u)
-			order_dfs.append(u)
-			for edge in g.adj.get(u, []):
-				v = edge["node"]
-				if v not in visited:
-					parent[v] = u
-					depth[v] = depth[u] + 1
-					_dfs(v)
-				elif parent[u] != v:  # ciclo em grafo não dirigido
-					has_cycle = True
-
-		_dfs(origem)
-		layers: Dict[int, list[str]] = {}
-		for n, d in depth.items():
-			layers.setdefault(d, []).append(n)
-		layers_serial = [layers[k] for k in sorted(layers.keys())]
-		extra = {
-			"layers": layers_serial,
-			"depth_map": depth,
-			"has_cycle": has_cycle,
-			"dfs_order_recomputed": order_dfs
-		}
 	out_path = Path(args.json) if args.json else _default_json_path("dfs", origem)
 	out_path.parent.mkdir(parents=True, exist_ok=True)
 	with open(out_path, "w", encoding="utf-8") as f:
-		json.dump({"algorithm": "dfs", "from": origem, **res, **extra}, f, ensure_ascii=False, indent=2)
+		json.dump(payload, f, ensure_ascii=False, indent=2)
 	print(f"Resultado salvo em: {out_path}")
 	return 0
 
 
+def payload_bellman_ford(g: Graph, origem: str) -> Dict[str, Any]:
+	"""Payload JSON do Bellman-Ford (o mesmo gravado pelo CLI e devolvido pelo servidor)."""
+	res = bellman_ford(g, origem)
+	return {"algorithm": "bellman-ford", "from": origem, **res}
+
+
 def cmd_bellman_ford(args: argparse.Namespace) -> int:
 	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
-	origem = _resolve_nome(args.start, g, is_routes)
+	origem = _resolve_nome(args.start, g, is_routes, args.fuzzy)
 	try:
-		res = bellman_ford(g, origem)
+		res = payload_bellman_ford(g, origem)
 	except Exception as e:
 		print(f"[ERRO] {e}")
 		return 2
@@ -340,7 +491,7 @@ def cmd_bellman_ford(args: argparse.Namespace) -> int:
 	out_path = Path(args.json) if args.json else _default_json_path("bellman_ford", origem)
 	out_path.parent.mkdir(parents=True, exist_ok=True)
 	with open(out_path, "w", encoding="utf-8") as f:
-		json.dump({"algorithm": "bellman-ford", "from": origem, **res}, f, ensure_ascii=False, indent=2)
+		json.dump(res, f, ensure_ascii=False, indent=2)
 	print(f"Resultado salvo em: {out_path}")
 	return 0
 
@@ -359,7 +510,9 @@ def cmd_dijkstra_pairs(args: argparse.Namespace) -> int:
 		print(f"[ERRO] CSV não encontrado: {csv_path}")
 		return 2
 	import csv as _csv
-	results: list[dict[str, Any]] = []
+	resolvidos: list[tuple[str, str]] = []
+	cache = _abrir_cache(args, g, arvores=True)
+	inicio = time.perf_counter()
 	with open(csv_path, 'r', encoding='utf-8') as f:
 		reader = _csv.DictReader(f)
 		if 'source' not in reader.fieldnames or 'destination' not in reader.fieldnames:
@@ -370,14 +523,11 @@ def cmd_dijkstra_pairs(args: argparse.Namespace) -> int:
 			dest_raw = (row.get('destination') or '').strip()
 			if not orig_raw or not dest_raw:
 				continue
-			origem = _resolve_nome(orig_raw, g, is_routes)
-			destino = _resolve_nome(dest_raw, g, is_routes)
-			try:
-				res = dijkstra(g, origem, destino)
-				results.append({"from": origem, "to": destino, **res})
-			except Exception as e:
-				results.append({"from": origem, "to": destino, "error": str(e)})
+			resolvidos.append((_resolve_nome(orig_raw, g, is_routes, args.fuzzy), _resolve_nome(dest_raw, g, is_routes, args.fuzzy)))
+	results = _executar_pares(cache, resolvidos, edge_mask=_mascara(args, g), k=args.k)
 	print(f"[dijkstra-pairs] Total de pares processados: {len(results)}")
+	_log_resumo_pares("dijkstra-pairs", results, time.perf_counter() - inicio)
+	_fechar_cache(args, cache)
 	out_path = Path(args.json) if args.json else _default_json_path("dijkstra_pairs", csv_path.stem)
 	out_path.parent.mkdir(parents=True, exist_ok=True)
 	with open(out_path, 'w', encoding='utf-8') as f:
@@ -387,34 +537,50 @@ def cmd_dijkstra_pairs(args: argparse.Namespace) -> int:
 
 
 def cmd_report(args: argparse.Namespace) -> int:
-	"""Mede tempo por algoritmo/tarefa e salva em JSON agregado.
+	"""Mede tempo e contadores de instrumentação por algoritmo/tarefa e salva em JSON agregado.
 
 	Regras:
 	- Os itens posicionais (items) são tratados como nós de interesse.
 	  * Para BFS/DFS/Bellman-Ford: cada item é usado como origem.
 	  * Para Dijkstra: pares consecutivos (item[i] -> item[i+1]).
 	- Em modo bairros, os nomes são normalizados para o canônico.
+	- Cada tarefa: 1 execução instrumentada (contadores) + --warmup descartadas + --repeat cronometradas,
+	  resumidas em p50/p95/p99, min/max, média e desvio padrão ('duration_ms' = p50).
+	- Tempo de carga do grafo é medido à parte (--load-repeat cargas); --memory adiciona o pico via tracemalloc.
 	- Saída padrão: out/parte2_report.json (ou caminho via --json).
 	"""
-	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
+	directed = getattr(args, "directed", False)
+	load_samples: list[float] = []
+	for _ in range(max(1, args.load_repeat)):
+		start = time.perf_counter()
+		g, is_routes = _build_graph(args, weighted=True, directed=directed)
+		load_samples.append((time.perf_counter() - start) * 1000.0)
+	load_timing = resumir_amostras(load_samples)
+	if args.memory:
+		load_timing["peak_mem_kb"] = round(pico_memoria_kb(lambda: _build_graph(args, weighted=True, directed=directed)), 2)
 	items_raw: list[str] = getattr(args, "items", []) or []
-	items: list[str] = [_resolve_nome(x, g, is_routes) for x in items_raw]
+	items: list[str] = [_resolve_nome(x, g, is_routes, args.fuzzy) for x in items_raw]
 
 	report: Dict[str, Any] = {
 		"algorithm": "report",
 		"graph_kind": "routes" if is_routes else "bairros",
 		"directed": bool(getattr(args, "directed", False)),
 		"node_items": items_raw,
+		"config": {"repeat": args.repeat, "warmup": args.warmup, "load_repeat": args.load_repeat, "memory": bool(args.memory)},
+		"graph": {"nodes": g.num_vertices, "edges": g.num_edges},
+		"load": load_timing,
 		"metrics": []
 	}
 
 	def _time_task(name: str, fn, *fargs):
+		# Execução instrumentada: valida a tarefa e coleta os contadores (fica fora da amostra de tempos)
+		counters: Dict[str, int] = {}
 		start = time.perf_counter()
 		ok = True
 		out: Dict[str, Any] | None = None
 		err: str | None = None
 		try:
-			out = fn(g, *fargs)
+			out = fn(g, *fargs, stats=counters)
 		except Exception as e:
 			ok = False
 			err = str(e)
@@ -423,7 +589,12 @@ def cmd_report(args: argparse.Namespace) -> int:
 			"algorithm": name,
 			"duration_ms": round(elapsed_ms, 3),
 			"ok": ok,
+			"counters": counters,
 		}
+		if ok:
+			timing = medir(lambda: fn(g, *fargs), repeticoes=max(1, args.repeat), aquecimento=args.warmup, memoria=args.memory)
+			entry["duration_ms"] = timing["p50_ms"]
+			entry["timing"] = timing
 		if name in ("bfs", "dfs"):
 			entry["from"] = fargs[0] if fargs else None
 			if ok and out is not None:
@@ -464,8 +635,32 @@ def cmd_report(args: argparse.Namespace) -> int:
 			origem, destino = starts[i], starts[i + 1]
 			_time_task("dijkstra", dijkstra, origem, destino)
 
-	# Resumo simples
-	report["summary"] = {"total_tasks": len(report["metrics"]) }
+	# Cache de caminhos: mesmos pares do Dijkstra, primeiro a frio (misses) e depois a quente (hits)
+	pares = [(starts[i], starts[i + 1]) for i in range(len(starts) - 1)]
+	if pares:
+		cache = _abrir_cache(args, g)
+
+		def _rodar_pares():
+			for o, d in pares:
+				try:
+					cache.dijkstra(o, d)
+				except ValueError:
+					pass
+
+		start = time.perf_counter()
+		_rodar_pares()
+		frio_ms = (time.perf_counter() - start) * 1000.0
+		quente = medir(_rodar_pares, repeticoes=max(1, args.repeat), aquecimento=0)
+		report["path_cache"] = {"cold_ms": round(frio_ms, 4), "warm": quente, **cache.summary()}
+		_fechar_cache(args, cache)
+
+	# Resumo: carga vs consultas (soma das medianas das tarefas)
+	report["summary"] = {
+		"total_tasks": len(report["metrics"]),
+		"failed_tasks": sum(1 for m in report["metrics"] if not m["ok"]),
+		"load_p50_ms": load_timing["p50_ms"],
+		"query_p50_total_ms": round(sum(m["duration_ms"] for m in report["metrics"] if m["ok"]), 4),
+	}
 
 	# Salva
 	out_path = Path(args.json) if args.json else (OUT_DIR / "parte2_report.json")
@@ -474,12 +669,259 @@ def cmd_report(args: argparse.Namespace) -> int:
 		json.dump(report, f, ensure_ascii=False, indent=2)
 	print(f"[report] Métricas salvas em: {out_path}")
 	# Preview enxuto
+	print(f"  - carga do grafo: p50 {load_timing['p50_ms']} ms ({load_timing['n']} amostra(s))")
 	for m in report["metrics"][:5]:
 		al = m.get("algorithm")
 		frm = m.get("from")
 		to = m.get("to")
 		dt = m.get("duration_ms")
-		print(f"  - {al} {frm or ''}{(' -> ' + to) if to else ''}: {dt} ms")
+		p95 = m.get("timing", {}).get("p95_ms")
+		print(f"  - {al} {frm or ''}{(' -> ' + to) if to else ''}: p50 {dt} ms, p95 {p95} ms")
+	return 0
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+	"""Sobe o servidor de consultas (HTTP local ou socket Unix) com o grafo residente em memória.
+
+	Exemplo:
+	  python -m src.cli --routes data/routes.csv serve --port 8765
+	  curl "http://127.0.0.1:8765/dijkstra?start=MEX&end=JFK"
+	"""
+	import asyncio
+	try:
+		from server import QueryServer
+	except ImportError:
+		from src.server import QueryServer  # type: ignore
+	directed = getattr(args, "directed", False)
+	g, is_routes = _build_graph(args, weighted=True, directed=directed)
+	# no modo process cada processo do pool carrega o próprio grafo a partir das mesmas flags
+	build_opts = {"routes": args.routes, "adjacencias_bairros": args.adjacencias_bairros, "directed": directed}
+	srv = QueryServer(g, is_routes, pool=args.pool, workers=args.workers, build_opts=build_opts,
+					  fuzzy=args.fuzzy, max_pending=args.max_pending, cache_size=args.cache_size, cache_ttl=args.cache_ttl,
+					  tree_cache_mb=args.tree_cache_mb)
+	try:
+		asyncio.run(srv.serve(host=args.host, port=args.port, unix_path=args.unix))
+	except KeyboardInterrupt:
+		pass
+	return 0
+
+
+def cmd_apply_deltas(args: argparse.Namespace) -> int:
+	"""Aplica um log de deltas (CSV/JSONL) ao grafo de rotas e grava o snapshot resultante.
+
+	O snapshot (formato de routes.csv + metadado .meta.json) guarda quantas operações do
+	log já contém: na execução seguinte ele é carregado no lugar do --routes e só as
+	operações novas do log são aplicadas.
+
+	Exemplo:
+	  python -m src.cli --routes data/routes.csv apply-deltas out/deltas.csv --snapshot out/routes_snapshot.csv
+	"""
+	directed = getattr(args, "directed", False)
+	snapshot: Path = args.snapshot or (OUT_DIR / "routes_snapshot.csv")
+	if not args.deltas.exists():
+		print(f"[ERRO] Log de deltas não encontrado: {args.deltas}")
+		return 2
+	if snapshot.exists():
+		print(f"[LOAD] Snapshot: {snapshot}")
+		g, ja_aplicados = load_snapshot(snapshot, directed=directed)
+	elif args.routes:
+		g, _ = _build_graph(args, weighted=True, directed=directed)
+		ja_aplicados = 0
+	else:
+		print("[ERRO] Informe --routes (grafo base) ou um --snapshot existente")
+		return 2
+	total = {"applied": 0, "added": 0, "removed": 0, "reweighted": 0, "errors": 0}
+	ultimo = ja_aplicados
+	inicio = time.perf_counter()
+	for lote in g.apply_deltas(iter_deltas(args.deltas, start=ja_aplicados), batch_size=args.batch_size):
+		for k in total:
+			total[k] += lote[k]
+		ultimo = lote["last_seq"] or ultimo
+		logger.info("[deltas] até #%s: %d aplicados, %d erros (versão %d)", lote["last_seq"], lote["applied"], lote["errors"], lote["version"])
+	elapsed_ms = (time.perf_counter() - inicio) * 1000.0
+	arestas = write_snapshot(g, snapshot, deltas_applied=ultimo)
+	resumo = {"deltas_file": str(args.deltas), "snapshot": str(snapshot), "skipped": ja_aplicados,
+			  "deltas_applied": ultimo, "version": g.version, "nodes": g.num_vertices, "edges": arestas,
+			  "elapsed_ms": round(elapsed_ms, 3), **total}
+	print(f"[apply-deltas] {total['applied']} operações aplicadas ({total['errors']} com erro) em {elapsed_ms:.1f} ms")
+	print(f"Snapshot salvo em: {snapshot} ({arestas} arestas, {ultimo} deltas aplicados)")
+	if args.json:
+		out_path = Path(args.json)
+		out_path.parent.mkdir(parents=True, exist_ok=True)
+		with open(out_path, "w", encoding="utf-8") as f:
+			json.dump(resumo, f, ensure_ascii=False, indent=2)
+	return 0
+
+
+def cmd_triangles(args: argparse.Namespace) -> int:
+	"""Conta triângulos e calcula os coeficientes de agrupamento (grafo simples subjacente).
+
+	Exato por padrão; com --approx estima por amostragem de cunhas (--samples, --seed),
+	para grafos em que a contagem exata fica cara.
+	"""
+	g, _ = _build_graph(args, weighted=False, directed=getattr(args, "directed", False))
+	inicio = time.perf_counter()
+	if args.approx:
+		resumo = approx_triangle_summary(g, samples=args.samples, seed=args.seed)
+	else:
+		resumo = triangle_summary(g)
+	elapsed_ms = (time.perf_counter() - inicio) * 1000.0
+	por_no = resumo.pop("per_node", None)
+	local = resumo.pop("local_clustering", None)
+	resumo["elapsed_ms"] = round(elapsed_ms, 3)
+	if por_no is not None:
+		ranking = sorted(por_no, key=lambda n: (-por_no[n], n))[:args.top]
+		resumo["top"] = [{"node": n, "triangles": por_no[n], "clustering": round(local[n], 6)} for n in ranking]
+		if args.verbose:
+			resumo["nodes"] = {n: {"triangles": por_no[n], "clustering": local[n]} for n in por_no}
+	print(f"[triangles] modo={resumo['mode']} triângulos={resumo['triangles']} "
+		  f"transitividade={resumo['transitivity']:.4f} agrupamento médio={resumo['average_clustering']:.4f} "
+		  f"({elapsed_ms:.1f} ms)")
+	for item in resumo.get("top", [])[:10]:
+		print(f"  {item['node']}: {item['triangles']} triângulos (C={item['clustering']:.3f})")
+	out_path = Path(args.json) if args.json else _default_json_path("triangles", resumo["mode"])
+	out_path.parent.mkdir(parents=True, exist_ok=True)
+	with open(out_path, "w", encoding="utf-8") as f:
+		json.dump(resumo, f, ensure_ascii=False, indent=2)
+	print(f"Resultado salvo em: {out_path}")
+	return 0
+
+
+def cmd_betweenness(args: argparse.Namespace) -> int:
+	"""Centralidade de intermediação de todos os nós, gravada como ranking em CSV.
+
+	Exemplo (estimativa com 500 fontes em 4 processos):
+	  python -m src.cli --routes data/routes.csv betweenness --samples 500 --workers 4
+	"""
+	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
+	inicio = time.perf_counter()
+	try:
+		valores = betweenness_centrality(g, weighted=not args.hops, samples=args.samples, seed=args.seed, workers=args.workers)
+	except ValueError as e:
+		print(f"[ERRO] {e}")
+		return 2
+	elapsed_ms = (time.perf_counter() - inicio) * 1000.0
+	modo = "amostrado" if args.samples is not None and args.samples < g.num_vertices else "exato"
+	print(f"[betweenness] {len(valores)} nós, {modo}, {'saltos' if args.hops else 'pesos'} ({elapsed_ms:.1f} ms)")
+	topo = ranking(valores, args.top)
+	for pos, (no, valor) in enumerate(topo, start=1):
+		print(f"  {pos:>3}. {no}: {valor:.6f}")
+	csv_path = args.csv or (OUT_DIR / f"betweenness_{'rotas' if is_routes else 'bairros'}.csv")
+	export_centrality_csv(valores, csv_path, coluna="betweenness")
+	if args.json:
+		out_path = Path(args.json)
+		out_path.parent.mkdir(parents=True, exist_ok=True)
+		with open(out_path, "w", encoding="utf-8") as f:
+			json.dump({"algorithm": "betweenness", "mode": modo, "weighted": not args.hops, "samples": args.samples,
+					   "seed": args.seed, "workers": args.workers, "elapsed_ms": round(elapsed_ms, 3),
+					   "top": [{"node": no, "betweenness": v} for no, v in topo]}, f, ensure_ascii=False, indent=2)
+	return 0
+
+
+def cmd_closeness(args: argparse.Namespace) -> int:
+	"""Proximidade (closeness) e centralidade harmônica.
+
+	Sem --top, calcula todos os nós em lotes e grava cada linha no CSV assim que o lote
+	termina. Com --top K, só descobre os K mais centrais pela --measure escolhida,
+	abandonando cedo as buscas de quem não tem como entrar no ranking.
+
+	Exemplo:
+	  python -m src.cli --routes data/routes.csv closeness --top 20 --hops
+	"""
+	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
+	inicio = time.perf_counter()
+	try:
+		if args.top is not None:
+			topo = top_k_closeness(g, args.top, measure=args.measure, weighted=not args.hops)
+		else:
+			csv_path = args.csv or (OUT_DIR / f"closeness_{'rotas' if is_routes else 'bairros'}.csv")
+			valores = closeness_centrality(g, weighted=not args.hops, workers=args.workers,
+										   batch_size=args.batch_size, saida=csv_path)
+			topo = ranking({no: v[args.measure] for no, v in valores.items()}, 10)
+	except ValueError as e:
+		print(f"[ERRO] {e}")
+		return 2
+	elapsed_ms = (time.perf_counter() - inicio) * 1000.0
+	modo = f"top {args.top}" if args.top is not None else "todos os nós"
+	print(f"[closeness] {args.measure}, {modo}, {'saltos' if args.hops else 'pesos'} ({elapsed_ms:.1f} ms)")
+	for pos, (no, valor) in enumerate(topo, start=1):
+		print(f"  {pos:>3}. {no}: {valor:.6f}")
+	if args.json:
+		out_path = Path(args.json)
+		out_path.parent.mkdir(parents=True, exist_ok=True)
+		with open(out_path, "w", encoding="utf-8") as f:
+			json.dump({"algorithm": "closeness", "measure": args.measure, "weighted": not args.hops, "top_k": args.top,
+					   "elapsed_ms": round(elapsed_ms, 3), "top": [{"node": no, args.measure: v} for no, v in topo]},
+					  f, ensure_ascii=False, indent=2)
+	return 0
+
+
+def cmd_pagerank(args: argparse.Namespace) -> int:
+	"""PageRank (ou centralidade de autovetor) de todos os nós, gravado como ranking em CSV.
+
+	Exemplo (passeio aleatório que sempre recomeça em REC ou GRU):
+	  python -m src.cli --routes data/routes.csv pagerank --personalize REC GRU
+	"""
+	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
+	nome = "eigenvector" if args.eigenvector else "pagerank"
+	inicio = time.perf_counter()
+	try:
+		if args.eigenvector:
+			res = eigenvector_centrality(g, weighted=not args.unweighted, tol=args.tol, max_iter=args.max_iter)
+		else:
+			pers = {_resolve_nome(x, g, is_routes, args.fuzzy): 1.0 for x in args.personalize} if args.personalize else None
+			res = pagerank(g, damping=args.damping, personalization=pers, weighted=not args.unweighted,
+						   tol=args.tol, max_iter=args.max_iter)
+	except ValueError as e:
+		print(f"[ERRO] {e}")
+		return 2
+	elapsed_ms = (time.perf_counter() - inicio) * 1000.0
+	print(f"[{nome}] {res['iterations']} iterações, convergiu={res['converged']} "
+		  f"(variação {res['delta']:.3g}, backend {res['backend']}, {elapsed_ms:.1f} ms)")
+	topo = ranking(res["scores"], args.top)
+	for pos, (no, valor) in enumerate(topo, start=1):
+		print(f"  {pos:>3}. {no}: {valor:.6f}")
+	csv_path = args.csv or (OUT_DIR / f"{nome}_{'rotas' if is_routes else 'bairros'}.csv")
+	export_centrality_csv(res["scores"], csv_path, coluna=nome)
+	if args.json:
+		out_path = Path(args.json)
+		out_path.parent.mkdir(parents=True, exist_ok=True)
+		with open(out_path, "w", encoding="utf-8") as f:
+			json.dump({"algorithm": nome, "iterations": res["iterations"], "converged": res["converged"],
+					   "delta": res["delta"], "backend": res["backend"], "elapsed_ms": round(elapsed_ms, 3),
+					   "top": [{"node": no, nome: v} for no, v in topo]}, f, ensure_ascii=False, indent=2)
+	return 0 if res["converged"] else 1
+
+
+def cmd_mst(args: argparse.Namespace) -> int:
+	"""Árvore geradora mínima (floresta, se o grafo for desconexo), exportada em JSON.
+
+	Em grafos dirigidos a direção é ignorada. Exemplo:
+	  python -m src.cli --routes data/routes.csv mst --algorithm prim --start REC
+	"""
+	g, is_routes = _build_graph(args, weighted=True, directed=getattr(args, "directed", False))
+	inicio = time.perf_counter()
+	try:
+		if args.algorithm == "prim":
+			origem = _resolve_nome(args.start, g, is_routes, args.fuzzy) if args.start else None
+			res = prim(g, start_node=origem)
+		else:
+			res = kruskal(g)
+	except ValueError as e:
+		print(f"[ERRO] {e}")
+		return 2
+	elapsed_ms = (time.perf_counter() - inicio) * 1000.0
+	res["elapsed_ms"] = round(elapsed_ms, 3)
+	print(f"[mst] {res['algorithm']}: {len(res['edges'])} arestas, peso total {res['total_weight']:.4f}, "
+		  f"{res['components']} componente(s) ({elapsed_ms:.1f} ms)")
+	if args.verbose:
+		for e in res["edges"]:
+			print(f"  {e['source']} - {e['destination']}: {e['weight']}")
+	out_path = Path(args.json) if args.json else _default_json_path("mst", res["algorithm"], "rotas" if is_routes else "bairros")
+	out_path.parent.mkdir(parents=True, exist_ok=True)
+	with open(out_path, "w", encoding="utf-8") as f:
+		json.dump(res, f, ensure_ascii=False, indent=2)
+	print(f"Resultado salvo em: {out_path}")
 	return 0
 
 
@@ -493,19 +935,30 @@ def build_parser() -> argparse.ArgumentParser:
 	parser.add_argument("--json", type=str, default=None, help="Salva saída em JSON")
 	parser.add_argument("--directed", action="store_true", help="Trata o grafo como dirigido (necessário para analisar pesos negativos sem criar ciclos artificiais)")
 	parser.add_argument("--verbose", action="store_true", help="Mostra saída completa")
+	parser.add_argument("--fuzzy", action="store_true", help="Bairros: aceita prefixo único ou nome aproximado quando não há correspondência exata")
+	parser.add_argument("--path-cache", type=str, default=None, help="Arquivo JSON para persistir o cache de caminhos do Dijkstra entre execuções")
+	parser.add_argument("--cache-size", type=int, default=10000, help="Máximo de pares no cache de caminhos (LRU)")
+	parser.add_argument("--cache-ttl", type=float, default=None, help="Validade (segundos) das entradas do cache de caminhos")
+	parser.add_argument("--tree-cache-mb", type=float, default=64.0, help="Orçamento (MB) do cache de árvores de caminhos mínimos por origem (lotes e servidor; 0 desliga)")
+	parser.add_argument("--airline", action="append", default=None, help="Rotas: Dijkstra/BFS/DFS só por rotas destas companhias (repetível ou separado por vírgula, ex.: G3,AD)")
+	parser.add_argument("--max-stops", type=int, default=None, help="Rotas: Dijkstra/BFS/DFS só por rotas com até N escalas (0 = voos diretos)")
+	parser.add_argument("--log-level", type=str, default="INFO", choices=["DEBUG", "INFO", "WARNING", "ERROR"], help="Nível de log (DEBUG mostra o passo a passo dos algoritmos)")
 	sub = parser.add_subparsers(dest="command", required=True)
 	# dijkstra
 	p_dij = sub.add_parser("dijkstra", help="Caminho mínimo entre dois nós")
 	p_dij.add_argument("start", type=str, help="Nó de origem")
 	p_dij.add_argument("end", type=str, help="Nó de destino")
+	p_dij.add_argument("--k", type=_inteiro_positivo, default=1, help="Lista os K caminhos mínimos sem ciclos (Yen; padrão: 1)")
 	p_dij.set_defaults(func=cmd_dijkstra)
 	# dijkstra-batch
 	p_dijb = sub.add_parser("dijkstra-batch", help="Executa vários pares origem-destino e agrega em um JSON")
 	p_dijb.add_argument("pairs", nargs="+", help="Sequência de ORIGEM DESTINO ORIGEM DESTINO ... (comprimento par)")
+	p_dijb.add_argument("--k", type=_inteiro_positivo, default=1, help="K caminhos alternativos por par (Yen; padrão: 1)")
 	p_dijb.set_defaults(func=cmd_dijkstra_batch)
 	# dijkstra-pairs (CSV)
 	p_dijp = sub.add_parser("dijkstra-pairs", help="Lê um CSV de pares (source,destination) e executa Dijkstra para cada")
 	p_dijp.add_argument("pairs_csv", type=Path, help="Arquivo CSV com cabeçalho source,destination")
+	p_dijp.add_argument("--k", type=_inteiro_positivo, default=1, help="K caminhos alternativos por par (Yen; padrão: 1)")
 	p_dijp.set_defaults(func=cmd_dijkstra_pairs)
 	# bfs
 	p_bfs = sub.add_parser("bfs", help="Busca em largura")
@@ -522,13 +975,74 @@ def build_parser() -> argparse.ArgumentParser:
 	# report
 	p_rep = sub.add_parser("report", help="Mede tempo por algoritmo/tarefa e salva JSON agregado")
 	p_rep.add_argument("items", nargs="*", help="Nós de interesse: usados como origem (BFS/DFS/BF) e em pares consecutivos (Dijkstra)")
+	p_rep.add_argument("--repeat", type=int, default=5, help="Repetições cronometradas por tarefa (padrão: 5)")
+	p_rep.add_argument("--warmup", type=int, default=1, help="Execuções de aquecimento descartadas por tarefa (padrão: 1)")
+	p_rep.add_argument("--load-repeat", type=int, default=1, help="Quantas vezes carregar o grafo para medir a carga (padrão: 1)")
+	p_rep.add_argument("--memory", action="store_true", help="Mede o pico de memória (tracemalloc) da carga e de cada tarefa")
 	p_rep.set_defaults(func=cmd_report)
+	# serve
+	p_srv = sub.add_parser("serve", help="Servidor de consultas com o grafo carregado uma única vez")
+	p_srv.add_argument("--host", type=str, default="127.0.0.1", help="Endereço TCP (padrão: 127.0.0.1)")
+	p_srv.add_argument("--port", type=int, default=8765, help="Porta TCP (padrão: 8765)")
+	p_srv.add_argument("--unix", type=str, default=None, help="Caminho de socket Unix (substitui host/porta)")
+	p_srv.add_argument("--pool", choices=["thread", "process"], default="thread", help="Pool para as buscas (process contorna o GIL; cada processo carrega o grafo)")
+	p_srv.add_argument("--workers", type=int, default=4, help="Tamanho do pool (padrão: 4)")
+	p_srv.add_argument("--max-pending", type=int, default=256, help="Limite da fila de origens do Dijkstra (backpressure)")
+	p_srv.set_defaults(func=cmd_serve)
+	# apply-deltas
+	p_dlt = sub.add_parser("apply-deltas", help="Aplica um log de deltas de rotas e grava/atualiza um snapshot")
+	p_dlt.add_argument("deltas", type=Path, help="Log de deltas (.csv ou .jsonl) com op,source,destination,weight,...")
+	p_dlt.add_argument("--snapshot", type=Path, default=None, help="Snapshot lido (se existir) e regravado (padrão: out/routes_snapshot.csv)")
+	p_dlt.add_argument("--batch-size", type=int, default=1000, help="Operações por lote (padrão: 1000)")
+	p_dlt.set_defaults(func=cmd_apply_deltas)
+	# triangles
+	p_tri = sub.add_parser("triangles", help="Triângulos e coeficientes de agrupamento local/global")
+	p_tri.add_argument("--approx", action="store_true", help="Estima por amostragem de cunhas em vez de contar tudo")
+	p_tri.add_argument("--samples", type=int, default=20000, help="Amostras no modo --approx (padrão: 20000)")
+	p_tri.add_argument("--seed", type=int, default=0, help="Semente do modo --approx (padrão: 0)")
+	p_tri.add_argument("--top", type=int, default=20, help="Nós com mais triângulos no JSON (modo exato; padrão: 20)")
+	p_tri.set_defaults(func=cmd_triangles)
+	# betweenness
+	p_btw = sub.add_parser("betweenness", help="Centralidade de intermediação (Brandes) com ranking em CSV")
+	p_btw.add_argument("--hops", action="store_true", help="Caminhos mínimos em número de saltos (BFS) em vez de pesos")
+	p_btw.add_argument("--samples", type=_inteiro_positivo, default=None, help="Estima a partir de N fontes sorteadas (padrão: todas, exato)")
+	p_btw.add_argument("--seed", type=int, default=0, help="Semente do sorteio das fontes (padrão: 0)")
+	p_btw.add_argument("--workers", type=int, default=1, help="Processos para dividir as fontes (padrão: 1)")
+	p_btw.add_argument("--top", type=int, default=10, help="Quantos nós mostrar/gravar no JSON (padrão: 10)")
+	p_btw.add_argument("--csv", type=Path, default=None, help="CSV do ranking (padrão: out/betweenness_<rotas|bairros>.csv)")
+	p_btw.set_defaults(func=cmd_betweenness)
+	# closeness
+	p_clo = sub.add_parser("closeness", help="Proximidade e centralidade harmônica (CSV completo ou top-k)")
+	p_clo.add_argument("--measure", choices=["harmonic", "closeness"], default="harmonic", help="Medida do ranking (padrão: harmonic)")
+	p_clo.add_argument("--top", type=int, default=None, help="Só os K mais centrais, com término antecipado das buscas")
+	p_clo.add_argument("--hops", action="store_true", help="Distâncias em número de saltos (BFS) em vez de pesos")
+	p_clo.add_argument("--workers", type=int, default=1, help="Processos para os lotes de buscas (padrão: 1)")
+	p_clo.add_argument("--batch-size", type=int, default=64, help="Origens por lote (padrão: 64)")
+	p_clo.add_argument("--csv", type=Path, default=None, help="CSV com todos os nós (padrão: out/closeness_<rotas|bairros>.csv)")
+	p_clo.set_defaults(func=cmd_closeness)
+	# pagerank
+	p_pr = sub.add_parser("pagerank", help="PageRank / centralidade de autovetor com ranking em CSV")
+	p_pr.add_argument("--eigenvector", action="store_true", help="Centralidade de autovetor em vez de PageRank")
+	p_pr.add_argument("--damping", type=float, default=0.85, help="Fator de amortecimento do PageRank (padrão: 0.85)")
+	p_pr.add_argument("--personalize", nargs="+", default=None, help="Nós para onde o salto aleatório leva (padrão: todos)")
+	p_pr.add_argument("--unweighted", action="store_true", help="Ignora os pesos (cada entrada de adjacência vale 1)")
+	p_pr.add_argument("--tol", type=float, default=1e-6, help="Tolerância de convergência por nó (padrão: 1e-6)")
+	p_pr.add_argument("--max-iter", type=_inteiro_positivo, default=100, help="Máximo de iterações (padrão: 100)")
+	p_pr.add_argument("--top", type=int, default=10, help="Quantos nós mostrar/gravar no JSON (padrão: 10)")
+	p_pr.add_argument("--csv", type=Path, default=None, help="CSV do ranking (padrão: out/<pagerank|eigenvector>_<rotas|bairros>.csv)")
+	p_pr.set_defaults(func=cmd_pagerank)
+	# mst
+	p_mst = sub.add_parser("mst", help="Árvore/floresta geradora mínima com as arestas em JSON")
+	p_mst.add_argument("--algorithm", choices=["kruskal", "prim"], default="kruskal", help="Algoritmo (padrão: kruskal)")
+	p_mst.add_argument("--start", type=str, default=None, help="Prim: nó por onde começar (padrão: o primeiro do grafo)")
+	p_mst.set_defaults(func=cmd_mst)
 	return parser
 
 
 def main(argv: list[str] | None = None) -> int:
 	parser = build_parser()
 	args = parser.parse_args(argv)
+	logging.basicConfig(level=getattr(logging, args.log_level), format="%(message)s")
 	func = getattr(args, "func", None)
 	if func is None:
 		parser.print_help(); return 1
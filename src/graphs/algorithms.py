@@ -1,19 +1,58 @@
 import heapq
+import logging
+from itertools import compress
 from typing import Dict, List, Any, Tuple
 from collections import deque
 
 
 try:
     from .graph import Graph
+    from .masks import EdgeMask
+    from .compact import CompactGraph
 except ImportError:
     from graph import Graph
+    from masks import EdgeMask
+    from compact import CompactGraph
 
-def dijkstra(graph: Graph, start_node: str, end_node: str) -> Dict[str, Any]:
+# Mensagens de diagnóstico ficam em DEBUG: chamadas em lote (dijkstra-pairs) não pagam I/O.
+logger = logging.getLogger(__name__)
+
+# Contadores de instrumentação (opt-in via parâmetro 'stats' de cada algoritmo):
+#   nodes_settled  nós finalizados (retirados da fila/pilha e expandidos)
+#   edges_relaxed  arestas examinadas a partir de nós finalizados
+#   pushes / pops  operações na fronteira (heap no Dijkstra, fila na BFS, pilha na DFS)
+#   stale_pops     entradas obsoletas descartadas ao sair da fronteira
+#   peak_frontier  maior tamanho que a fronteira atingiu
+# Os algoritmos contam em variáveis locais e só tocam 'stats' ao final, então o custo
+# com stats=None se resume a alguns incrementos de inteiros.
+STATS_KEYS = ("nodes_settled", "edges_relaxed", "pushes", "pops", "stale_pops", "peak_frontier")
+
+# Buscas filtradas (dijkstra, bfs, dfs): 'edge_mask' é uma masks.EdgeMask compilada sobre o
+# mesmo grafo; arestas fora da máscara são ignoradas e não contam em edges_relaxed.
+
+
+def _checar_mascara(graph: Graph, edge_mask: EdgeMask | None):
+    if edge_mask is not None and edge_mask.graph is not graph:
+        raise ValueError("A máscara de arestas foi compilada para outro grafo.")
+
+
+def _acumular_stats(stats: Dict[str, int], **contagens: int):
+    """Soma as contagens em 'stats' (peak_frontier guarda o máximo), permitindo reusar o dict."""
+    for chave, valor in contagens.items():
+        if chave == "peak_frontier":
+            stats[chave] = max(stats.get(chave, 0), valor)
+        else:
+            stats[chave] = stats.get(chave, 0) + valor
+
+
+def dijkstra(graph: Graph, start_node: str, end_node: str, stats: Dict[str, int] | None = None,
+             edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
 
     if start_node not in graph.nodes_data:
         raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
     if end_node not in graph.nodes_data:
         raise ValueError(f"Nó de destino não encontrado no grafo: '{end_node}'")
+    _checar_mascara(graph, edge_mask)
 
     distances: Dict[str, float] = {node: float('inf') for node in graph.nodes_data}
     previous_nodes: Dict[str, str | None] = {node: None for node in graph.nodes_data}
@@ -21,21 +60,28 @@ def dijkstra(graph: Graph, start_node: str, end_node: str) -> Dict[str, Any]:
     distances[start_node] = 0
 
     priority_queue: List[Tuple[float, str]] = [(0, start_node)]
+    pushes, pops, stale, settled, relaxed, peak = 1, 0, 0, 0, 0, 1
 
-    print(f"Iniciando Dijkstra de '{start_node}' para '{end_node}'...")
+    logger.debug("Iniciando Dijkstra de '%s' para '%s'...", start_node, end_node)
 
     while priority_queue:
         current_distance, current_node = heapq.heappop(priority_queue)
+        pops += 1
 
         if current_distance > distances[current_node]:
+            stale += 1
             continue
 
+        settled += 1
         if current_node == end_node:
-            print("Destino encontrado.")
+            logger.debug("Destino encontrado.")
             break
 
-
-        for neighbor_info in graph.adj.get(current_node, []):
+        vizinhos = graph.adj.get(current_node, [])
+        if edge_mask is not None:
+            vizinhos = list(compress(vizinhos, edge_mask.row(current_node)))
+        relaxed += len(vizinhos)
+        for neighbor_info in vizinhos:
             neighbor = neighbor_info["node"]
             weight = neighbor_info["weight"]
 
@@ -53,12 +99,19 @@ def dijkstra(graph: Graph, start_node: str, end_node: str) -> Dict[str, Any]:
                 previous_nodes[neighbor] = current_node
 
                 heapq.heappush(priority_queue, (new_distance, neighbor))
+                pushes += 1
+        if len(priority_queue) > peak:
+            peak = len(priority_queue)
+
+    if stats is not None:
+        _acumular_stats(stats, nodes_settled=settled, edges_relaxed=relaxed, pushes=pushes,
+                        pops=pops, stale_pops=stale, peak_frontier=peak)
 
     path: List[str] = []
     final_cost = distances[end_node]
 
     if final_cost == float('inf'):
-        print(f"Não foi encontrado caminho de '{start_node}' para '{end_node}'.")
+        logger.debug("Não foi encontrado caminho de '%s' para '%s'.", start_node, end_node)
         return {"cost": float('inf'), "path": []}
 
     current = end_node
@@ -71,15 +124,362 @@ def dijkstra(graph: Graph, start_node: str, end_node: str) -> Dict[str, Any]:
     if path[0] == start_node:
         return {"cost": final_cost, "path": path}
     else:
-        print(f"Erro na reconstrução do caminho para '{end_node}'.")
+        logger.warning("Erro na reconstrução do caminho para '%s'.", end_node)
         return {"cost": float('inf'), "path": []}
-    
-def bfs(graph: Graph, start_node: str) -> Dict[str, Any]:
+
+
+class DijkstraSearch:
+    """Dijkstra de fonte única que pode ser retomado: guarda heap, distâncias, predecessores e fechados.
+
+    run_until(destino) para assim que o destino é fechado (como o dijkstra()); uma consulta
+    posterior a um destino mais distante continua da fronteira salva em vez de recomeçar.
+    A ordem de relaxação é a mesma do dijkstra(), então custos e caminhos coincidem.
+
+    O nó fechado por último só é expandido na retomada seguinte, de modo que um peso
+    negativo é reportado exatamente nas mesmas consultas em que o dijkstra() o reportaria.
+    """
+
+    def __init__(self, graph: Graph, start_node: str):
+        if start_node not in graph.nodes_data:
+            raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
+        self.graph = graph
+        self.source = start_node
+        self.version = graph.version
+        self.distance: Dict[str, float] = {start_node: 0}
+        self.previous: Dict[str, str | None] = {start_node: None}
+        self.settled: set = set()
+        self.heap: List[Tuple[float, str]] = [(0, start_node)]
+        self._pendente: str | None = None  # fechado, ainda não expandido
+        self._erro: ValueError | None = None
+        self.stats: Dict[str, int] = {"nodes_settled": 0, "edges_relaxed": 0, "pushes": 1, "pops": 0,
+                                      "stale_pops": 0, "peak_frontier": 1}
+
+    @classmethod
+    def from_tree(cls, graph: Graph, tree: Dict[str, Any]) -> "DijkstraSearch":
+        """Busca já concluída a partir de uma árvore de shortest_path_tree (ex.: vinda de outro processo)."""
+        busca = cls(graph, tree["source"])
+        busca.distance = tree["distance"]
+        busca.previous = tree["previous"]
+        busca.settled = set(busca.distance)
+        busca.heap = []
+        return busca
+
+    @property
+    def done(self) -> bool:
+        return not self.heap and self._pendente is None
+
+    def _expandir(self, node: str):
+        dist_node = self.distance[node]
+        distances = self.distance
+        inf = float('inf')
+        vizinhos = self.graph.adj.get(node, [])
+        self.stats["edges_relaxed"] += len(vizinhos)
+        for neighbor_info in vizinhos:
+            neighbor = neighbor_info["node"]
+            weight = neighbor_info["weight"]
+            if weight < 0:
+                raise ValueError(
+                    f"Peso negativo encontrado na aresta {node}-{neighbor}. "
+                    "Dijkstra não é aplicável."
+                )
+            new_distance = dist_node + weight
+            if new_distance < distances.get(neighbor, inf):
+                distances[neighbor] = new_distance
+                self.previous[neighbor] = node
+                heapq.heappush(self.heap, (new_distance, neighbor))
+                self.stats["pushes"] += 1
+        if len(self.heap) > self.stats["peak_frontier"]:
+            self.stats["peak_frontier"] = len(self.heap)
+
+    def run_until(self, end_node: str | None = None) -> bool:
+        """Avança até fechar 'end_node' (None = até esgotar). Retorna se o destino foi alcançado."""
+        if end_node is not None and end_node in self.settled:
+            return True
+        if self.graph.version != self.version:
+            raise RuntimeError("O grafo mudou desde o início da busca; crie uma nova DijkstraSearch.")
+        if self._erro is not None:
+            raise self._erro
+        heap = self.heap
+        distances = self.distance
+        settled = self.settled
+        pops = stale = fechados = 0
+        try:
+            if self._pendente is not None:
+                node, self._pendente = self._pendente, None
+                self._expandir(node)
+            while heap:
+                current_distance, current_node = heapq.heappop(heap)
+                pops += 1
+                if current_distance > distances[current_node]:
+                    stale += 1
+                    continue
+                settled.add(current_node)
+                fechados += 1
+                if current_node == end_node:
+                    self._pendente = current_node
+                    return True
+                self._expandir(current_node)
+        except ValueError as e:
+            self._erro = e
+            raise
+        finally:
+            self.stats["pops"] += pops
+            self.stats["stale_pops"] += stale
+            self.stats["nodes_settled"] += fechados
+        return end_node is None
+
+    # === Manutenção incremental (busca concluída + mudança de peso) ===
+
+    def update_edge(self, u: str, v: str, old_weight: float, new_weight: float) -> int:
+        """Reajusta a árvore após o peso efetivo de u->v (e v->u se não dirigido) mudar.
+
+        - Redução: propaga a melhora a partir de v (só nós que ficam mais próximos são re-fechados).
+        - Aumento: só importa se u->v é aresta da árvore; a subárvore abaixo de v é desfeita
+          e re-fechada a partir dos vizinhos de fora dela. Remoção = aumento até infinito.
+        As distâncias ficam idênticas às de uma busca nova; em empates de custo o predecessor
+        pode ser outro caminho mínimo. Retorna quantos nós foram re-fechados.
+        """
+        if not self.done:
+            raise RuntimeError("Só buscas concluídas podem ser reajustadas.")
+        if new_weight < 0:
+            raise ValueError(
+                f"Peso negativo encontrado na aresta {u}-{v}. "
+                "Dijkstra não é aplicável."
+            )
+        arcos = [(u, v)] if self.graph.directed else [(u, v), (v, u)]
+        self.version = self.graph.version
+        antes = self.stats["nodes_settled"]
+        if new_weight < old_weight:
+            self._propagar_melhora(arcos, new_weight)
+        elif new_weight > old_weight:
+            self._reparar_aumento(arcos)
+        return self.stats["nodes_settled"] - antes
+
+    def _propagar_melhora(self, arcos: List[Tuple[str, str]], peso: float):
+        inf = float('inf')
+        for a, b in arcos:
+            if a not in self.distance:
+                continue
+            nova = self.distance[a] + peso
+            if nova < self.distance.get(b, inf):
+                self.distance[b] = nova
+                self.previous[b] = a
+                heapq.heappush(self.heap, (nova, b))
+        self.run_until(None)
+
+    def _reparar_aumento(self, arcos: List[Tuple[str, str]]):
+        raizes = [b for a, b in arcos if b in self.previous and self.previous[b] == a]
+        if not raizes:
+            return
+        # subárvore afetada: filhos de y são vizinhos x com previous[x] == y (arestas da árvore saem do pai)
+        subarvore: set = set()
+        pilha = list(raizes)
+        while pilha:
+            y = pilha.pop()
+            if y in subarvore:
+                continue
+            subarvore.add(y)
+            for e in self.graph.adj.get(y, []):
+                x = e["node"]
+                if x not in subarvore and self.previous.get(x) == y:
+                    pilha.append(x)
+        for x in subarvore:
+            del self.distance[x]
+            del self.previous[x]
+            self.settled.discard(x)
+        # re-semeia cada nó da subárvore pelo melhor vizinho de fora dela
+        inf = float('inf')
+        for y, x, peso in self._arestas_de_entrada(subarvore):
+            nova = self.distance[y] + peso
+            if nova < self.distance.get(x, inf):
+                self.distance[x] = nova
+                self.previous[x] = y
+                heapq.heappush(self.heap, (nova, x))
+        self.run_until(None)
+
+    def _arestas_de_entrada(self, alvos: set):
+        """Arestas (y, x, peso) de nós alcançados fora de 'alvos' para nós de 'alvos'."""
+        for x in alvos:
+            for y, e in self.graph.in_edges(x):
+                if y not in alvos and y in self.distance:
+                    yield y, x, e["weight"]
+
+    def tree(self) -> Dict[str, Any]:
+        """Estado atual no formato de shortest_path_tree (completo só se 'done')."""
+        return {"source": self.source, "distance": self.distance, "previous": self.previous}
+
+    def path_to(self, end_node: str) -> Dict[str, Any]:
+        """{"cost", "path"} até 'end_node', retomando a busca se ele ainda não foi fechado."""
+        if end_node not in self.graph.nodes_data:
+            raise ValueError(f"Nó de destino não encontrado no grafo: '{end_node}'")
+        if not self.run_until(end_node):
+            return {"cost": float('inf'), "path": []}
+        return path_from_tree(self.tree(), end_node)
+
+
+def shortest_path_tree(graph: Graph, start_node: str, stats: Dict[str, int] | None = None) -> Dict[str, Any]:
+
+    # Dijkstra de fonte única: mesma ordem de relaxação do dijkstra(), mas sem parar no destino.
+    # Guarda apenas os nós alcançados (dicts esparsos), então a árvore ocupa O(alcançados).
+
+    busca = DijkstraSearch(graph, start_node)
+    try:
+        busca.run_until(None)
+    finally:
+        if stats is not None:
+            _acumular_stats(stats, **busca.stats)
+    return busca.tree()
+
+
+def path_from_tree(tree: Dict[str, Any], end_node: str) -> Dict[str, Any]:
+
+    # Reconstrói {"cost", "path"} (mesmo formato do dijkstra) a partir de uma árvore de caminhos mínimos.
+
+    cost = tree["distance"].get(end_node)
+    if cost is None:
+        return {"cost": float('inf'), "path": []}
+    previous_nodes = tree["previous"]
+    path: List[str] = []
+    current = end_node
+    while current is not None:
+        path.append(current)
+        current = previous_nodes[current]
+    path.reverse()
+    return {"cost": cost, "path": path}
+
+
+# === K caminhos mínimos sem ciclos (Yen) ===
+
+def _dijkstra_restrito(cg: CompactGraph, origem: int, destino: int, nos_bloqueados: bytearray,
+                       arestas_bloqueadas: bytearray) -> Tuple[List[int], List[float]] | None:
+    """Dijkstra ponto a ponto sobre o CSR, pulando nós e entradas marcados (sem copiar o grafo).
+
+    Retorna (caminho em índices, distância acumulada em cada nó do caminho) ou None. Empates
+    saem na mesma ordem do dijkstra() (heap por (distância, nome)).
+    """
+    targets, weights, offsets, nomes = cg.targets, cg.weights, cg.offsets, cg.names
+    dist: Dict[int, float] = {origem: 0}
+    anterior: Dict[int, int] = {}
+    heap: List[Tuple[float, str, int]] = [(0, nomes[origem], origem)]
+    fechados: set = set()
+    while heap:
+        d, _, u = heapq.heappop(heap)
+        if u in fechados:
+            continue
+        fechados.add(u)
+        if u == destino:
+            caminho = [u]
+            while caminho[-1] != origem:
+                caminho.append(anterior[caminho[-1]])
+            caminho.reverse()
+            return caminho, [dist[x] for x in caminho]
+        for k in range(offsets[u], offsets[u + 1]):
+            if arestas_bloqueadas[k]:
+                continue
+            v = targets[k]
+            if nos_bloqueados[v]:
+                continue
+            w = weights[k]
+            if w < 0:
+                raise ValueError(
+                    f"Peso negativo encontrado na aresta {nomes[u]}-{nomes[v]}. "
+                    "Dijkstra não é aplicável."
+                )
+            nd = d + w
+            if nd < dist.get(v, float('inf')):
+                dist[v] = nd
+                anterior[v] = u
+                heapq.heappush(heap, (nd, nomes[v], v))
+    return None
+
+
+def k_shortest_paths(graph: Graph, start_node: str, end_node: str, k: int = 3,
+                     edge_mask: EdgeMask | None = None) -> List[Dict[str, Any]]:
+    """Até k caminhos mínimos sem ciclos de 'start_node' a 'end_node' (algoritmo de Yen).
+
+    Retorna [{"cost", "path"}, ...] em ordem de custo; o primeiro é o do dijkstra(). Cada
+    desvio é uma busca ponto a ponto no CSR com nós e entradas bloqueados em bytearrays,
+    desfeitos após a busca. Só se desvia a partir do ponto em que o próprio caminho se
+    separou do seu pai (otimização de Lawler): os desvios anteriores já foram gerados.
+    Caminhos são sequências de nós; arestas paralelas valem pelo menor peso.
+    """
+    if start_node not in graph.nodes_data:
+        raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
+    if end_node not in graph.nodes_data:
+        raise ValueError(f"Nó de destino não encontrado no grafo: '{end_node}'")
+    if k < 1:
+        raise ValueError("k deve ser pelo menos 1.")
+    _checar_mascara(graph, edge_mask)
+
+    cg = graph.compact()
+    offsets, targets = cg.offsets, cg.targets
+    origem, destino = cg.index[start_node], cg.index[end_node]
+    nos_bloqueados = bytearray(len(cg))
+    arestas_bloqueadas = bytearray(len(targets))
+    if edge_mask is not None:
+        for i, nome in enumerate(cg.names):
+            arestas_bloqueadas[offsets[i]:offsets[i + 1]] = bytes(1 - b for b in edge_mask.row(nome))
+
+    primeiro = _dijkstra_restrito(cg, origem, destino, nos_bloqueados, arestas_bloqueadas)
+    if primeiro is None:
+        return []
+    # aceitos: (caminho, distâncias acumuladas, índice do nó de desvio)
+    aceitos: List[Tuple[List[int], List[float], int]] = [(primeiro[0], primeiro[1], 0)]
+    candidatos: List[Tuple[float, int, List[int], List[float], int]] = []
+    vistos = {tuple(primeiro[0])}
+    ordem = 0
+
+    while len(aceitos) < k:
+        caminho, acumulado, desvio = aceitos[-1]
+        for i in range(desvio, len(caminho) - 1):
+            raiz = caminho[:i + 1]
+            u = caminho[i]
+            bloqueadas: List[int] = []
+            for outro, _, _ in aceitos:
+                if len(outro) > i + 1 and outro[:i + 1] == raiz:
+                    proximo = outro[i + 1]
+                    for pos in range(offsets[u], offsets[u + 1]):
+                        if targets[pos] == proximo and not arestas_bloqueadas[pos]:
+                            arestas_bloqueadas[pos] = 1
+                            bloqueadas.append(pos)
+            for x in raiz[:-1]:
+                nos_bloqueados[x] = 1
+            try:
+                desvio_achado = _dijkstra_restrito(cg, u, destino, nos_bloqueados, arestas_bloqueadas)
+            finally:
+                for x in raiz[:-1]:
+                    nos_bloqueados[x] = 0
+                for pos in bloqueadas:
+                    arestas_bloqueadas[pos] = 0
+            if desvio_achado is None:
+                continue
+            resto, dist_resto = desvio_achado
+            novo = raiz[:-1] + resto
+            chave = tuple(novo)
+            if chave in vistos:
+                continue
+            vistos.add(chave)
+            base = acumulado[i]
+            novo_acumulado = acumulado[:i] + [base + d for d in dist_resto]
+            heapq.heappush(candidatos, (novo_acumulado[-1], ordem, novo, novo_acumulado, i))
+            ordem += 1
+        if not candidatos:
+            break
+        _, _, novo, novo_acumulado, i = heapq.heappop(candidatos)
+        aceitos.append((novo, novo_acumulado, i))
+
+    nomes = cg.names
+    return [{"cost": acumulado[-1], "path": [nomes[x] for x in caminho]} for caminho, acumulado, _ in aceitos]
+
+
+def bfs(graph: Graph, start_node: str, stats: Dict[str, int] | None = None,
+        edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
 
     # busca em largura
 
     if start_node not in graph.nodes_data:
         raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
+    _checar_mascara(graph, edge_mask)
 
     visited: Dict[str, bool] = {node: False for node in graph.nodes_data}
     distance: Dict[str, int] = {node: -1 for node in graph.nodes_data}
@@ -91,12 +491,19 @@ def bfs(graph: Graph, start_node: str) -> Dict[str, Any]:
     distance[start_node] = 0
 
     order: List[str] = []
+    relaxed, peak = 0, 1
 
     while fila:
+        if len(fila) > peak:
+            peak = len(fila)
         u = fila.popleft()
         order.append(u)
 
-        for info in graph.adj.get(u, []):
+        vizinhos = graph.adj.get(u, [])
+        if edge_mask is not None:
+            vizinhos = list(compress(vizinhos, edge_mask.row(u)))
+        relaxed += len(vizinhos)
+        for info in vizinhos:
             v = info["node"]
             if not visited[v]:
                 visited[v] = True
@@ -104,48 +511,68 @@ def bfs(graph: Graph, start_node: str) -> Dict[str, Any]:
                 distance[v] = distance[u] + 1
                 fila.append(v)
 
+    if stats is not None:
+        # na BFS cada nó entra na fila uma única vez: pushes == pops == visitados
+        _acumular_stats(stats, nodes_settled=len(order), edges_relaxed=relaxed, pushes=len(order),
+                        pops=len(order), stale_pops=0, peak_frontier=peak)
+
     return {
         "order": order,
         "distance": distance,
         "parent": parent,
     }
 
-def dfs(graph: Graph, start_node: str) -> Dict[str, Any]:
+def dfs(graph: Graph, start_node: str, stats: Dict[str, int] | None = None,
+        edge_mask: EdgeMask | None = None) -> Dict[str, Any]:
     
     # busca em profundidade
 
     if start_node not in graph.nodes_data:
         raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
+    _checar_mascara(graph, edge_mask)
 
     visited: Dict[str, bool] = {node: False for node in graph.nodes_data}
     parent: Dict[str, str | None] = {node: None for node in graph.nodes_data}
 
     stack: List[str] = [start_node]
     order: List[str] = []
+    pushes, pops, stale, relaxed, peak = 1, 0, 0, 0, 1
 
     while stack:
         u = stack.pop()
+        pops += 1
 
         if visited[u]:
+            stale += 1
             continue
 
         visited[u] = True
         order.append(u)
 
         vizinhos = graph.adj.get(u, [])
+        if edge_mask is not None:
+            vizinhos = list(compress(vizinhos, edge_mask.row(u)))
+        relaxed += len(vizinhos)
         for info in reversed(vizinhos):
             v = info["node"]
             if not visited[v]:
                 if parent[v] is None:
                     parent[v] = u
                 stack.append(v)
+                pushes += 1
+        if len(stack) > peak:
+            peak = len(stack)
+
+    if stats is not None:
+        _acumular_stats(stats, nodes_settled=len(order), edges_relaxed=relaxed, pushes=pushes,
+                        pops=pops, stale_pops=stale, peak_frontier=peak)
 
     return {
         "order": order,
         "parent": parent,
     }
 
-def bellman_ford(graph: Graph, start_node: str) -> Dict[str, Any]:
+def bellman_ford(graph: Graph, start_node: str, stats: Dict[str, int] | None = None) -> Dict[str, Any]:
     
     if start_node not in graph.nodes_data:
         raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
@@ -162,13 +589,16 @@ def bellman_ford(graph: Graph, start_node: str) -> Dict[str, Any]:
             edges.append((u, v, w))
 
     n = len(graph.nodes_data)
+    passes, updates = 0, 0
 
     for _ in range(n - 1):
+        passes += 1
         trocou = False
         for u, v, w in edges:
             if dist[u] != float("inf") and dist[u] + w < dist[v]:
                 dist[v] = dist[u] + w
                 parent[v] = u
+                updates += 1
                 trocou = True
         if not trocou:
             break
@@ -180,8 +610,114 @@ def bellman_ford(graph: Graph, start_node: str) -> Dict[str, Any]:
             has_negative_cycle = True
             break
 
+    if stats is not None:
+        # Bellman-Ford não tem fronteira: reporta passadas e atualizações de distância
+        _acumular_stats(stats, passes=passes, edges_relaxed=passes * len(edges),
+                        distance_updates=updates)
+
     return {
         "distance": dist,
         "parent": parent,
         "has_negative_cycle": has_negative_cycle,
-    }
\ No newline at end of file
+    }
+
+
+# === Árvore/floresta geradora mínima ===
+# Direção é ignorada (em grafos dirigidos vale o grafo subjacente) e laços não entram.
+# Arestas paralelas competem entre si: só a mais leve pode ser escolhida.
+
+def _mst_resultado(nomes: List[str], escolhidas: List[Tuple[float, int, int]], algoritmo: str) -> Dict[str, Any]:
+    n = len(nomes)
+    return {
+        "algorithm": algoritmo,
+        "edges": [{"source": nomes[i], "destination": nomes[j], "weight": w} for w, i, j in escolhidas],
+        "total_weight": sum(w for w, _, _ in escolhidas),
+        "nodes": n,
+        "components": n - len(escolhidas),  # cada aresta escolhida une duas árvores
+    }
+
+
+def kruskal(graph: Graph) -> Dict[str, Any]:
+    """Floresta geradora mínima por Kruskal: arestas ordenadas por peso + union-find em listas.
+
+    Retorna {"algorithm", "edges": [{"source", "destination", "weight"}], "total_weight",
+    "nodes", "components"} (uma árvore por componente conexa).
+    """
+    cg = graph.compact()
+    n = len(cg)
+    targets, weights, offsets = cg.targets, cg.weights, cg.offsets
+    arestas: List[Tuple[float, int, int]] = []
+    for i in range(n):
+        for k in range(offsets[i], offsets[i + 1]):
+            j = targets[k]
+            # não dirigido: cada aresta aparece em i e em j; basta uma cópia
+            if j != i and (cg.directed or i < j):
+                arestas.append((weights[k], i, j))
+    arestas.sort()
+
+    pai = list(range(n))
+    tamanho = [1] * n
+
+    def _raiz(x: int) -> int:
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]  # compressão por halving
+            x = pai[x]
+        return x
+
+    escolhidas: List[Tuple[float, int, int]] = []
+    for w, i, j in arestas:
+        ri, rj = _raiz(i), _raiz(j)
+        if ri == rj:
+            continue
+        if tamanho[ri] < tamanho[rj]:
+            ri, rj = rj, ri
+        pai[rj] = ri
+        tamanho[ri] += tamanho[rj]
+        escolhidas.append((w, i, j))
+        if len(escolhidas) == n - 1:
+            break
+    return _mst_resultado(cg.names, escolhidas, "kruskal")
+
+
+def prim(graph: Graph, start_node: str | None = None) -> Dict[str, Any]:
+    """Floresta geradora mínima por Prim com heap "preguiçoso" (entradas velhas são descartadas).
+
+    Começa por 'start_node' (ou pelo primeiro nó) e, ao esgotar uma componente, recomeça
+    no próximo nó ainda fora da floresta. Mesmo formato de retorno de kruskal(); o peso
+    total é o mesmo, mas em empates as arestas escolhidas podem diferir.
+    """
+    if start_node is not None and start_node not in graph.nodes_data:
+        raise ValueError(f"Nó de origem não encontrado no grafo: '{start_node}'")
+    cg = graph.compact()
+    n = len(cg)
+    targets, weights, offsets = cg.targets, cg.weights, cg.offsets
+    vizinhos: List[List[Tuple[float, int]]] = [
+        [(weights[k], targets[k]) for k in range(offsets[i], offsets[i + 1])] for i in range(n)
+    ]
+    if cg.directed:
+        for i in range(n):
+            for k in range(offsets[i], offsets[i + 1]):
+                vizinhos[targets[k]].append((weights[k], i))
+
+    na_arvore = [False] * n
+    escolhidas: List[Tuple[float, int, int]] = []
+    ordem = list(range(n))
+    if start_node is not None:
+        inicio = cg.index[start_node]
+        ordem = [inicio] + [i for i in ordem if i != inicio]
+    for raiz in ordem:
+        if na_arvore[raiz]:
+            continue
+        na_arvore[raiz] = True
+        heap = [(w, raiz, j) for w, j in vizinhos[raiz] if not na_arvore[j]]
+        heapq.heapify(heap)
+        while heap:
+            w, i, j = heapq.heappop(heap)
+            if na_arvore[j]:
+                continue
+            na_arvore[j] = True
+            escolhidas.append((w, i, j))
+            for wj, x in vizinhos[j]:
+                if not na_arvore[x]:
+                    heapq.heappush(heap, (wj, j, x))
+    return _mst_resultado(cg.names, escolhidas, "prim")
@@ -0,0 +1,178 @@
+import asyncio
+import functools
+from concurrent.futures import Executor
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+try:
+    from .graph import Graph
+    from .algorithms import shortest_path_tree, path_from_tree
+    from .cache import TreeCache
+except ImportError:
+    from graph import Graph
+    from algorithms import shortest_path_tree, path_from_tree
+    from cache import TreeCache
+
+
+class AsyncPathService:
+    """Camada asyncio de consultas de caminho mínimo com agrupamento (coalescing) por origem.
+
+    - Consultas simultâneas com a mesma origem compartilham UMA busca de fonte única
+      (shortest_path_tree); cada uma só reconstrói o seu caminho a partir da árvore.
+    - As origens pendentes passam por uma fila limitada (max_pending): quando ela enche,
+      quem chama fica aguardando (backpressure) em vez de acumular trabalho sem limite.
+    - As buscas rodam fora do laço de eventos, em 'executor' (None = pool padrão do laço).
+    - Com 'trees' (TreeCache), árvores já calculadas respondem sem ir à fila, e cada
+      árvore nova é guardada para as próximas consultas da mesma origem.
+
+    Uso:
+        async with AsyncPathService(g) as svc:
+            res = await svc.shortest_path("MEX", "JFK")   # {"cost": ..., "path": [...]}
+    """
+
+    def __init__(
+        self,
+        graph: Graph,
+        max_pending: int = 256,
+        concurrency: int = 2,
+        executor: Executor | None = None,
+        search: Callable[[str], Dict[str, Any]] | None = None,
+        trees: "TreeCache | None" = None,
+    ):
+        # graph: usado para validar os nós; search: função picklable para pools de processos
+        self.graph = graph
+        self.max_pending = max_pending
+        self.concurrency = concurrency
+        self._executor = executor
+        self._search = search or functools.partial(shortest_path_tree, graph)
+        self.trees = trees
+        self._queue: asyncio.Queue | None = None
+        self._workers: List[asyncio.Task] = []
+        self._inflight: Dict[str, asyncio.Future] = {}
+        # por origem em voo: a tarefa que a coloca na fila e quantos chamadores esperam por ela
+        self._enfileirando: Dict[str, asyncio.Task] = {}
+        self._aguardando: Dict[str, int] = {}
+        self.stats: Dict[str, int] = {"requests": 0, "coalesced": 0, "searches": 0, "errors": 0}
+
+    async def __aenter__(self) -> "AsyncPathService":
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    async def start(self):
+        if self._queue is not None:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_pending)
+        self._workers = [asyncio.create_task(self._worker()) for _ in range(self.concurrency)]
+
+    async def close(self):
+        for w in self._workers:
+            w.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        for t in self._enfileirando.values():
+            t.cancel()
+        self._enfileirando.clear()
+        self._aguardando.clear()
+        self._queue = None
+        for fut in self._inflight.values():
+            if not fut.done():
+                fut.set_exception(RuntimeError("Serviço de caminhos encerrado"))
+        self._inflight.clear()
+
+    @property
+    def pending(self) -> int:
+        """Origens aguardando ou em busca neste momento."""
+        return len(self._inflight)
+
+    async def tree(self, source: str) -> Dict[str, Any]:
+        """Árvore de caminhos mínimos de 'source', compartilhada com consultas concorrentes."""
+        if self.trees is not None:
+            arvore = self.trees.get(source)
+            if arvore is not None:
+                return arvore
+        await self.start()
+        fut = self._inflight.get(source)
+        if fut is not None:
+            self.stats["coalesced"] += 1
+        else:
+            fut = asyncio.get_running_loop().create_future()
+            self._inflight[source] = fut
+            # o put roda numa tarefa própria: se a fila estiver cheia, todos os chamadores da
+            # origem ficam aguardando (backpressure), e o cancelamento de quem criou a entrada
+            # não tira a origem da fila enquanto outros ainda esperam por ela
+            self._enfileirando[source] = asyncio.ensure_future(self._queue.put(source))
+        self._aguardando[source] = self._aguardando.get(source, 0) + 1
+        try:
+            # shield: cancelar um chamador não cancela a busca compartilhada pelos demais
+            return await asyncio.shield(fut)
+        except asyncio.CancelledError:
+            self._desistir(source, fut)
+            raise
+        finally:
+            restantes = self._aguardando.get(source, 0) - 1
+            if restantes > 0:
+                self._aguardando[source] = restantes
+            else:
+                self._aguardando.pop(source, None)
+
+    def _desistir(self, source: str, fut: asyncio.Future):
+        # último chamador cancelado antes de a origem entrar na fila: ninguém mais precisa dela
+        if self._aguardando.get(source, 0) > 1 or self._inflight.get(source) is not fut:
+            return
+        put = self._enfileirando.get(source)
+        if put is not None and not put.done():
+            put.cancel()
+            del self._enfileirando[source]
+            del self._inflight[source]
+            fut.cancel()
+
+    async def shortest_path(self, source: str, target: str) -> Dict[str, Any]:
+        """Mesmo resultado de dijkstra(graph, source, target): {"cost", "path"}."""
+        self.stats["requests"] += 1
+        if source not in self.graph.nodes_data:
+            raise ValueError(f"Nó de origem não encontrado no grafo: '{source}'")
+        if target not in self.graph.nodes_data:
+            raise ValueError(f"Nó de destino não encontrado no grafo: '{target}'")
+        return path_from_tree(await self.tree(source), target)
+
+    async def batch(self, pairs: Iterable[Tuple[str, str]]) -> List[Dict[str, Any]]:
+        """Resolve vários pares concorrentemente; erros por par não abortam os demais.
+
+        Formato igual ao dos executores de pares do CLI: {"from", "to", "cost", "path"} ou {"from", "to", "error"}.
+        """
+        pares = list(pairs)
+        resultados = await asyncio.gather(
+            *(self.shortest_path(o, d) for o, d in pares), return_exceptions=True
+        )
+        saida: List[Dict[str, Any]] = []
+        for (o, d), res in zip(pares, resultados):
+            if isinstance(res, Exception):
+                saida.append({"from": o, "to": d, "error": str(res)})
+            else:
+                saida.append({"from": o, "to": d, **res})
+        return saida
+
+    async def _worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            source = await self._queue.get()
+            self._enfileirando.pop(source, None)
+            fut = self._inflight.get(source)
+            try:
+                tree = await loop.run_in_executor(self._executor, self._search, source)
+                self.stats["searches"] += 1
+                if self.trees is not None:
+                    self.trees.put(source, tree)
+                if fut is not None and not fut.done():
+                    fut.set_result(tree)
+            except Exception as e:
+                self.stats["errors"] += 1
+                if fut is not None and not fut.done():
+                    fut.set_exception(e)
+            finally:
+                # a origem deixa de estar "em voo": pedidos posteriores disparam nova busca
+                if self._inflight.get(source) is fut:
+                    del self._inflight[source]
+                self._queue.task_done()
@@ -0,0 +1,289 @@
+import json
+import logging
+import sys
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, Dict, Tuple
+
+try:
+    from .graph import Graph
+    from .algorithms import DijkstraSearch, dijkstra
+except ImportError:
+    from graph import Graph
+    from algorithms import DijkstraSearch, dijkstra
+
+logger = logging.getLogger(__name__)
+
+
+class PathCache:
+    """Cache LRU (com TTL opcional) de consultas de caminho mínimo (origem, destino) -> resultado.
+
+    O cache acompanha o contador 'version' do grafo: qualquer add_node/add_edge muda a
+    versão e o próximo acesso descarta todas as entradas (invalidação automática).
+
+    Os resultados guardados são compartilhados entre as chamadas: não modifique o dict
+    nem a lista 'path' devolvidos.
+    """
+
+    def __init__(self, graph: Graph, max_entries: int = 10000, ttl: float | None = None,
+                 clock: Callable[[], float] = time.monotonic, trees: "TreeCache | None" = None):
+        # trees: cache de árvores por origem consultado nos misses (útil em lotes com origens repetidas)
+        self.graph = graph
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.trees = trees
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        self._version = graph.version
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "invalidations": 0}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _checar_versao(self):
+        if self.graph.version != self._version:
+            if self._entries:
+                self.stats["invalidations"] += 1
+            self._entries.clear()
+            self._version = self.graph.version
+
+    def get(self, start: str, end: str) -> Dict[str, Any] | None:
+        self._checar_versao()
+        chave = (start, end)
+        item = self._entries.get(chave)
+        if item is None:
+            self.stats["misses"] += 1
+            return None
+        criado, resultado = item
+        if self.ttl is not None and self._clock() - criado > self.ttl:
+            del self._entries[chave]
+            self.stats["expirations"] += 1
+            self.stats["misses"] += 1
+            return None
+        self._entries.move_to_end(chave)
+        self.stats["hits"] += 1
+        return resultado
+
+    def put(self, start: str, end: str, resultado: Dict[str, Any]):
+        self._checar_versao()
+        chave = (start, end)
+        self._entries[chave] = (self._clock(), resultado)
+        self._entries.move_to_end(chave)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats["evictions"] += 1
+
+    def dijkstra(self, start: str, end: str) -> Dict[str, Any]:
+        """Mesmo contrato de dijkstra(graph, start, end), consultando o cache antes."""
+        resultado = self.get(start, end)
+        if resultado is None:
+            resultado = self.trees.dijkstra(start, end) if self.trees is not None else dijkstra(self.graph, start, end)
+            self.put(start, end, resultado)
+        return resultado
+
+    def summary(self) -> Dict[str, Any]:
+        """Estatísticas + ocupação (para relatórios e /health)."""
+        total = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "hit_rate": round(self.stats["hits"] / total, 4) if total else 0.0,
+        }
+
+    # === Persistência entre execuções do CLI ===
+
+    def save(self, path: Path, graph_key: str):
+        """Grava as entradas em JSON. 'graph_key' identifica a origem dos dados (arquivos, flags)."""
+        self._checar_versao()
+        agora = self._clock()
+        dados = {
+            "graph_key": graph_key,
+            "version": self._version,
+            # idade em vez de instante: o relógio monotônico não sobrevive entre processos
+            "entries": [[s, t, agora - criado, r] for (s, t), (criado, r) in self._entries.items()],
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(dados, f, ensure_ascii=False)
+
+    def load(self, path: Path, graph_key: str) -> int:
+        """Recarrega entradas salvas se vierem do mesmo grafo (mesma chave e versão). Retorna quantas."""
+        if not path.exists():
+            return 0
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                dados = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("[cache] Ignorando cache ilegível em %s: %s", path, e)
+            return 0
+        self._checar_versao()
+        if dados.get("graph_key") != graph_key or dados.get("version") != self._version:
+            logger.info("[cache] Cache em %s é de outro grafo/versão; descartado.", path)
+            return 0
+        agora = self._clock()
+        carregadas = 0
+        for s, t, idade, resultado in dados.get("entries", []):
+            if self.ttl is not None and idade > self.ttl:
+                continue
+            self._entries[(s, t)] = (agora - idade, resultado)
+            carregadas += 1
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return carregadas
+
+
+def tamanho_arvore(tree: Dict[str, Any]) -> int:
+    """Estimativa (bytes) de uma árvore: os dois dicts + um float por nó alcançado.
+
+    As chaves são os próprios nomes dos nós do grafo (compartilhados), por isso não entram na conta.
+    """
+    dist = tree["distance"]
+    return sys.getsizeof(dist) + sys.getsizeof(tree["previous"]) + 24 * len(dist)
+
+
+def tamanho_busca(busca: DijkstraSearch) -> int:
+    """Estimativa (bytes) de uma busca retomável: árvore + conjunto de fechados + heap (tuplas de 2)."""
+    return (tamanho_arvore(busca.tree()) + sys.getsizeof(busca.settled)
+            + sys.getsizeof(busca.heap) + 88 * len(busca.heap))
+
+
+class TreeCache:
+    """Cache de buscas de caminho mínimo por origem (DijkstraSearch), limitado em bytes.
+
+    Cada origem guarda o estado da sua busca: um destino já fechado sai só da reconstrução
+    do caminho, e um destino mais distante retoma a busca de onde ela parou. Ao estourar
+    'max_bytes', as origens menos usadas recentemente saem primeiro.
+
+    Mudanças de peso (Graph.update_edge_weight) e remoções de aresta (Graph.remove_edge,
+    tratadas como aumento até infinito) são reparadas incrementalmente nas buscas concluídas; buscas parciais são descartadas. Qualquer outra mutação muda a versão do
+    grafo e, como no PathCache, descarta tudo no próximo acesso.
+    """
+
+    def __init__(self, graph: Graph, max_bytes: int = 64 * 1024 * 1024):
+        self.graph = graph
+        self.max_bytes = max_bytes
+        self._searches: "OrderedDict[str, Tuple[int, DijkstraSearch]]" = OrderedDict()
+        self._bytes = 0
+        self._version = graph.version
+        self.stats: Dict[str, int] = {"hits": 0, "misses": 0, "resumes": 0, "evictions": 0, "invalidations": 0,
+                                      "repairs": 0, "repaired_nodes": 0}
+        graph.add_listener(self._ao_mudar)
+
+    def close(self):
+        """Deixa de acompanhar as mutações do grafo (e libera as buscas)."""
+        self.graph.remove_listener(self._ao_mudar)
+        self._searches.clear()
+        self._bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._searches)
+
+    def __contains__(self, source: str) -> bool:
+        self._checar_versao()
+        return source in self._searches
+
+    @property
+    def bytes_used(self) -> int:
+        return self._bytes
+
+    def _checar_versao(self):
+        if self.graph.version != self._version:
+            if self._searches:
+                self.stats["invalidations"] += 1
+            self._searches.clear()
+            self._bytes = 0
+            self._version = self.graph.version
+
+    def _ao_mudar(self, evento: str, dados: Dict[str, Any]):
+        # Só reparamos se o cache estava em dia até a mutação anterior; senão a invalidação
+        # pendente (versão diferente) continua valendo.
+        if evento not in ("weight", "remove_edge") or self._version != self.graph.version - 1 or dados["new"] < 0:
+            return
+        reparadas: "OrderedDict[str, Tuple[int, DijkstraSearch]]" = OrderedDict()
+        self._bytes = 0
+        for source, (_, busca) in self._searches.items():
+            if not busca.done:
+                continue
+            self.stats["repaired_nodes"] += busca.update_edge(dados["u"], dados["v"], dados["old"], dados["new"])
+            tamanho = tamanho_busca(busca)
+            reparadas[source] = (tamanho, busca)
+            self._bytes += tamanho
+        self._searches = reparadas
+        self._version = self.graph.version
+        self.stats["repairs"] += 1
+        while self._bytes > self.max_bytes:
+            _, (t, _) = self._searches.popitem(last=False)
+            self._bytes -= t
+            self.stats["evictions"] += 1
+
+    def _guardar(self, source: str, busca: DijkstraSearch):
+        """(Re)contabiliza o tamanho de 'busca' e aplica o orçamento (LRU)."""
+        antigo = self._searches.pop(source, None)
+        if antigo is not None:
+            self._bytes -= antigo[0]
+        tamanho = tamanho_busca(busca)
+        if tamanho > self.max_bytes:
+            return  # sozinha já estoura o orçamento: não vale a pena guardar
+        self._searches[source] = (tamanho, busca)
+        self._bytes += tamanho
+        while self._bytes > self.max_bytes:
+            _, (t, _) = self._searches.popitem(last=False)
+            self._bytes -= t
+            self.stats["evictions"] += 1
+
+    def search(self, source: str) -> DijkstraSearch:
+        """Busca retomável de 'source' (a guardada ou uma nova, ainda não registrada no orçamento)."""
+        self._checar_versao()
+        item = self._searches.get(source)
+        if item is None:
+            self.stats["misses"] += 1
+            return DijkstraSearch(self.graph, source)
+        self._searches.move_to_end(source)
+        self.stats["hits"] += 1
+        return item[1]
+
+    def get(self, source: str) -> Dict[str, Any] | None:
+        """Árvore COMPLETA de 'source', se já houver; buscas parciais não servem aqui."""
+        self._checar_versao()
+        item = self._searches.get(source)
+        if item is None or not item[1].done:
+            self.stats["misses"] += 1
+            return None
+        self._searches.move_to_end(source)
+        self.stats["hits"] += 1
+        return item[1].tree()
+
+    def put(self, source: str, tree: Dict[str, Any]):
+        """Registra uma árvore completa calculada fora (ex.: num processo do pool)."""
+        self._checar_versao()
+        self._guardar(source, DijkstraSearch.from_tree(self.graph, tree))
+
+    def tree(self, source: str) -> Dict[str, Any]:
+        """Árvore completa de 'source' (do cache ou terminando/criando a busca agora)."""
+        busca = self.search(source)
+        if not busca.done:
+            busca.run_until(None)
+            self._guardar(source, busca)
+        return busca.tree()
+
+    def dijkstra(self, start: str, end: str) -> Dict[str, Any]:
+        """Mesmo contrato de dijkstra(graph, start, end), retomando a busca salva de 'start'."""
+        if end not in self.graph.nodes_data:
+            if start not in self.graph.nodes_data:
+                raise ValueError(f"Nó de origem não encontrado no grafo: '{start}'")
+            raise ValueError(f"Nó de destino não encontrado no grafo: '{end}'")
+        busca = self.search(start)
+        fechados = busca.stats["nodes_settled"]
+        try:
+            resultado = busca.path_to(end)
+        finally:
+            if busca.stats["nodes_settled"] != fechados:
+                if fechados:
+                    self.stats["resumes"] += 1
+                self._guardar(start, busca)
+        return resultado
+
+    def summary(self) -> Dict[str, Any]:
+        return {**self.stats, "trees": len(self._searches), "bytes": self._bytes, "max_bytes": self.max_bytes}
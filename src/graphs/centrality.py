@@ -0,0 +1,541 @@
+import csv
+import heapq
+import logging
+import math
+import random
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from operator import mul
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Sequence, Tuple
+
+# numpy é opcional: acelera PageRank/autovetor; sem ele, o laço em Python puro é usado
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+logger = logging.getLogger(__name__)
+
+# Adjacência simples por índice do CSR: por nó, lista de (vizinho, peso efetivo), sem laços;
+# arestas paralelas viram uma só com o menor peso (o mesmo peso efetivo de update_edge_weight).
+Adjacencia = List[List[Tuple[int, float]]]
+
+
+def _adjacencia_simples(cg: Any, weighted: bool) -> Adjacencia:
+    targets, weights, offsets = cg.targets, cg.weights, cg.offsets
+    adj: Adjacencia = []
+    for i in range(len(cg)):
+        melhor: Dict[int, float] = {}
+        for k in range(offsets[i], offsets[i + 1]):
+            j = targets[k]
+            if j == i:
+                continue
+            w = weights[k] if weighted else 1.0
+            if weighted and w < 0:
+                raise ValueError(
+                    f"Peso negativo encontrado na aresta {cg.names[i]}-{cg.names[j]}. "
+                    "Dijkstra não é aplicável."
+                )
+            if j not in melhor or w < melhor[j]:
+                melhor[j] = w
+        adj.append(list(melhor.items()))
+    return adj
+
+
+def _brandes_bfs(adj: Adjacencia, s: int, bc: List[float]):
+    """Uma fonte do algoritmo de Brandes em grafo sem pesos (caminhos mínimos em saltos)."""
+    n = len(adj)
+    sigma = [0] * n
+    dist = [-1] * n
+    preds: List[List[int]] = [[] for _ in range(n)]
+    sigma[s] = 1
+    dist[s] = 0
+    ordem: List[int] = []
+    fila = deque([s])
+    while fila:
+        v = fila.popleft()
+        ordem.append(v)
+        dv = dist[v] + 1
+        for w, _ in adj[v]:
+            if dist[w] < 0:
+                dist[w] = dv
+                fila.append(w)
+            if dist[w] == dv:
+                sigma[w] += sigma[v]
+                preds[w].append(v)
+    _acumular_dependencias(ordem, preds, sigma, s, bc)
+
+
+def _brandes_dijkstra(adj: Adjacencia, s: int, bc: List[float]):
+    """Uma fonte do algoritmo de Brandes com pesos (Dijkstra contando caminhos mínimos)."""
+    n = len(adj)
+    inf = float('inf')
+    sigma = [0] * n
+    dist = [inf] * n
+    preds: List[List[int]] = [[] for _ in range(n)]
+    fechado = [False] * n
+    sigma[s] = 1
+    dist[s] = 0.0
+    ordem: List[int] = []
+    heap: List[Tuple[float, int]] = [(0.0, s)]
+    while heap:
+        dv, v = heapq.heappop(heap)
+        if fechado[v] or dv > dist[v]:
+            continue
+        fechado[v] = True
+        ordem.append(v)
+        for w, peso in adj[v]:
+            nova = dv + peso
+            if nova < dist[w]:
+                dist[w] = nova
+                sigma[w] = sigma[v]
+                preds[w] = [v]
+                heapq.heappush(heap, (nova, w))
+            elif nova == dist[w] and not fechado[w]:
+                sigma[w] += sigma[v]
+                preds[w].append(v)
+    _acumular_dependencias(ordem, preds, sigma, s, bc)
+
+
+def _acumular_dependencias(ordem: List[int], preds: List[List[int]], sigma: List[int], s: int, bc: List[float]):
+    # nós em ordem decrescente de distância: delta[v] = Σ sigma[v]/sigma[w] * (1 + delta[w])
+    delta = [0.0] * len(sigma)
+    while ordem:
+        w = ordem.pop()
+        coef = (1.0 + delta[w]) / sigma[w]
+        for v in preds[w]:
+            delta[v] += sigma[v] * coef
+        if w != s:
+            bc[w] += delta[w]
+
+
+def _parcial(adj: Adjacencia, weighted: bool, fontes: Sequence[int]) -> List[float]:
+    bc = [0.0] * len(adj)
+    passo = _brandes_dijkstra if weighted else _brandes_bfs
+    for s in fontes:
+        passo(adj, s, bc)
+    return bc
+
+
+# === Estado dos processos do pool (uma cópia da adjacência por processo) ===
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(adj: Adjacencia, weighted: bool):
+    """Initializer do ProcessPoolExecutor: recebe a adjacência uma vez por processo."""
+    _WORKER.update(adj=adj, weighted=weighted)
+
+
+def _parcial_no_worker(fontes: Sequence[int]) -> List[float]:
+    return _parcial(_WORKER["adj"], _WORKER["weighted"], fontes)
+
+
+def betweenness_centrality(graph: Any, weighted: bool = True, normalized: bool = True,
+                           samples: int | None = None, seed: int | None = 0,
+                           workers: int = 1) -> Dict[str, float]:
+    """Centralidade de intermediação (betweenness) de todos os nós, pelo algoritmo de Brandes.
+
+    - weighted=True usa Dijkstra sobre os pesos; False conta caminhos em número de saltos (BFS).
+    - samples=k estima a partir de k fontes sorteadas (com 'seed'), escalando por n/k.
+    - workers > 1 divide as fontes em lotes entre processos; cada processo recebe a
+      adjacência uma vez (initializer) e devolve só o vetor parcial.
+    Em grafos não dirigidos cada par é contado uma vez; normalized=True divide por
+    (n-1)(n-2) (pares ordenados que não envolvem o nó), como na definição usual.
+    """
+    if samples is not None and samples < 1:
+        raise ValueError("samples deve ser pelo menos 1.")
+    cg = graph.compact()
+    n = len(cg)
+    adj = _adjacencia_simples(cg, weighted)
+    fontes = list(range(n))
+    if samples is not None and samples < n:
+        fontes = sorted(random.Random(seed).sample(fontes, samples))
+
+    if workers > 1 and len(fontes) > 1:
+        lotes = [fontes[i::workers * 4] for i in range(min(len(fontes), workers * 4))]
+        bc = [0.0] * n
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(adj, weighted)) as pool:
+            for parcial in pool.map(_parcial_no_worker, lotes):
+                for i, valor in enumerate(parcial):
+                    bc[i] += valor
+    else:
+        bc = _parcial(adj, weighted, fontes)
+
+    escala = 1.0
+    if fontes and len(fontes) < n:
+        escala = n / len(fontes)
+    if normalized:
+        escala *= 1.0 / ((n - 1) * (n - 2)) if n > 2 else 0.0
+    elif not cg.directed:
+        escala *= 0.5
+    return {nome: bc[i] * escala for i, nome in enumerate(cg.names)}
+
+
+def ranking(valores: Dict[str, float], top: int | None = None) -> List[Tuple[str, float]]:
+    """(nó, valor) do maior para o menor valor (empates pelo nome)."""
+    ordenados = sorted(valores.items(), key=lambda item: (-item[1], item[0]))
+    return ordenados if top is None else ordenados[:top]
+
+
+def export_centrality_csv(valores: Dict[str, float], saida: Path, coluna: str = "betweenness") -> int:
+    """Grava o ranking em CSV (posicao, no, <coluna>), como export_graus_csv. Retorna quantas linhas."""
+    saida = Path(saida)
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    linhas = ranking(valores)
+    with open(saida, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["posicao", "no", coluna])
+        w.writeheader()
+        for pos, (no, valor) in enumerate(linhas, start=1):
+            w.writerow({"posicao": pos, "no": no, coluna: valor})
+    logger.info("Ranking de %s salvo em: %s", coluna, saida)
+    return len(linhas)
+
+
+# === Proximidade (closeness) e centralidade harmônica ===
+#
+# Ambas usam as distâncias a partir de cada nó (em grafos dirigidos, pelas arestas de saída):
+#   closeness(v) = (r-1)/(n-1) * (r-1)/S   (r = nós alcançados contando v, S = soma das distâncias;
+#                                           fator de Wasserman-Faust para grafos desconexos)
+#   harmonic(v)  = Σ 1/d(v, u) sobre os u alcançados
+# Cada busca só acumula (r, S, Σ 1/d): não guarda distâncias por destino além do vetor da busca.
+
+# Limitante: (alcançados, soma, soma dos inversos, menor distância ainda não fechada) -> valor máximo possível
+Limitante = Callable[[int, float, float, float], float]
+
+
+def _somas_de_fonte(adj: Adjacencia, s: int, weighted: bool,
+                    limitante: Limitante | None = None, limiar: float = 0.0) -> Tuple[int, float, float] | None:
+    """(alcançados, soma das distâncias, soma dos inversos) a partir de 's'.
+
+    Com 'limitante', a busca é abandonada (retorna None) assim que o valor máximo que 's'
+    ainda poderia atingir fica abaixo de 'limiar'.
+    """
+    n = len(adj)
+    alcancados, soma, harm = 1, 0.0, 0.0
+    if not weighted:
+        dist = [-1] * n
+        dist[s] = 0
+        nivel = [s]
+        d = 0
+        while nivel:
+            d += 1
+            proximo: List[int] = []
+            for v in nivel:
+                for w, _ in adj[v]:
+                    if dist[w] < 0:
+                        dist[w] = d
+                        proximo.append(w)
+            alcancados += len(proximo)
+            soma += d * len(proximo)
+            harm += len(proximo) / d
+            nivel = proximo
+            if limitante is not None and nivel and limitante(alcancados, soma, harm, d + 1) < limiar:
+                return None
+        return alcancados, soma, harm
+    inf = float('inf')
+    dist = [inf] * n
+    dist[s] = 0.0
+    fechado = [False] * n
+    heap: List[Tuple[float, int]] = [(0.0, s)]
+    while heap:
+        dv, v = heapq.heappop(heap)
+        if fechado[v]:
+            continue
+        fechado[v] = True
+        if v != s:
+            alcancados += 1
+            soma += dv
+            harm += 1.0 / dv if dv > 0 else 0.0
+        for w, peso in adj[v]:
+            nova = dv + peso
+            if nova < dist[w]:
+                dist[w] = nova
+                heapq.heappush(heap, (nova, w))
+        if limitante is not None and heap and heap[0][0] > 0 and limitante(alcancados, soma, harm, heap[0][0]) < limiar:
+            return None
+    return alcancados, soma, harm
+
+
+def _closeness(n: int, alcancados: int, soma: float) -> float:
+    if n < 2 or soma <= 0:
+        return 0.0
+    return (alcancados - 1) / (n - 1) * (alcancados - 1) / soma
+
+
+def _lote(adj: Adjacencia, weighted: bool, fontes: Sequence[int]) -> List[Tuple[int, int, float, float]]:
+    return [(s, *_somas_de_fonte(adj, s, weighted)) for s in fontes]
+
+
+def _lote_no_worker(fontes: Sequence[int]) -> List[Tuple[int, int, float, float]]:
+    return _lote(_WORKER["adj"], _WORKER["weighted"], fontes)
+
+
+def iter_closeness(graph: Any, weighted: bool = True, workers: int = 1,
+                   batch_size: int = 64) -> Iterator[Dict[str, Any]]:
+    """Proximidade e centralidade harmônica de cada nó, lote a lote (na ordem dos nós).
+
+    Cada item: {"no", "closeness", "harmonic", "reachable"}. Com workers > 1 os lotes
+    rodam num pool de processos e são devolvidos conforme terminam (em ordem); quem
+    consome pode gravá-los em disco sem juntar tudo em memória.
+    """
+    cg = graph.compact()
+    n = len(cg)
+    adj = _adjacencia_simples(cg, weighted)
+    lotes = [range(i, min(i + batch_size, n)) for i in range(0, n, batch_size)]
+
+    def _itens(resultados):
+        for lote in resultados:
+            for s, alcancados, soma, harm in lote:
+                yield {"no": cg.names[s], "closeness": _closeness(n, alcancados, soma),
+                       "harmonic": harm, "reachable": alcancados}
+
+    if workers > 1 and len(lotes) > 1:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(adj, weighted)) as pool:
+            yield from _itens(pool.map(_lote_no_worker, lotes))
+    else:
+        yield from _itens(_lote(adj, weighted, lote) for lote in lotes)
+
+
+def closeness_centrality(graph: Any, weighted: bool = True, workers: int = 1, batch_size: int = 64,
+                         saida: Path | None = None) -> Dict[str, Dict[str, float]]:
+    """Proximidade e harmônica de todos os nós: {nó: {"closeness", "harmonic", "reachable"}}.
+
+    Com 'saida', cada linha é gravada em CSV (no, closeness, harmonic, reachable) assim que
+    o seu lote termina.
+    """
+    resultado: Dict[str, Dict[str, float]] = {}
+    itens = iter_closeness(graph, weighted=weighted, workers=workers, batch_size=batch_size)
+    if saida is None:
+        for item in itens:
+            resultado[item.pop("no")] = item
+        return resultado
+    saida = Path(saida)
+    saida.parent.mkdir(parents=True, exist_ok=True)
+    with open(saida, "w", encoding="utf-8", newline="") as f:
+        w = csv.DictWriter(f, fieldnames=["no", "closeness", "harmonic", "reachable"])
+        w.writeheader()
+        for item in itens:
+            w.writerow(item)
+            resultado[item.pop("no")] = item
+    logger.info("Proximidade/harmônica salvas em: %s", saida)
+    return resultado
+
+
+def _alcance_maximo(adj: Adjacencia) -> List[int]:
+    # tamanho da componente (fraca, em dirigidos) de cada nó: ninguém alcança mais que isso
+    n = len(adj)
+    nao_dirigida: List[List[int]] = [[] for _ in range(n)]
+    for v in range(n):
+        for w, _ in adj[v]:
+            nao_dirigida[v].append(w)
+            nao_dirigida[w].append(v)
+    comp = [-1] * n
+    tamanhos: List[int] = []
+    for inicio in range(n):
+        if comp[inicio] >= 0:
+            continue
+        c = len(tamanhos)
+        comp[inicio] = c
+        pilha = [inicio]
+        total = 0
+        while pilha:
+            v = pilha.pop()
+            total += 1
+            for w in nao_dirigida[v]:
+                if comp[w] < 0:
+                    comp[w] = c
+                    pilha.append(w)
+        tamanhos.append(total)
+    return [tamanhos[comp[v]] for v in range(n)]
+
+
+def top_k_closeness(graph: Any, k: int = 20, measure: str = "harmonic",
+                    weighted: bool = True) -> List[Tuple[str, float]]:
+    """Os k nós de maior proximidade ('closeness') ou centralidade harmônica, sem calcular todos.
+
+    Os nós são visitados do maior para o menor grau. Depois que há k candidatos, cada busca
+    é abandonada quando nem os nós ainda não alcançados (todos à distância mínima da
+    fronteira, até o tamanho da componente) conseguiriam levá-la ao k-ésimo valor.
+    Os valores devolvidos são exatos; empates no k-ésimo lugar podem ficar de fora.
+    """
+    if measure not in ("harmonic", "closeness"):
+        raise ValueError(f"Medida inválida: '{measure}' (use 'harmonic' ou 'closeness')")
+    cg = graph.compact()
+    n = len(cg)
+    adj = _adjacencia_simples(cg, weighted)
+    rmax = _alcance_maximo(adj)
+    melhores: List[Tuple[float, int]] = []  # heap mínimo com os k melhores (valor, -índice)
+    for v in sorted(range(n), key=lambda i: -len(adj[i])):
+        limitante: Limitante | None = None
+        limiar = 0.0
+        if len(melhores) >= k:
+            limiar = melhores[0][0]
+            r_max = rmax[v]
+            if measure == "harmonic":
+                def limitante(r, soma, harm, fronteira, r_max=r_max):
+                    return harm + (r_max - r) / fronteira
+            else:
+                # (r-1)^2 / ((n-1)(S + (r-R)·fronteira)) tem máximo num dos extremos r = R ou r = r_max
+                def limitante(r, soma, harm, fronteira, r_max=r_max):
+                    return max(_closeness(n, r, soma), _closeness(n, r_max, soma + (r_max - r) * fronteira))
+        somas = _somas_de_fonte(adj, v, weighted, limitante, limiar)
+        if somas is None:
+            continue
+        alcancados, soma, harm = somas
+        valor = harm if measure == "harmonic" else _closeness(n, alcancados, soma)
+        if len(melhores) < k:
+            heapq.heappush(melhores, (valor, -v))
+        elif valor > melhores[0][0]:
+            heapq.heapreplace(melhores, (valor, -v))
+    return [(cg.names[-i], valor) for valor, i in sorted(melhores, key=lambda item: (-item[0], cg.names[-item[1]]))]
+
+
+# === PageRank e centralidade de autovetor (iteração de potência sobre o CSR) ===
+
+def _entradas_por_destino(cg: Any, weighted: bool) -> Tuple[List[List[int]], List[List[float]], List[float]]:
+    """CSR "invertido": por destino, as origens e os pesos das entradas de adj; e o peso de saída de cada nó."""
+    n = len(cg)
+    origens: List[List[int]] = [[] for _ in range(n)]
+    pesos: List[List[float]] = [[] for _ in range(n)]
+    saida = [0.0] * n
+    targets, weights, offsets = cg.targets, cg.weights, cg.offsets
+    for u in range(n):
+        for k in range(offsets[u], offsets[u + 1]):
+            w = weights[k] if weighted else 1.0
+            if w < 0:
+                raise ValueError(f"Peso negativo encontrado na aresta {cg.names[u]}-{cg.names[targets[k]]}.")
+            origens[targets[k]].append(u)
+            pesos[targets[k]].append(w)
+            saida[u] += w
+    return origens, pesos, saida
+
+
+def _vetor(cg: Any, valores: Dict[str, float] | None, nome: str) -> List[float]:
+    # dict nó -> peso (normalizado para somar 1); None = uniforme
+    n = len(cg)
+    if valores is None:
+        return [1.0 / n] * n
+    vetor = [0.0] * n
+    for no, v in valores.items():
+        if no not in cg.index:
+            raise ValueError(f"Nó não encontrado no grafo: '{no}'")
+        vetor[cg.index[no]] = float(v)
+    total = sum(vetor)
+    if total <= 0:
+        raise ValueError(f"O vetor '{nome}' precisa ter soma positiva.")
+    return [v / total for v in vetor]
+
+
+def pagerank(graph: Any, damping: float = 0.85, personalization: Dict[str, float] | None = None,
+             dangling: Dict[str, float] | None = None, weighted: bool = True, tol: float = 1e-6,
+             max_iter: int = 100, backend: str = "auto") -> Dict[str, Any]:
+    """PageRank por iteração de potência.
+
+    - A probabilidade de ir de u para v é o peso das entradas u->v dividido pelo peso de
+      saída de u (com weighted=False, cada entrada vale 1; arestas paralelas somam).
+    - personalization: para onde o salto aleatório (1 - damping) leva (padrão: uniforme).
+    - dangling: como redistribuir o valor dos nós sem saída (padrão: a personalização).
+    - Para quando a variação L1 entre iterações fica abaixo de n * tol.
+    backend: "numpy", "python" ou "auto" (numpy se instalado).
+    Retorna {"scores", "iterations", "converged", "delta", "backend"}.
+    """
+    if max_iter < 1:
+        raise ValueError("max_iter deve ser pelo menos 1.")
+    cg = graph.compact()
+    n = len(cg)
+    if n == 0:
+        return {"scores": {}, "iterations": 0, "converged": True, "delta": 0.0, "backend": "python"}
+    origens, pesos, saida = _entradas_por_destino(cg, weighted)
+    pers = _vetor(cg, personalization, "personalization")
+    dang = _vetor(cg, dangling, "dangling") if dangling is not None else pers
+    sem_saida = [u for u in range(n) if saida[u] == 0]
+    # probabilidade de cada entrada: peso / peso de saída da origem; origens com peso de saída 0
+    # (só arestas de peso 0) são pendentes e redistribuem tudo por 'dang'
+    probs = [[w / saida[u] if saida[u] else 0.0 for u, w in zip(us, ws)] for us, ws in zip(origens, pesos)]
+
+    usar_numpy = backend == "numpy" or (backend == "auto" and np is not None)
+    if usar_numpy and np is None:
+        raise ValueError("backend='numpy' pedido, mas o numpy não está instalado.")
+    x = [1.0 / n] * n
+    if usar_numpy:
+        src = np.fromiter((u for us in origens for u in us), dtype=np.int64)
+        dst = np.repeat(np.arange(n), [len(us) for us in origens])
+        p = np.fromiter((q for qs in probs for q in qs), dtype=float)
+        pers_a, dang_a = np.asarray(pers), np.asarray(dang)
+        sem_saida_a = np.asarray(sem_saida, dtype=np.int64)
+        xa = np.asarray(x)
+        for it in range(1, max_iter + 1):
+            novo = damping * np.bincount(dst, weights=xa[src] * p, minlength=n)
+            novo += damping * xa[sem_saida_a].sum() * dang_a + (1.0 - damping) * pers_a
+            delta = float(np.abs(novo - xa).sum())
+            xa = novo
+            if delta < n * tol:
+                break
+        x = xa.tolist()
+    else:
+        for it in range(1, max_iter + 1):
+            perdido = damping * sum(x[u] for u in sem_saida)
+            get = x.__getitem__
+            novo = [damping * sum(map(mul, map(get, us), qs)) + perdido * dv + (1.0 - damping) * pv
+                    for us, qs, dv, pv in zip(origens, probs, dang, pers)]
+            delta = sum(abs(a - b) for a, b in zip(novo, x))
+            x = novo
+            if delta < n * tol:
+                break
+    convergiu = delta < n * tol
+    if not convergiu:
+        logger.warning("[pagerank] não convergiu em %d iterações (variação %.3g)", max_iter, delta)
+    return {"scores": dict(zip(cg.names, x)), "iterations": it, "converged": convergiu,
+            "delta": delta, "backend": "numpy" if usar_numpy else "python"}
+
+
+def eigenvector_centrality(graph: Any, weighted: bool = True, tol: float = 1e-6, max_iter: int = 100,
+                           backend: str = "auto") -> Dict[str, Any]:
+    """Centralidade de autovetor por iteração de potência (x <- x + Aᵀx, normalizado em L2).
+
+    Em grafos dirigidos conta o que CHEGA a cada nó (autovetor à esquerda). Somar x a cada
+    passo evita a oscilação de grafos bipartidos sem mudar o autovetor dominante.
+    Retorna {"scores", "iterations", "converged", "delta", "backend"}, como pagerank.
+    """
+    if max_iter < 1:
+        raise ValueError("max_iter deve ser pelo menos 1.")
+    cg = graph.compact()
+    n = len(cg)
+    if n == 0:
+        return {"scores": {}, "iterations": 0, "converged": True, "delta": 0.0, "backend": "python"}
+    origens, pesos, _ = _entradas_por_destino(cg, weighted)
+    usar_numpy = backend == "numpy" or (backend == "auto" and np is not None)
+    if usar_numpy and np is None:
+        raise ValueError("backend='numpy' pedido, mas o numpy não está instalado.")
+    x = [1.0 / n] * n
+    if usar_numpy:
+        src = np.fromiter((u for us in origens for u in us), dtype=np.int64)
+        dst = np.repeat(np.arange(n), [len(us) for us in origens])
+        w = np.fromiter((p for ps in pesos for p in ps), dtype=float)
+        xa = np.asarray(x)
+        for it in range(1, max_iter + 1):
+            novo = xa + np.bincount(dst, weights=xa[src] * w, minlength=n)
+            norma = float(np.sqrt((novo * novo).sum())) or 1.0
+            novo /= norma
+            delta = float(np.abs(novo - xa).sum())
+            xa = novo
+            if delta < n * tol:
+                break
+        x = xa.tolist()
+    else:
+        for it in range(1, max_iter + 1):
+            get = x.__getitem__
+            novo = [xv + sum(map(mul, map(get, us), ws)) for xv, us, ws in zip(x, origens, pesos)]
+            norma = math.sqrt(sum(v * v for v in novo)) or 1.0
+            novo = [v / norma for v in novo]
+            delta = sum(abs(a - b) for a, b in zip(novo, x))
+            x = novo
+            if delta < n * tol:
+                break
+    convergiu = delta < n * tol
+    if not convergiu:
+        logger.warning("[autovetor] não convergiu em %d iterações (variação %.3g)", max_iter, delta)
+    return {"scores": dict(zip(cg.names, x)), "iterations": it, "converged": convergiu,
+            "delta": delta, "backend": "numpy" if usar_numpy else "python"}
@@ -0,0 +1,69 @@
+from typing import Any, Dict, List
+
+
+class CompactGraph:
+    """Cópia inteira (CSR) das listas de adjacência de um Graph, congelada em 'version'.
+
+    Os nós viram índices 0..n-1 (na ordem de inserção do grafo) e as entradas de adj
+    ficam em três listas planas: offsets, targets e weights, com as arestas de i em
+    targets[offsets[i]:offsets[i+1]] na mesma ordem de adj[nome]. Algoritmos de varredura
+    global (triângulos, métricas de grupo, centralidades) trabalham sobre inteiros em vez
+    de dicts por aresta.
+
+    Não acompanha mutações: use Graph.compact(), que reconstrói quando a versão muda.
+    """
+
+    def __init__(self, graph: Any):
+        self.version = graph.version
+        self.directed = graph.directed
+        self.names: List[str] = list(graph.adj)
+        self.index: Dict[str, int] = {nome: i for i, nome in enumerate(self.names)}
+        offsets = [0]
+        targets: List[int] = []
+        weights: List[float] = []
+        index = self.index
+        for nome in self.names:
+            for e in graph.adj[nome]:
+                targets.append(index[e["node"]])
+                weights.append(e["weight"])
+            offsets.append(len(targets))
+        self.offsets = offsets
+        self.targets = targets
+        self.weights = weights
+        self._mult: List[Dict[int, int]] | None = None
+        self._simples: List[set] | None = None
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def neighbors(self, i: int) -> List[int]:
+        return self.targets[self.offsets[i]:self.offsets[i + 1]]
+
+    def degree(self, i: int) -> int:
+        return self.offsets[i + 1] - self.offsets[i]
+
+    def multiplicities(self) -> List[Dict[int, int]]:
+        """Por nó: vizinho -> quantas entradas de adj apontam para ele (arestas paralelas)."""
+        if self._mult is None:
+            mult: List[Dict[int, int]] = []
+            targets, offsets = self.targets, self.offsets
+            for i in range(len(self.names)):
+                m: Dict[int, int] = {}
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    m[j] = m.get(j, 0) + 1
+                mult.append(m)
+            self._mult = mult
+        return self._mult
+
+    def simple_neighbors(self) -> List[set]:
+        """Vizinhos no grafo simples não dirigido subjacente (sem laços nem paralelas)."""
+        if self._simples is None:
+            viz: List[set] = [set() for _ in self.names]
+            targets, offsets = self.targets, self.offsets
+            for i in range(len(self.names)):
+                for j in targets[offsets[i]:offsets[i + 1]]:
+                    if j != i:
+                        viz[i].add(j)
+                        viz[j].add(i)
+            self._simples = viz
+        return self._simples
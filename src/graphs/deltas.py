@@ -0,0 +1,148 @@
+import csv
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, Iterator, Tuple
+
+try:
+    from .graph import Graph
+except ImportError:
+    from graph import Graph
+
+logger = logging.getLogger(__name__)
+
+# Log de mudanças (append-only) de rotas, em CSV ou JSONL (uma operação por linha):
+#   op          add | remove | reweight
+#   source      aeroporto de origem
+#   destination aeroporto de destino
+#   weight      obrigatório em reweight; opcional em add (padrão 1.0)
+#   airline, stops, equipment  dados da rota (em remove, filtram quais paralelas saem)
+# Exemplo CSV:
+#   op,source,destination,weight,airline,stops,equipment
+#   add,REC,GRU,2.5,G3,0,738
+#   reweight,REC,GRU,3.0,,,
+#   remove,REC,GRU,,G3,,
+DELTA_OPS = ("add", "remove", "reweight")
+DELTA_FIELDS = ("op", "source", "destination", "weight", "airline", "stops", "equipment")
+DATA_FIELDS = ("airline", "stops", "equipment")
+
+# Snapshot no mesmo formato do data/routes.csv (lido por Graph.load_routes_csv)
+SNAPSHOT_FIELDS = ("airline", "source airport", "destination apirport", "stops", "equipment", "weight")
+
+
+def _normalizar(bruto: Dict[str, Any], seq: int) -> Dict[str, Any]:
+    op = str(bruto.get("op") or "").strip().lower()
+    if op not in DELTA_OPS:
+        raise ValueError(f"op inválida: '{op}'")
+    u = str(bruto.get("source") or "").strip()
+    v = str(bruto.get("destination") or "").strip()
+    if not u or not v:
+        raise ValueError("source/destination vazios")
+    peso_raw = bruto.get("weight")
+    peso = None if peso_raw is None or str(peso_raw).strip() == "" else float(peso_raw)
+    if op == "reweight" and peso is None:
+        raise ValueError("reweight sem weight")
+    dados = {k: str(bruto[k]).strip() for k in DATA_FIELDS if bruto.get(k) not in (None, "")}
+    return {"seq": seq, "op": op, "source": u, "destination": v, "weight": peso, "data": dados}
+
+
+def iter_deltas(path: Path, start: int = 0) -> Iterator[Dict[str, Any]]:
+    """Lê o log de deltas (.csv ou .jsonl) linha a linha, pulando as 'start' primeiras operações.
+
+    Cada item: {"seq", "op", "source", "destination", "weight", "data"}; 'seq' é a posição
+    (1, 2, ...) no log, inclusive das linhas inválidas, que são puladas com aviso.
+    """
+    path = Path(path)
+    with open(path, "r", encoding="utf-8", newline="") as f:
+        if path.suffix.lower() == ".jsonl":
+            linhas = (json.loads(l) if l.strip() else None for l in f)
+        else:
+            linhas = csv.DictReader(f)
+        seq = 0
+        for bruto in linhas:
+            if bruto is None:
+                continue
+            seq += 1
+            if seq <= start:
+                continue
+            try:
+                yield _normalizar(bruto, seq)
+            except (ValueError, TypeError) as e:
+                logger.warning("[deltas] %s:%d ignorado: %s", path.name, seq, e)
+
+
+def append_delta(path: Path, op: str, source: str, destination: str, weight: float | None = None, **data):
+    """Acrescenta uma operação ao log (cria o arquivo, com cabeçalho no caso do CSV)."""
+    path = Path(path)
+    registro = _normalizar({"op": op, "source": source, "destination": destination, "weight": weight, **data}, 0)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".jsonl":
+        linha = {k: registro[k] for k in ("op", "source", "destination")}
+        if registro["weight"] is not None:
+            linha["weight"] = registro["weight"]
+        linha.update(registro["data"])
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(linha, ensure_ascii=False) + "\n")
+        return
+    novo = not path.exists() or path.stat().st_size == 0
+    with open(path, "a", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=DELTA_FIELDS)
+        if novo:
+            writer.writeheader()
+        writer.writerow({"op": registro["op"], "source": source, "destination": destination,
+                         "weight": "" if registro["weight"] is None else registro["weight"], **registro["data"]})
+
+
+# === Snapshots: grafo materializado + quantas operações do log já estão nele ===
+
+def _meta_path(snapshot: Path) -> Path:
+    return snapshot.with_name(snapshot.name + ".meta.json")
+
+
+def write_snapshot(graph: Graph, path: Path, deltas_applied: int = 0) -> int:
+    """Grava o grafo no formato de routes.csv (uma linha por aresta) e o metadado do log.
+
+    Em grafos não dirigidos cada aresta aparece duas vezes na adjacência; as duas entradas
+    compartilham o dict de dados, que é usado para gravar cada aresta uma única vez.
+    Retorna quantas arestas foram gravadas.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    vistos: set = set()
+    linhas = 0
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=SNAPSHOT_FIELDS)
+        writer.writeheader()
+        for u, vizinhos in graph.adj.items():
+            for e in vizinhos:
+                if not graph.directed:
+                    if id(e["data"]) in vistos:
+                        continue
+                    vistos.add(id(e["data"]))
+                dados = e["data"]
+                writer.writerow({
+                    "airline": dados.get("airline") or "",
+                    "source airport": u,
+                    "destination apirport": e["node"],
+                    "stops": dados.get("stops") or "",
+                    "equipment": dados.get("equipment") or "",
+                    "weight": e["weight"],
+                })
+                linhas += 1
+    with open(_meta_path(path), "w", encoding="utf-8") as f:
+        json.dump({"deltas_applied": deltas_applied, "directed": graph.directed, "edges": linhas}, f)
+    return linhas
+
+
+def load_snapshot(path: Path, directed: bool = False) -> Tuple[Graph, int]:
+    """Carrega um snapshot gravado por write_snapshot. Retorna (grafo, deltas já aplicados)."""
+    path = Path(path)
+    meta: Dict[str, Any] = {}
+    if _meta_path(path).exists():
+        with open(_meta_path(path), "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("directed", directed) != directed:
+            raise ValueError(f"Snapshot {path} foi gravado com directed={meta.get('directed')}")
+    g = Graph(directed=directed, weighted=True)
+    g.load_routes_csv(path)
+    return g, int(meta.get("deltas_applied", 0))
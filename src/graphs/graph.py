@@ -1,12 +1,74 @@
 import csv
+import heapq
+import logging
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 import json
 
+try:
+    from .resolver import NameResolver
+    from .compact import CompactGraph
+    from .metrics import ego_metrics_all, group_metrics
+    from .subgraph import SubgraphView
+except ImportError:
+    from resolver import NameResolver
+    from compact import CompactGraph
+    from metrics import ego_metrics_all, group_metrics
+    from subgraph import SubgraphView
+
+# Logger do módulo: sem handler próprio, quem decide o que aparece é a aplicação (CLI/solve).
+logger = logging.getLogger(__name__)
+
 REPO_ROOT = Path(__file__).resolve().parents[2]
 OUT_DIR = REPO_ROOT / "out"
 
 
+class _IndiceGraus:
+
+    # Baldes grau -> nós, atualizados a cada mudança de grau: top-k e distribuição sem
+    # varrer/ordenar todos os nós. Empates seguem a ordem de inserção dos nós (como um
+    # sorted() estável sobre nodes_data).
+
+    def __init__(self):
+        self.grau: Dict[str, int] = {}
+        self.baldes: Dict[int, set] = {}
+        self.ordem: Dict[str, int] = {}
+        self._proximo = 0
+
+    def atualizar(self, node: str, novo: int):
+        antigo = self.grau.get(node)
+        if antigo == novo:
+            return
+        if antigo is None:
+            self.ordem[node] = self._proximo
+            self._proximo += 1
+        else:
+            self._tirar_do_balde(node, antigo)
+        self.grau[node] = novo
+        self.baldes.setdefault(novo, set()).add(node)
+
+    def remover(self, node: str):
+        antigo = self.grau.pop(node, None)
+        if antigo is not None:
+            self._tirar_do_balde(node, antigo)
+            del self.ordem[node]
+
+    def _tirar_do_balde(self, node: str, grau: int):
+        balde = self.baldes[grau]
+        balde.discard(node)
+        if not balde:
+            del self.baldes[grau]
+
+    def top(self, k: int) -> List[tuple]:
+        resultado: List[tuple] = []
+        for grau in sorted(self.baldes, reverse=True):
+            falta = k - len(resultado)
+            if falta <= 0:
+                break
+            resultado.extend((n, grau) for n in heapq.nsmallest(falta, self.baldes[grau], key=self.ordem.__getitem__))
+        return resultado
+
+
 class Graph:
 
     # Representa o grafo usando uma lista de adjacência.
@@ -24,7 +86,37 @@ class Graph:
         self.nodes_data: Dict[str, Dict[str, Any]] = {}
         self.adj: Dict[str, List[Dict[str, Any]]] = {}
 
-        print("Instância do Grafo criada.")
+        # Resolvedor de nomes canônicos: construído sob demanda e mantido em add_node
+        self._resolver: NameResolver | None = None
+
+        # Versão do grafo: incrementada a cada mutação (caches comparam para se invalidar)
+        self.version = 0
+
+        # Ouvintes de mutações que sabem se reajustar (ex.: TreeCache) em vez de se invalidar
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+        # Total de entradas nas listas de adjacência (num_edges em O(1))
+        self._entradas = 0
+
+        # Grau de entrada (só dirigidos; nos não dirigidos entrada = saída = len(adj[v]))
+        self._in_deg: Dict[str, int] = {}
+
+        # Índices de grau por modo ("out", "in", "total"): criados no primeiro top-k/distribuição
+        self._indices_grau: Dict[str, _IndiceGraus] = {}
+
+        # Adjacência reversa (só dirigidos) v -> {u: [entradas de adj[u] que apontam para v]}:
+        # construída na primeira consulta de predecessores e mantida a cada inserção/remoção.
+        # Guarda as próprias entradas de adj, então pesos alterados ficam visíveis dos dois lados.
+        self._radj: Dict[str, Dict[str, List[Dict[str, Any]]]] | None = None
+
+        # Representação inteira (CSR) para varreduras globais, refeita quando a versão muda
+        self._compact: CompactGraph | None = None
+
+        # Índice de posições u -> {v: [índices em adj[u]]}: construído na primeira remoção
+        # e mantido por add_edge/remove_* (remoção por troca com o último, O(1) amortizado)
+        self._pos: Dict[str, Dict[str, List[int]]] | None = None
+
+        logger.debug("Instância do Grafo criada.")
 
     # === Métricas genéricas (para a Parte 2) ===
 
@@ -37,18 +129,95 @@ class Graph:
 
         # - Se o grafo é dirigido, conta todas as entradas da lista de adjacência.
         # - Se não é dirigido, divide por 2 (basicamentecada aresta aparece duas vezes).
+        # O total é mantido por add_edge/remove_edge/remove_node.
 
-        total = sum(len(vizinhos) for vizinhos in self.adj.values())
+        total = self._entradas
         return total if self.directed else total // 2
 
-    def degrees(self) -> Dict[str, int]:
-        return {v: len(vizinhos) for v, vizinhos in self.adj.items()}
+    def degree(self, node_name: str, mode: str = "out") -> int:
+
+        # Grau em O(1). mode: "out" (len(adj), o mesmo de get_grau), "in" ou "total".
+        # Em grafos não dirigidos os três coincidem.
+
+        if mode not in ("out", "in", "total"):
+            raise ValueError(f"Modo de grau desconhecido: '{mode}' (use 'out', 'in' ou 'total')")
+        if node_name not in self.adj:
+            return 0
+        saida = len(self.adj[node_name])
+        if not self.directed or mode == "out":
+            return saida
+        if mode == "in":
+            return self._in_deg[node_name]
+        return saida + self._in_deg[node_name]
+
+    def degrees(self, mode: str = "out") -> Dict[str, int]:
+        return {v: self.degree(v, mode) for v in self.adj}
+
+    def degree_distribution(self, mode: str = "out") -> Dict[int, int]:
+        # grau -> quantidade de nós, em ordem crescente de grau (lida dos baldes do índice)
+        baldes = self._indice_grau(mode).baldes
+        return {d: len(baldes[d]) for d in sorted(baldes)}
+
+    def top_k_degree(self, k: int = 10, mode: str = "out") -> List[tuple]:
+
+        # [(nó, grau)] dos k maiores graus; empates pela ordem de inserção dos nós.
+        # Equivale a sorted(..., key=grau, reverse=True)[:k], sem ordenar todos os nós.
 
-    def degree_distribution(self) -> Dict[int, int]:
-        dist: Dict[int, int] = {}
-        for d in self.degrees().values():
-            dist[d] = dist.get(d, 0) + 1
-        return dist
+        return self._indice_grau(mode).top(k)
+
+    def compact(self) -> CompactGraph:
+        # Cópia CSR da versão atual (reaproveitada enquanto o grafo não mudar)
+        if self._compact is None or self._compact.version != self.version:
+            self._compact = CompactGraph(self)
+        return self._compact
+
+    def subgraph(self, nodes: Iterable[str]) -> SubgraphView:
+
+        # Vista do subgrafo induzido por 'nodes' (sem cópia): aceita em todos os algoritmos
+        # de algorithms.py e nas métricas. Ver subgraph.SubgraphView.
+
+        return SubgraphView(self, nodes)
+
+    def in_edges(self, node_name: str) -> List[tuple]:
+
+        # [(u, entrada)] das arestas que chegam em node_name; 'entrada' é o dict de adj[u]
+        # ({"node", "weight", "data"}). Em não dirigidos são as próprias arestas do nó.
+
+        if not self.directed:
+            return [(e["node"], e) for e in self.adj.get(node_name, [])]
+        return [(u, e) for u, entradas in self._reverso().get(node_name, {}).items() for e in entradas]
+
+    def predecessors(self, node_name: str) -> List[str]:
+
+        # Nós com aresta para node_name (sem repetição, mesmo com arestas paralelas).
+
+        if not self.directed:
+            return list(dict.fromkeys(e["node"] for e in self.adj.get(node_name, [])))
+        return list(self._reverso().get(node_name, {}))
+
+    def _reverso(self) -> Dict[str, Dict[str, List[Dict[str, Any]]]]:
+        if self._radj is None:
+            radj: Dict[str, Dict[str, List[Dict[str, Any]]]] = {v: {} for v in self.adj}
+            for u, vizinhos in self.adj.items():
+                for e in vizinhos:
+                    radj[e["node"]].setdefault(u, []).append(e)
+            self._radj = radj
+        return self._radj
+
+    def _indice_grau(self, mode: str) -> _IndiceGraus:
+        indice = self._indices_grau.get(mode)
+        if indice is None:
+            if mode not in ("out", "in", "total"):
+                raise ValueError(f"Modo de grau desconhecido: '{mode}' (use 'out', 'in' ou 'total')")
+            indice = _IndiceGraus()
+            for v in self.adj:
+                indice.atualizar(v, self.degree(v, mode))
+            self._indices_grau[mode] = indice
+        return indice
+
+    def _grau_mudou(self, node_name: str):
+        for mode, indice in self._indices_grau.items():
+            indice.atualizar(node_name, self.degree(node_name, mode))
 
     # === Operações básicas de construção ===
 
@@ -57,6 +226,17 @@ class Graph:
         if node_name not in self.nodes_data:
             self.nodes_data[node_name] = kwargs
             self.adj[node_name] = []
+            if self.directed:
+                self._in_deg[node_name] = 0
+            if self._radj is not None:
+                self._radj[node_name] = {}
+            if self._pos is not None:
+                self._pos[node_name] = {}
+            if self._indices_grau:
+                self._grau_mudou(node_name)
+            self.version += 1
+            if self._resolver is not None:
+                self._resolver.add(node_name)
 
     def add_edge(self, u: str, v: str, weight: float = 1.0, **kwargs):
 
@@ -71,11 +251,233 @@ class Graph:
         if not self.weighted:
             weight = 1.0
 
-        self.adj[u].append({"node": v, "weight": weight, "data": edge_data})
+        if self._pos is None and self._radj is None and not self._indices_grau:
+            # caminho rápido da carga: sem índices para manter, só listas e contadores
+            self.adj[u].append({"node": v, "weight": weight, "data": edge_data})
+            if self.directed:
+                self._in_deg[v] += 1
+                self._entradas += 1
+            else:
+                # Se não for dirigido, duplica a aresta no sentido contrário
+                self.adj[v].append({"node": u, "weight": weight, "data": edge_data})
+                self._entradas += 2
+        else:
+            self._anexar(u, {"node": v, "weight": weight, "data": edge_data})
+            if not self.directed:
+                self._anexar(v, {"node": u, "weight": weight, "data": edge_data})
+
+        self.version += 1
+
+    def update_edge_weight(self, u: str, v: str, weight: float) -> float:
+
+        # Troca o peso de u->v (todas as arestas paralelas; também v->u se não dirigido).
+        # Retorna o peso efetivo anterior (o menor entre as paralelas), que é o que os
+        # caminhos mínimos enxergavam. Incrementa a versão uma única vez e avisa os ouvintes.
 
-        # Se não for dirigido, duplica a aresta no sentido contrário
-        if not self.directed:
-            self.adj[v].append({"node": u, "weight": weight, "data": edge_data})
+        if not self.weighted:
+            weight = 1.0
+        arestas = self._arestas_entre(u, v)
+        if not arestas:
+            raise ValueError(f"Aresta não encontrada no grafo: '{u}' -> '{v}'")
+        anterior = min(e["weight"] for e in arestas)
+        for e in arestas:
+            e["weight"] = weight
+        if not self.directed and u != v:
+            for e in self._arestas_entre(v, u):
+                e["weight"] = weight
+        self.version += 1
+        self._notificar("weight", u=u, v=v, old=anterior, new=weight)
+        return anterior
+
+    # === Remoção (índice de posições + troca com o último) ===
+
+    def _anexar(self, u: str, entrada: Dict[str, Any]):
+        lista = self.adj[u]
+        if self._pos is not None:
+            self._pos[u].setdefault(entrada["node"], []).append(len(lista))
+        lista.append(entrada)
+        self._entradas += 1
+        if self.directed:
+            self._in_deg[entrada["node"]] += 1
+            if self._radj is not None:
+                self._radj[entrada["node"]].setdefault(u, []).append(entrada)
+        if self._indices_grau:
+            self._grau_mudou(u)
+            self._grau_mudou(entrada["node"])
+
+    def _indice(self) -> Dict[str, Dict[str, List[int]]]:
+        if self._pos is None:
+            self._pos = {}
+            for u, vizinhos in self.adj.items():
+                posicoes: Dict[str, List[int]] = {}
+                for i, e in enumerate(vizinhos):
+                    posicoes.setdefault(e["node"], []).append(i)
+                self._pos[u] = posicoes
+        return self._pos
+
+    def _arestas_entre(self, u: str, v: str) -> List[Dict[str, Any]]:
+        if self._pos is not None:
+            lista = self.adj.get(u, [])
+            return [lista[i] for i in self._pos.get(u, {}).get(v, [])]
+        return [e for e in self.adj.get(u, []) if e["node"] == v]
+
+    def _retirar(self, u: str, i: int) -> Dict[str, Any]:
+        # Remove adj[u][i] em O(1): o último elemento ocupa a vaga (a ordem da lista muda)
+        lista = self.adj[u]
+        posicoes = self._indice()[u]
+        entrada = lista[i]
+        ultimo = len(lista) - 1
+        if i != ultimo:
+            movida = lista[ultimo]
+            lista[i] = movida
+            ps = posicoes[movida["node"]]
+            ps[ps.index(ultimo)] = i
+        lista.pop()
+        # se a movida era paralela à removida, 'i' aparece duas vezes e sobra uma
+        ps = posicoes[entrada["node"]]
+        ps.remove(i)
+        if not ps:
+            del posicoes[entrada["node"]]
+        self._entradas -= 1
+        if self.directed:
+            self._in_deg[entrada["node"]] -= 1
+            if self._radj is not None:
+                entradas = self._radj[entrada["node"]][u]
+                del entradas[next(j for j, e in enumerate(entradas) if e is entrada)]
+                if not entradas:
+                    del self._radj[entrada["node"]][u]
+        if self._indices_grau:
+            self._grau_mudou(u)
+            self._grau_mudou(entrada["node"])
+        return entrada
+
+    def remove_edge(self, u: str, v: str, count: int | None = None, **match) -> int:
+
+        # Remove arestas u->v (todas as paralelas, ou só 'count' delas) e, se não dirigido,
+        # as entradas espelhadas em adj[v]. 'match' restringe às arestas cujos dados batem
+        # (ex.: airline="G3" cancela só a rota daquela companhia). Retorna quantas saíram.
+
+        def _candidatas() -> List[int]:
+            lista = self.adj[u]
+            return [i for i in self._indice().get(u, {}).get(v, [])
+                    if all(lista[i]["data"].get(k) == val for k, val in match.items())]
+
+        posicoes = _candidatas() if u in self.adj else []
+        if not posicoes:
+            raise ValueError(f"Aresta não encontrada no grafo: '{u}' -> '{v}'")
+        anterior = min(self.adj[u][i]["weight"] for i in self._pos[u][v])
+        removidas = 0
+        while posicoes and (count is None or removidas < count):
+            entrada = self._retirar(u, max(posicoes))
+            if not self.directed:
+                self._retirar_espelho(v, u, entrada["data"])
+            removidas += 1
+            posicoes = _candidatas()
+        restantes = self._arestas_entre(u, v)
+        self.version += 1
+        self._notificar("remove_edge", u=u, v=v, old=anterior,
+                        new=min((e["weight"] for e in restantes), default=float("inf")))
+        return removidas
+
+    def _retirar_espelho(self, v: str, u: str, data: Dict[str, Any]):
+        # Entrada v->u da mesma aresta: a que compartilha o dict 'data' (ou qualquer v->u)
+        posicoes = self._pos[v].get(u, [])
+        lista = self.adj[v]
+        escolhida = next((i for i in posicoes if lista[i]["data"] is data), posicoes[-1] if posicoes else None)
+        if escolhida is not None:
+            self._retirar(v, escolhida)
+
+    def remove_node(self, node_name: str):
+
+        # Remove o nó e todas as arestas que saem dele ou chegam nele.
+
+        if node_name not in self.nodes_data:
+            raise ValueError(f"Nó não encontrado no grafo: '{node_name}'")
+        posicoes = self._indice()
+        if self.directed:
+            origens = [u for u in self._reverso()[node_name] if u != node_name]
+        else:
+            origens = [u for u in posicoes[node_name] if u != node_name]
+        for u in origens:
+            for i in sorted(posicoes[u].get(node_name, []), reverse=True):
+                self._retirar(u, i)
+        # arestas que saem do nó: só as listas dos vizinhos de entrada precisam de ajuste
+        destinos = [e["node"] for e in self.adj[node_name]]
+        self._entradas -= len(destinos)
+        del self.adj[node_name]
+        del posicoes[node_name]
+        del self.nodes_data[node_name]
+        self._in_deg.pop(node_name, None)
+        if self._radj is not None:
+            del self._radj[node_name]
+            for x in set(destinos):
+                self._radj.get(x, {}).pop(node_name, None)
+        for indice in self._indices_grau.values():
+            indice.remover(node_name)
+        for x in destinos:
+            if x == node_name:
+                continue
+            if self.directed:
+                self._in_deg[x] -= 1
+            if self._indices_grau:
+                self._grau_mudou(x)
+        # o resolvedor não tem remoção: é reconstruído sob demanda
+        self._resolver = None
+        self.version += 1
+        self._notificar("remove_node", node=node_name)
+
+    # === Aplicação de deltas (fluxo de atualizações) ===
+
+    def apply_deltas(self, deltas: Iterable[Dict[str, Any]], batch_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        """Aplica operações add/remove/reweight (ver graphs.deltas) em lotes, como gerador.
+
+        Consome 'deltas' sob demanda (ex.: iter_deltas(arquivo)), então a memória não depende
+        do volume do log. A cada lote aplicado devolve um resumo:
+            {"version", "applied", "added", "removed", "reweighted", "errors", "last_seq"}
+        Operações inválidas (aresta inexistente, op desconhecida) contam como erro e não
+        interrompem o fluxo.
+        """
+        lote = {"applied": 0, "added": 0, "removed": 0, "reweighted": 0, "errors": 0, "last_seq": None}
+        for delta in deltas:
+            op = delta.get("op")
+            u, v = delta.get("source"), delta.get("destination")
+            try:
+                if op == "add":
+                    peso = delta.get("weight")
+                    self.add_edge(u, v, 1.0 if peso is None else peso, **delta.get("data", {}))
+                    lote["added"] += 1
+                elif op == "remove":
+                    lote["removed"] += self.remove_edge(u, v, **delta.get("data", {}))
+                elif op == "reweight":
+                    self.update_edge_weight(u, v, delta["weight"])
+                    lote["reweighted"] += 1
+                else:
+                    raise ValueError(f"Operação desconhecida: '{op}'")
+                lote["applied"] += 1
+            except (ValueError, KeyError, TypeError) as e:
+                lote["errors"] += 1
+                logger.debug("[deltas] #%s ignorado: %s", delta.get("seq"), e)
+            lote["last_seq"] = delta.get("seq", lote["last_seq"])
+            if lote["applied"] + lote["errors"] >= batch_size:
+                yield {"version": self.version, **lote}
+                lote = {k: 0 for k in lote}
+                lote["last_seq"] = None
+        if lote["applied"] or lote["errors"]:
+            yield {"version": self.version, **lote}
+
+    # === Ouvintes de mutações ===
+
+    def add_listener(self, callback: Callable[[str, Dict[str, Any]], None]):
+        # callback(evento, dados) é chamado logo após a mutação (com a versão já incrementada)
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str, Dict[str, Any]], None]):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notificar(self, evento: str, **dados):
+        for callback in list(self._listeners):
+            callback(evento, dados)
 
     # === Carregamento específico dos bairros do Recife (Parte 1) ===
 
@@ -83,7 +485,7 @@ class Graph:
 
         # Carrega os nós e as arestas a partir dos arquivos CSV (formato da parte 1)
 
-        print(f"Carregando nós de: {nodes_file}")
+        logger.info("Carregando nós de: %s", nodes_file)
         try:
             with open(nodes_file, 'r', encoding='utf-8') as f:
                 for linha in f:
@@ -95,34 +497,19 @@ class Graph:
                     if len(partes) == 2:
                         bairro, microrregiao = partes[0].strip(), partes[1].strip()
                         self.add_node(bairro, microrregiao=microrregiao)
-            print(f"Nós carregados: {len(self.nodes_data)}")
+            logger.info("Nós carregados: %d", len(self.nodes_data))
         except FileNotFoundError:
-            print(f"ERRO FATAL: Arquivo de nós não encontrado em {nodes_file}")
+            logger.error("ERRO FATAL: Arquivo de nós não encontrado em %s", nodes_file)
             return
         except Exception as e:
-            print(f"ERRO ao ler arquivo de nós: {e}")
+            logger.error("ERRO ao ler arquivo de nós: %s", e)
             return
 
-        # === Normalização e mapeamento canônico de nomes ===
-        import unicodedata, re
-
-        def _normalize_key(name: str) -> str:
-            name = (name or "").strip()
-            name = re.sub(r"\s+", " ", name)
-            name = ''.join(
-                c for c in unicodedata.normalize('NFD', name)
-                if unicodedata.category(c) != 'Mn'
-            )
-            return name.lower()
-
-        # Cria um dicionário que mapeia a forma normalizada para o nome original já carregado
-        canon_map = {_normalize_key(n): n for n in self.nodes_data.keys()}
-
+        # === Normalização e mapeamento canônico de nomes (via resolvedor do grafo) ===
         def _canon_name(raw: str) -> str:
-            key = _normalize_key(raw)
-            return canon_map.get(key, raw.strip().title())
+            return self.resolve_name(raw) or raw.strip().title()
 
-        print(f"Carregando arestas de: {edges_file}")
+        logger.info("Carregando arestas de: %s", edges_file)
         try:
             with open(edges_file, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -131,9 +518,9 @@ class Graph:
                     try:
                         weight_float = float(row['peso'])
                     except ValueError:
-                        print(
-                            f"Aviso: Peso inválido '{row['peso']}' "
-                            f"para {row['bairro_origem']}-{row['bairro_destino']}. Usando 1.0."
+                        logger.warning(
+                            "Aviso: Peso inválido '%s' para %s-%s. Usando 1.0.",
+                            row['peso'], row['bairro_origem'], row['bairro_destino']
                         )
                         weight_float = 1.0
 
@@ -141,10 +528,10 @@ class Graph:
                     v = _canon_name(row['bairro_destino'])
 
                     if u not in self.nodes_data:
-                        print(f"[AVISO] '{u}' não encontrado. Criando nó DESCONHECIDA.")
+                        logger.warning("[AVISO] '%s' não encontrado. Criando nó DESCONHECIDA.", u)
                         self.add_node(u, microrregiao="DESCONHECIDA")
                     if v not in self.nodes_data:
-                        print(f"[AVISO] '{v}' não encontrado. Criando nó DESCONHECIDA.")
+                        logger.warning("[AVISO] '%s' não encontrado. Criando nó DESCONHECIDA.", v)
                         self.add_node(v, microrregiao="DESCONHECIDA")
 
                     self.add_edge(
@@ -155,13 +542,13 @@ class Graph:
                         observacao=row['observacao']
                     )
                     count += 1
-            print(f"Arestas carregadas: {count} (Total de conexões na lista: {count * 2})")
+            logger.info("Arestas carregadas: %d (Total de conexões na lista: %d)", count, count * 2)
         except FileNotFoundError:
-            print(f"ERRO FATAL: Arquivo de arestas não encontrado em {edges_file}")
+            logger.error("ERRO FATAL: Arquivo de arestas não encontrado em %s", edges_file)
         except KeyError as e:
-            print(f"ERRO FATAL: Coluna {e} faltando no CSV de arestas. Verifique o cabeçalho.")
+            logger.error("ERRO FATAL: Coluna %s faltando no CSV de arestas. Verifique o cabeçalho.", e)
         except Exception as e:
-            print(f"ERRO ao ler arquivo de arestas: {e}")
+            logger.error("ERRO ao ler arquivo de arestas: %s", e)
 
     # === Carregamento adicional de rotas (ex.: routes.csv / aeroportos) ===
     def load_routes_csv(self, routes_file: Path, source_col: str = "source airport", dest_col: str = "destination apirport", weight_col: str = "weight"):
@@ -185,9 +572,9 @@ class Graph:
           weight_col: coluna opcional de peso (default: 'weight').
         """
         if not routes_file.exists():
-            print(f"[rotas] Arquivo não encontrado: {routes_file}")
+            logger.error("[rotas] Arquivo não encontrado: %s", routes_file)
             return
-        print(f"Carregando rotas adicionais de: {routes_file}")
+        logger.info("Carregando rotas adicionais de: %s", routes_file)
         try:
             with open(routes_file, 'r', encoding='utf-8') as f:
                 reader = csv.DictReader(f)
@@ -227,14 +614,30 @@ class Graph:
                         equipment=row.get('equipment')
                     )
                     count += 1
-            print(f"Rotas adicionadas: {count} (Total de conexões inseridas: {count * (1 if self.directed else 2)})")
+            logger.info("Rotas adicionadas: %d (Total de conexões inseridas: %d)", count, count * (1 if self.directed else 2))
         except KeyError as e:
-            print(f"[rotas] Coluna ausente no CSV: {e}. Verifique o cabeçalho.")
+            logger.error("[rotas] Coluna ausente no CSV: %s. Verifique o cabeçalho.", e)
         except Exception as e:
-            print(f"[rotas] Erro ao ler rotas: {e}")
+            logger.error("[rotas] Erro ao ler rotas: %s", e)
 
     # --- Métodos de Acesso (Úteis para as próximas etapas) ---
 
+    @property
+    def resolver(self) -> NameResolver:
+        """Resolvedor de nomes (forma normalizada -> nome do nó), criado uma única vez."""
+        if self._resolver is None:
+            self._resolver = NameResolver(self.nodes_data.keys())
+        return self._resolver
+
+    def resolve_name(self, raw: str, fuzzy: bool = False) -> str | None:
+        """Retorna o nome canônico do nó para um texto livre (None se não houver).
+
+        Com fuzzy=True tenta ainda prefixo único e o nome mais parecido.
+        """
+        if fuzzy:
+            return self.resolver.fuzzy(raw)
+        return self.resolver.resolve(raw)
+
     def get_ordem(self) -> int:
         """Retorna a Ordem |V| (número de nós) do grafo."""
         return self.num_vertices  # usa a propriedade genérica
@@ -244,10 +647,8 @@ class Graph:
         return self.num_edges  # usa a propriedade genérica
 
     def get_grau(self, node_name: str) -> int:
-        """Retorna o grau de um nó específico."""
-        if node_name in self.adj:
-            return len(self.adj[node_name])
-        return 0
+        """Retorna o grau de um nó específico (grau de saída em grafos dirigidos)."""
+        return self.degree(node_name)
 
     def get_microrregiao(self, node_name: str) -> str | None:
         """Retorna a microrregião de um bairro."""
@@ -273,36 +674,41 @@ class Graph:
                     contador += 1
         return contador // 2  # corrige dupla contagem
 
+    def group_metrics(self, attr) -> Dict[Any, Dict[str, Any]]:
+        """Métricas (ordem, internas, corte, densidade) por valor do atributo 'attr' dos nós.
+
+        'attr' pode ser o nome do atributo (ex.: "microrregiao") ou uma função (nome, dados) -> grupo.
+        Ver metrics.group_metrics.
+        """
+        return group_metrics(self, attr)
+
+    @staticmethod
+    def _microrregiao_valida(_nome: str, dados: Dict[str, Any]) -> str | None:
+        micro = (dados.get("microrregiao") or "").strip()
+        if not micro or micro.upper() == "DESCONHECIDA":
+            return None
+        return micro
+
     def export_microrregioes_json(self, saida: Path = OUT_DIR / "microrregioes.json"):
         """
         Para cada microrregião, calcula ordem, tamanho e densidade no subgrafo
         induzido pelos seus bairros. Salva em JSON (lista de objetos).
         """
-        # agrupa bairros por microrregião (ignorando DESCONHECIDA)
-        grupos: Dict[str, set[str]] = {}
-        for bairro, dados in self.nodes_data.items():
-            micro = (dados.get("microrregiao") or "").strip()
-            if not micro or micro.upper() == "DESCONHECIDA":
-                continue
-            grupos.setdefault(micro, set()).add(bairro)
-
+        # todas as microrregiões numa varredura só (ignorando DESCONHECIDA)
         resultados = []
-        for micro, bairros in grupos.items():
-            ordem = len(bairros)
-            tamanho = self._contar_arestas_internas(bairros)
-            densidade = self._densidade(ordem, tamanho)
+        for micro, m in self.group_metrics(self._microrregiao_valida).items():
             resultados.append({
                 "microrregiao": micro,
-                "ordem": ordem,
-                "tamanho": tamanho,
-                "densidade": densidade
+                "ordem": m["order"],
+                "tamanho": m["internal"],
+                "densidade": m["density"]
             })
 
         OUT_DIR.mkdir(parents=True, exist_ok=True)
         with open(saida, "w", encoding="utf-8") as f:
             json.dump(resultados, f, indent=4, ensure_ascii=False)
 
-        print(f"Métricas por microrregião salvas em: {saida}")
+        logger.info("Métricas por microrregião salvas em: %s", saida)
 
     # === Funções para calcular o ego-rede de um bairro (item 3) ===
 
@@ -339,9 +745,10 @@ class Graph:
             w = csv.DictWriter(f, fieldnames=campos)
             w.writeheader()
             # usa os bairros carregados em nodes_data (garante presença mesmo sem arestas)
+            metricas = ego_metrics_all(self)
             for bairro in sorted(self.nodes_data.keys()):
-                w.writerow(self.ego_metrics_for(bairro))
-        print(f"Ego-métricas salvas em: {saida}")
+                w.writerow(metricas[bairro])
+        logger.info("Ego-métricas salvas em: %s", saida)
 
     # === Item 4: graus e rankings ===
 
@@ -360,22 +767,16 @@ class Graph:
                     "bairro": bairro,
                     "grau": self.get_grau(bairro)
                 })
-        print(f"Lista de graus salva em: {saida}")
+        logger.info("Lista de graus salva em: %s", saida)
 
     def get_bairro_maior_grau(self) -> tuple[str, int]:
         """
         Retorna (bairro, grau) do bairro com maior grau no grafo.
         """
-        melhor_bairro = None
-        melhor_grau = -1
-
-        for bairro in self.nodes_data.keys():
-            g = self.get_grau(bairro)
-            if g > melhor_grau:
-                melhor_bairro = bairro
-                melhor_grau = g
-
-        return melhor_bairro, melhor_grau
+        top = self.top_k_degree(1)
+        if not top:
+            return None, -1
+        return top[0]
 
     def get_bairro_mais_denso_ego(self) -> dict:
         """
@@ -385,8 +786,7 @@ class Graph:
         melhor_metrics = None
         melhor_dens = -1.0
 
-        for bairro in self.nodes_data.keys():
-            metrics = self.ego_metrics_for(bairro)
+        for metrics in ego_metrics_all(self).values():
             dens = metrics["densidade_ego"]
             if dens > melhor_dens:
                 melhor_dens = dens
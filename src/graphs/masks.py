@@ -0,0 +1,102 @@
+from typing import Any, Callable, Dict, Iterable, Iterator
+
+# Predicado de aresta: (origem, entrada de adj {"node", "weight", "data"}) -> permitida?
+EdgePredicate = Callable[[str, Dict[str, Any]], bool]
+
+
+def _paradas(valor: Any) -> int:
+    # 'stops' vem do CSV como texto; vazio/inválido = voo direto
+    try:
+        return int(float(valor))
+    except (TypeError, ValueError):
+        return 0
+
+
+def route_filter(airlines: Iterable[str] | None = None, max_stops: int | None = None,
+                 equipment: Iterable[str] | None = None) -> EdgePredicate:
+    """Predicado sobre os dados das rotas (data de load_routes_csv).
+
+    - airlines: códigos de companhia aceitos (ex.: os membros de uma aliança);
+    - max_stops: no máximo tantas escalas (0 = só voos diretos);
+    - equipment: aceita a rota se algum dos equipamentos listados nela estiver no conjunto.
+    Critérios None não filtram.
+    """
+    cias = {a.strip().upper() for a in airlines} if airlines is not None else None
+    equip = {e.strip().upper() for e in equipment} if equipment is not None else None
+
+    def _predicado(_u: str, entrada: Dict[str, Any]) -> bool:
+        dados = entrada.get("data") or {}
+        if cias is not None and str(dados.get("airline") or "").strip().upper() not in cias:
+            return False
+        if max_stops is not None and _paradas(dados.get("stops")) > max_stops:
+            return False
+        if equip is not None and not equip.intersection(str(dados.get("equipment") or "").upper().split()):
+            return False
+        return True
+
+    return _predicado
+
+
+class EdgeMask:
+    """Máscara de arestas compilada a partir de um predicado, para buscas filtradas.
+
+    O predicado roda uma vez por entrada de adj e o resultado fica num bytearray alinhado
+    ao CSR de graph.compact() (mesma ordem de adj[nome]); nas buscas, cada aresta custa só
+    um teste de byte. Recompila sozinha quando a versão do grafo muda.
+    Use sempre com o mesmo objeto (Graph ou vista) em que foi compilada.
+    """
+
+    def __init__(self, graph: Any, predicate: EdgePredicate):
+        self.graph = graph
+        self.predicate = predicate
+        self.version = -1
+        self._compilar()
+
+    def _compilar(self):
+        cg = self.graph.compact()
+        bits = bytearray(len(cg.targets))
+        adj = self.graph.adj
+        pred = self.predicate
+        k = 0
+        for nome in cg.names:
+            for e in adj[nome]:
+                if pred(nome, e):
+                    bits[k] = 1
+                k += 1
+        self._bits = bits
+        self._offsets = cg.offsets
+        self._index = cg.index
+        self.version = cg.version
+        self.allowed = sum(bits)
+
+    def row(self, node: str) -> bytearray:
+        """Bits das entradas de adj[node], na mesma ordem (vazio se o nó não existe)."""
+        if self.graph.version != self.version:
+            self._compilar()
+        i = self._index.get(node)
+        if i is None:
+            return bytearray()
+        return self._bits[self._offsets[i]:self._offsets[i + 1]]
+
+    def edges(self, node: str) -> Iterator[Dict[str, Any]]:
+        """Entradas permitidas de adj[node]."""
+        for e, ok in zip(self.graph.adj.get(node, []), self.row(node)):
+            if ok:
+                yield e
+
+    def __len__(self) -> int:
+        return len(self._bits)
+
+    def summary(self) -> Dict[str, int]:
+        if self.graph.version != self.version:
+            self._compilar()
+        return {"edges": len(self._bits), "allowed": self.allowed}
+
+
+def compile_mask(graph: Any, predicate: EdgePredicate | None = None, **criteria) -> EdgeMask | None:
+    """Atalho: EdgeMask de um predicado ou dos critérios de route_filter (None se não há filtro)."""
+    if predicate is None:
+        if all(v is None for v in criteria.values()):
+            return None
+        predicate = route_filter(**criteria)
+    return EdgeMask(graph, predicate)
@@ -0,0 +1,73 @@
+import math
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+
+def percentil(ordenadas: List[float], p: float) -> float:
+    """Percentil 'p' (0-100) com interpolação linear sobre uma lista JÁ ordenada."""
+    if not ordenadas:
+        return float("nan")
+    pos = (len(ordenadas) - 1) * p / 100.0
+    baixo = math.floor(pos)
+    alto = math.ceil(pos)
+    if baixo == alto:
+        return ordenadas[baixo]
+    return ordenadas[baixo] + (ordenadas[alto] - ordenadas[baixo]) * (pos - baixo)
+
+
+def resumir_amostras(amostras_ms: List[float]) -> Dict[str, Any]:
+    """Estatísticas de um conjunto de tempos (ms): n, min, max, média, desvio padrão e p50/p95/p99."""
+    ordenadas = sorted(amostras_ms)
+    n = len(ordenadas)
+    if n == 0:
+        return {"n": 0}
+    media = sum(ordenadas) / n
+    # desvio padrão amostral (n-1); com uma única amostra não há dispersão a medir
+    desvio = math.sqrt(sum((x - media) ** 2 for x in ordenadas) / (n - 1)) if n > 1 else 0.0
+    return {
+        "n": n,
+        "min_ms": round(ordenadas[0], 4),
+        "max_ms": round(ordenadas[-1], 4),
+        "mean_ms": round(media, 4),
+        "stdev_ms": round(desvio, 4),
+        "p50_ms": round(percentil(ordenadas, 50), 4),
+        "p95_ms": round(percentil(ordenadas, 95), 4),
+        "p99_ms": round(percentil(ordenadas, 99), 4),
+    }
+
+
+def medir(fn: Callable[[], Any], repeticoes: int = 5, aquecimento: int = 1, memoria: bool = False) -> Dict[str, Any]:
+    """Executa 'fn' com aquecimento + repetições e devolve o resumo dos tempos.
+
+    - aquecimento: execuções descartadas (caches, alocações da primeira chamada).
+    - memoria: mede o pico de memória (tracemalloc) em uma execução extra, separada das
+      cronometradas, porque o tracemalloc deixa a execução bem mais lenta.
+    """
+    for _ in range(aquecimento):
+        fn()
+    amostras: List[float] = []
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        fn()
+        amostras.append((time.perf_counter() - inicio) * 1000.0)
+    resumo = resumir_amostras(amostras)
+    if memoria:
+        resumo["peak_mem_kb"] = round(pico_memoria_kb(fn), 2)
+    return resumo
+
+
+def pico_memoria_kb(fn: Callable[[], Any]) -> float:
+    """Pico de memória alocada (KB) durante uma execução de 'fn', via tracemalloc."""
+    ja_ativo = tracemalloc.is_tracing()
+    if not ja_ativo:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    base = tracemalloc.get_traced_memory()[0]
+    try:
+        fn()
+        pico = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not ja_ativo:
+            tracemalloc.stop()
+    return max(0, pico - base) / 1024.0
@@ -0,0 +1,84 @@
+import difflib
+import unicodedata
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List
+
+
+# Marca de fim de palavra dentro da trie (nunca colide com um caractere normalizado)
+_FIM = "\0"
+
+
+@lru_cache(maxsize=8192)
+def normalize_key(name: str) -> str:
+    """Forma normalizada de um nome: espaços colapsados, sem acentos e em minúsculas.
+
+    Memoizada com LRU: arquivos de pares repetem os mesmos nomes milhares de vezes.
+    """
+    name = " ".join((name or "").split())
+    name = ''.join(
+        c for c in unicodedata.normalize('NFD', name)
+        if unicodedata.category(c) != 'Mn'
+    )
+    return name.lower()
+
+
+class NameResolver:
+    """Resolve nomes digitados livremente para o nome canônico de um nó.
+
+    - Mapa exato: forma normalizada -> nome original (o primeiro cadastrado vence).
+    - Trie pré-computada das formas normalizadas para busca por prefixo.
+    - Busca aproximada (difflib) apenas como último recurso.
+    """
+
+    def __init__(self, names: Iterable[str] = ()):
+        self._canon: Dict[str, str] = {}
+        self._trie: Dict[str, Any] = {}
+        for name in names:
+            self.add(name)
+
+    def __len__(self) -> int:
+        return len(self._canon)
+
+    def add(self, name: str):
+        """Registra um nome canônico (chamado pelo Graph a cada add_node)."""
+        key = normalize_key(name)
+        if key in self._canon:
+            return
+        self._canon[key] = name
+        no = self._trie
+        for c in key:
+            no = no.setdefault(c, {})
+        no[_FIM] = name
+
+    def resolve(self, raw: str, default: str | None = None) -> str | None:
+        """Busca exata pela forma normalizada."""
+        return self._canon.get(normalize_key(raw), default)
+
+    def prefix(self, raw: str, limit: int = 10) -> List[str]:
+        """Nomes canônicos cuja forma normalizada começa com 'raw' (ordem alfabética da chave)."""
+        no = self._trie
+        for c in normalize_key(raw):
+            no = no.get(c)
+            if no is None:
+                return []
+        encontrados: List[str] = []
+        pilha = [no]
+        while pilha and len(encontrados) < limit:
+            atual = pilha.pop()
+            if _FIM in atual:
+                encontrados.append(atual[_FIM])
+            # empilha em ordem reversa para visitar em ordem alfabética
+            for c in sorted((k for k in atual if k != _FIM), reverse=True):
+                pilha.append(atual[c])
+        return encontrados
+
+    def fuzzy(self, raw: str, cutoff: float = 0.8) -> str | None:
+        """Exato -> prefixo único -> nome mais parecido (difflib) acima de 'cutoff'."""
+        exato = self.resolve(raw)
+        if exato is not None:
+            return exato
+        candidatos = self.prefix(raw, limit=2)
+        if len(candidatos) == 1:
+            return candidatos[0]
+        parecidos = difflib.get_close_matches(normalize_key(raw), self._canon.keys(), n=1, cutoff=cutoff)
+        return self._canon[parecidos[0]] if parecidos else None
@@ -0,0 +1,159 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterable, Iterator, List
+
+try:
+    from .compact import CompactGraph
+except ImportError:
+    from compact import CompactGraph
+
+
+class _NodesView(Mapping):
+    """nodes_data restrito aos nós da vista (os dicts de atributos são os do grafo pai)."""
+
+    def __init__(self, view: "SubgraphView"):
+        self._view = view
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._view._membros()
+
+    def __getitem__(self, node: str) -> Dict[str, Any]:
+        if node not in self._view._membros():
+            raise KeyError(node)
+        return self._view.parent.nodes_data[node]
+
+    def get(self, node: str, default: Any = None) -> Any:
+        if node not in self._view._membros():
+            return default
+        return self._view.parent.nodes_data[node]
+
+    def __iter__(self) -> Iterator[str]:
+        self._view._membros()
+        return iter(self._view._ordem)
+
+    def __len__(self) -> int:
+        return len(self._view._membros())
+
+
+class _AdjView(Mapping):
+    """adj restrito: só as entradas cujas duas pontas estão na vista."""
+
+    def __init__(self, view: "SubgraphView"):
+        self._view = view
+
+    def __contains__(self, node: object) -> bool:
+        return node in self._view._membros()
+
+    def __getitem__(self, node: str) -> List[Dict[str, Any]]:
+        lista = self._view._vizinhos(node)
+        if lista is None:
+            raise KeyError(node)
+        return lista
+
+    def get(self, node: str, default: Any = None) -> Any:
+        lista = self._view._vizinhos(node)
+        return default if lista is None else lista
+
+    def __iter__(self) -> Iterator[str]:
+        self._view._membros()
+        return iter(self._view._ordem)
+
+    def __len__(self) -> int:
+        return len(self._view._membros())
+
+
+class SubgraphView:
+    """Subgrafo induzido por 'nodes', sem copiar o grafo pai.
+
+    Expõe a mesma interface de leitura que os algoritmos usam (adj, nodes_data, directed,
+    version, in_edges, compact), então pode ser passada direto para dijkstra, bfs, dfs,
+    bellman_ford, DijkstraSearch e para as métricas de metrics.py. As entradas de adj são
+    os próprios dicts do pai; cada lista filtrada é montada na primeira consulta ao nó e
+    reaproveitada enquanto a versão do pai não mudar. Mutações devem ser feitas no pai:
+    nós removidos de lá somem da vista.
+
+    A ordem dos nós é a de 'nodes' (sem repetições).
+    """
+
+    def __init__(self, parent: Any, nodes: Iterable[str]):
+        ordem = list(dict.fromkeys(nodes))
+        for n in ordem:
+            if n not in parent.nodes_data:
+                raise ValueError(f"Nó não encontrado no grafo: '{n}'")
+        self.parent = parent
+        self.directed = parent.directed
+        self.weighted = parent.weighted
+        self._ordem: List[str] = ordem
+        self._set: set = set(ordem)
+        self._version = parent.version
+        self._listas: Dict[str, List[Dict[str, Any]]] = {}
+        self._compact: CompactGraph | None = None
+        self.adj = _AdjView(self)
+        self.nodes_data = _NodesView(self)
+
+    @property
+    def version(self) -> int:
+        return self.parent.version
+
+    def _membros(self) -> set:
+        if self.parent.version != self._version:
+            existentes = self.parent.nodes_data
+            if any(n not in existentes for n in self._ordem):
+                self._ordem = [n for n in self._ordem if n in existentes]
+                self._set = set(self._ordem)
+            self._listas.clear()
+            self._version = self.parent.version
+        return self._set
+
+    def _vizinhos(self, node: str) -> List[Dict[str, Any]] | None:
+        membros = self._membros()
+        if node not in membros:
+            return None
+        lista = self._listas.get(node)
+        if lista is None:
+            lista = [e for e in self.parent.adj[node] if e["node"] in membros]
+            self._listas[node] = lista
+        return lista
+
+    def __contains__(self, node: str) -> bool:
+        return node in self._membros()
+
+    def __len__(self) -> int:
+        return len(self._membros())
+
+    @property
+    def num_vertices(self) -> int:
+        return len(self._membros())
+
+    @property
+    def num_edges(self) -> int:
+        entradas = sum(len(self._vizinhos(n)) for n in list(self._ordem))
+        return entradas if self.directed else entradas // 2
+
+    def get_grau(self, node_name: str) -> int:
+        """Grau (de saída, em dirigidos) dentro da vista."""
+        lista = self._vizinhos(node_name)
+        return 0 if lista is None else len(lista)
+
+    def in_edges(self, node_name: str) -> List[tuple]:
+        """Como Graph.in_edges, só com origens dentro da vista."""
+        membros = self._membros()
+        if node_name not in membros:
+            return []
+        return [(u, e) for u, e in self.parent.in_edges(node_name) if u in membros]
+
+    def compact(self) -> CompactGraph:
+        if self._compact is None or self._compact.version != self.version:
+            self._compact = CompactGraph(self)
+        return self._compact
+
+    def subgraph(self, nodes: Iterable[str]) -> "SubgraphView":
+        """Vista de uma parte desta vista (continua apontando para o grafo original)."""
+        membros = self._membros()
+        ordem = list(dict.fromkeys(nodes))
+        for n in ordem:
+            if n not in membros:
+                raise ValueError(f"Nó não encontrado no grafo: '{n}'")
+        return SubgraphView(self.parent, ordem)
+
+    def _densidade(self, n: int, e: int) -> float:
+        return self.parent._densidade(n, e)
@@ -0,0 +1,341 @@
+"""
+Servidor de consultas com o grafo carregado uma única vez em memória.
+
+Protocolo: HTTP/1.1 simples (com keep-alive) sobre TCP local ou socket Unix.
+	GET  /health
+	GET  /dijkstra?start=MEX&end=JFK
+	POST /dijkstra        {"start": "MEX", "end": "JFK"}
+	POST /bfs             {"start": "MEX"}
+	POST /dfs             {"start": "MEX"}
+	POST /bellman-ford    {"start": "AER"}
+	POST /dijkstra-batch  {"pairs": [["MEX", "JFK"], ["MEX", "LAX"]]}
+
+As respostas são os mesmos payloads JSON que o CLI grava em out/. Erros de consulta
+(nó inexistente, peso negativo no Dijkstra...) voltam com status 400 e {"error": ...}.
+
+As buscas são CPU-bound: o laço asyncio só faz I/O e delega cada consulta a um pool
+de threads (grafo compartilhado) ou de processos (cada processo carrega o grafo uma vez
+no initializer, contornando o GIL). O processo principal também mantém o grafo para
+resolver nomes e reconstruir caminhos.
+
+Consultas de Dijkstra passam pelo AsyncPathService: pedidos simultâneos com a mesma
+origem viram uma única busca de fonte única, e a fila de origens é limitada (--max-pending).
+Antes disso, um cache LRU de pares (PathCache, invalidado pela versão do grafo) responde
+as repetições sem busca nenhuma, e as árvores já calculadas ficam num cache por origem
+limitado em bytes (TreeCache, --tree-cache-mb): novos destinos de uma origem conhecida
+saem só da reconstrução do caminho.
+
+Exemplo:
+	python -m src.cli --routes data/routes.csv serve --port 8765
+	curl "http://127.0.0.1:8765/dijkstra?start=MEX&end=JFK"
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import functools
+import json
+import logging
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Dict, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+try:
+	from graphs.graph import Graph
+	from graphs.algorithms import shortest_path_tree
+	from graphs.async_query import AsyncPathService
+	from graphs.cache import PathCache, TreeCache
+	from cli import _build_graph, _resolve_nome, payload_bellman_ford, payload_bfs, payload_dfs, payload_dijkstra
+except ImportError:
+	from src.graphs.graph import Graph  # type: ignore
+	from src.graphs.algorithms import shortest_path_tree  # type: ignore
+	from src.graphs.async_query import AsyncPathService  # type: ignore
+	from src.graphs.cache import PathCache, TreeCache  # type: ignore
+	from src.cli import _build_graph, _resolve_nome, payload_bellman_ford, payload_bfs, payload_dfs, payload_dijkstra  # type: ignore
+
+
+logger = logging.getLogger("recife-graph.server")
+
+# consultas de um único nó/par (executar_consulta) + as que só existem no servidor
+CONSULTAS = ("dijkstra", "bfs", "dfs", "bellman-ford")
+COMANDOS = CONSULTAS + ("dijkstra-batch",)
+
+_STATUS_TEXTO = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed", 500: "Internal Server Error"}
+
+
+def _param(params: Dict[str, Any], nome: str) -> str:
+	valor = params.get(nome)
+	if not isinstance(valor, str) or not valor.strip():
+		raise ValueError(f"Parâmetro obrigatório ausente: '{nome}'")
+	return valor
+
+
+def executar_consulta(g: Graph, is_routes: bool, comando: str, params: Dict[str, Any], fuzzy: bool = False) -> Dict[str, Any]:
+	"""Resolve os nomes e executa uma consulta, devolvendo o payload do CLI.
+
+	Levanta KeyError para comando desconhecido e ValueError para consulta inválida.
+	"""
+	if comando not in CONSULTAS:
+		raise KeyError(comando)
+	origem = _resolve_nome(_param(params, "start"), g, is_routes, fuzzy)
+	if comando == "dijkstra":
+		destino = _resolve_nome(_param(params, "end"), g, is_routes, fuzzy)
+		return payload_dijkstra(g, origem, destino)
+	if comando == "bfs":
+		return payload_bfs(g, origem, is_routes)
+	if comando == "dfs":
+		return payload_dfs(g, origem, is_routes)
+	return payload_bellman_ford(g, origem)
+
+
+# === Estado dos processos do pool (modo --pool process) ===
+
+_WORKER: Dict[str, Any] = {}
+
+
+def _init_worker(build_opts: Dict[str, Any], fuzzy: bool):
+	"""Initializer do ProcessPoolExecutor: carrega o grafo uma vez por processo."""
+	args = argparse.Namespace(**build_opts)
+	g, is_routes = _build_graph(args, weighted=True, directed=build_opts.get("directed", False))
+	_WORKER.update(graph=g, is_routes=is_routes, fuzzy=fuzzy)
+
+
+def _consulta_no_worker(comando: str, params: Dict[str, Any]) -> Dict[str, Any]:
+	return executar_consulta(_WORKER["graph"], _WORKER["is_routes"], comando, params, _WORKER["fuzzy"])
+
+
+def _arvore_no_worker(source: str) -> Dict[str, Any]:
+	return shortest_path_tree(_WORKER["graph"], source)
+
+
+class QueryServer:
+	"""Servidor asyncio que responde consultas sobre um grafo residente em memória.
+
+	- pool="thread": as buscas usam 'graph', compartilhado entre as threads.
+	- pool="process": cada processo carrega o grafo a partir de 'build_opts'
+	  (routes / adjacencias_bairros / directed, como as flags do CLI); 'graph'
+	  fica no processo principal para resolver nomes e montar os caminhos.
+	"""
+
+	def __init__(
+		self,
+		graph: Graph,
+		is_routes: bool = False,
+		pool: str = "thread",
+		workers: int = 4,
+		build_opts: Dict[str, Any] | None = None,
+		fuzzy: bool = False,
+		max_pending: int = 256,
+		cache_size: int = 10000,
+		cache_ttl: float | None = None,
+		tree_cache_mb: float = 64.0,
+	):
+		self.graph = graph
+		self.is_routes = is_routes
+		self.fuzzy = fuzzy
+		self.pool_kind = pool
+		self.workers = workers
+		self.build_opts = build_opts or {}
+		self.max_pending = max_pending
+		self._executor: Executor | None = None
+		self.paths: AsyncPathService | None = None
+		self.cache = PathCache(graph, max_entries=cache_size, ttl=cache_ttl)
+		self.trees = TreeCache(graph, max_bytes=int(tree_cache_mb * 1024 * 1024)) if tree_cache_mb > 0 else None
+		self.stats: Dict[str, int] = {"requests": 0, "errors": 0}
+		if pool not in ("thread", "process"):
+			raise ValueError(f"Pool desconhecido: '{pool}' (use 'thread' ou 'process')")
+
+	# --- ciclo de vida ---
+
+	def _criar_executor(self) -> Executor:
+		if self.pool_kind == "process":
+			return ProcessPoolExecutor(max_workers=self.workers, initializer=_init_worker, initargs=(self.build_opts, self.fuzzy))
+		return ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="consulta")
+
+	async def start(self, host: str = "127.0.0.1", port: int = 8765, unix_path: str | None = None) -> asyncio.AbstractServer:
+		"""Abre o socket e devolve o servidor asyncio (útil para testes com port=0)."""
+		if self._executor is None:
+			self._executor = self._criar_executor()
+			busca = _arvore_no_worker if self.pool_kind == "process" else functools.partial(shortest_path_tree, self.graph)
+			self.paths = AsyncPathService(self.graph, max_pending=self.max_pending, concurrency=self.workers,
+										  executor=self._executor, search=busca, trees=self.trees)
+			await self.paths.start()
+		if unix_path:
+			return await asyncio.start_unix_server(self._atender, path=unix_path)
+		return await asyncio.start_server(self._atender, host=host, port=port)
+
+	async def serve(self, host: str = "127.0.0.1", port: int = 8765, unix_path: str | None = None):
+		server = await self.start(host, port, unix_path)
+		onde = unix_path or ", ".join(str(s.getsockname()) for s in server.sockets or [])
+		logger.info("[serve] Ouvindo em %s (pool=%s, workers=%d)", onde, self.pool_kind, self.workers)
+		try:
+			async with server:
+				await server.serve_forever()
+		finally:
+			await self.aclose()
+
+	async def aclose(self):
+		if self.paths is not None:
+			await self.paths.close()
+		self.close()
+
+	def close(self):
+		logger.info("[serve] Cache de caminhos: %s", self.cache.summary())
+		if self.trees is not None:
+			logger.info("[serve] Cache de árvores: %s", self.trees.summary())
+		if self.paths is not None:
+			logger.info("[serve] Dijkstra: %s", self.paths.stats)
+			self.paths = None
+		if self._executor is not None:
+			self._executor.shutdown(wait=False, cancel_futures=True)
+			self._executor = None
+		logger.info("[serve] Encerrado: %d requisições, %d erros", self.stats["requests"], self.stats["errors"])
+
+	# --- execução ---
+
+	async def consultar(self, comando: str, params: Dict[str, Any]) -> Dict[str, Any]:
+		"""Executa uma consulta no pool sem bloquear o laço de eventos."""
+		loop = asyncio.get_running_loop()
+		if comando == "dijkstra":
+			return await self._dijkstra(params)
+		if comando == "dijkstra-batch":
+			return await self._dijkstra_batch(params)
+		if self.pool_kind == "process":
+			return await loop.run_in_executor(self._executor, _consulta_no_worker, comando, params)
+		return await loop.run_in_executor(self._executor, executar_consulta, self.graph, self.is_routes, comando, params, self.fuzzy)
+
+	async def _ponto_a_ponto(self, params: Dict[str, Any]) -> Dict[str, Any]:
+		loop = asyncio.get_running_loop()
+		if self.pool_kind == "process":
+			return await loop.run_in_executor(self._executor, _consulta_no_worker, "dijkstra", params)
+		return await loop.run_in_executor(self._executor, executar_consulta, self.graph, self.is_routes, "dijkstra", params, self.fuzzy)
+
+	async def _dijkstra(self, params: Dict[str, Any]) -> Dict[str, Any]:
+		"""Dijkstra: cache de pares -> árvore compartilhada por origem (coalescing)."""
+		origem = _resolve_nome(_param(params, "start"), self.graph, self.is_routes, self.fuzzy)
+		destino = _resolve_nome(_param(params, "end"), self.graph, self.is_routes, self.fuzzy)
+		res = self.cache.get(origem, destino)
+		if res is None:
+			try:
+				res = await self.paths.shortest_path(origem, destino)
+			except ValueError:
+				# A árvore completa pode esbarrar em peso negativo fora do caminho; refaz ponto a
+				# ponto para responder exatamente como o CLI (sucesso ou o mesmo erro).
+				return await self._ponto_a_ponto({"start": origem, "end": destino})
+			self.cache.put(origem, destino, res)
+		return {"algorithm": "dijkstra", "from": origem, "to": destino, **res}
+
+	async def _dijkstra_batch(self, params: Dict[str, Any]) -> Dict[str, Any]:
+		"""Vários pares de uma vez, no formato do subcomando dijkstra-batch do CLI."""
+		pares = params.get("pairs")
+		if not isinstance(pares, list) or not all(isinstance(p, (list, tuple)) and len(p) == 2 for p in pares):
+			raise ValueError("Parâmetro 'pairs' deve ser uma lista de pares [origem, destino]")
+		resolvidos = [
+			(_resolve_nome(str(o), self.graph, self.is_routes, self.fuzzy), _resolve_nome(str(d), self.graph, self.is_routes, self.fuzzy))
+			for o, d in pares
+		]
+		# só os pares fora do cache vão para a busca
+		results: list[Dict[str, Any] | None] = []
+		faltando: list[tuple[int, tuple[str, str]]] = []
+		for i, (o, d) in enumerate(resolvidos):
+			res = self.cache.get(o, d)
+			results.append({"from": o, "to": d, **res} if res is not None else None)
+			if res is None:
+				faltando.append((i, (o, d)))
+		calculados = await self.paths.batch(par for _, par in faltando)
+		for (i, (o, d)), r in zip(faltando, calculados):
+			results[i] = r
+			if "error" not in r:
+				self.cache.put(o, d, {"cost": r["cost"], "path": r["path"]})
+		return {"algorithm": "dijkstra-batch", "count": len(results), "results": results}
+
+	async def responder(self, metodo: str, alvo: str, corpo: bytes) -> Tuple[int, Dict[str, Any]]:
+		"""Roteia uma requisição HTTP já lida para (status, payload)."""
+		partes = urlsplit(alvo)
+		caminho = partes.path.rstrip("/") or "/"
+		comando = caminho.lstrip("/")
+		params: Dict[str, Any] = dict(parse_qsl(partes.query))
+		if metodo == "POST" and corpo:
+			try:
+				dados = json.loads(corpo.decode("utf-8"))
+			except (UnicodeDecodeError, json.JSONDecodeError) as e:
+				return 400, {"error": f"JSON inválido: {e}"}
+			if not isinstance(dados, dict):
+				return 400, {"error": "O corpo deve ser um objeto JSON"}
+			params.update(dados)
+		elif metodo not in ("GET", "POST"):
+			return 405, {"error": f"Método não suportado: {metodo}"}
+
+		if comando == "health":
+			info: Dict[str, Any] = {"status": "ok", "pool": self.pool_kind, **self.stats}
+			info.update(nodes=self.graph.num_vertices, edges=self.graph.num_edges, path_cache=self.cache.summary(),
+						tree_cache=self.trees.summary() if self.trees is not None else None)
+			return 200, info
+		if comando not in COMANDOS:
+			return 404, {"error": f"Comando desconhecido: '{comando}'", "commands": list(COMANDOS)}
+		try:
+			return 200, await self.consultar(comando, params)
+		except ValueError as e:
+			return 400, {"error": str(e)}
+
+	async def _atender(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+		"""Uma conexão: lê requisições em sequência enquanto o cliente mantiver keep-alive."""
+		try:
+			while True:
+				linha = await reader.readline()
+				if not linha:
+					break
+				try:
+					metodo, alvo, _versao = linha.decode("latin-1").strip().split(" ", 2)
+				except ValueError:
+					await self._escrever(writer, 400, {"error": "Linha de requisição inválida"}, manter=False)
+					break
+				headers: Dict[str, str] = {}
+				while True:
+					h = await reader.readline()
+					if h in (b"\r\n", b"\n", b""):
+						break
+					chave, _, valor = h.decode("latin-1").partition(":")
+					headers[chave.strip().lower()] = valor.strip()
+				try:
+					tamanho = int(headers.get("content-length") or 0)
+					if tamanho < 0:
+						raise ValueError(tamanho)
+				except ValueError:
+					await self._escrever(writer, 400, {"error": "Content-Length inválido"}, manter=False)
+					break
+				corpo = await reader.readexactly(tamanho)
+
+				inicio = time.perf_counter()
+				self.stats["requests"] += 1
+				try:
+					status, payload = await self.responder(metodo.upper(), alvo, corpo)
+				except Exception as e:  # erro inesperado não derruba o servidor
+					logger.exception("[serve] Falha ao atender %s %s", metodo, alvo)
+					status, payload = 500, {"error": str(e)}
+				if status != 200:
+					self.stats["errors"] += 1
+				logger.debug("[serve] %s %s -> %d (%.2f ms)", metodo, alvo, status, (time.perf_counter() - inicio) * 1000.0)
+
+				manter = headers.get("connection", "").lower() != "close"
+				await self._escrever(writer, status, payload, manter)
+				if not manter:
+					break
+		except (asyncio.IncompleteReadError, ConnectionResetError, BrokenPipeError):
+			pass
+		finally:
+			writer.close()
+
+	@staticmethod
+	async def _escrever(writer: asyncio.StreamWriter, status: int, payload: Dict[str, Any], manter: bool):
+		corpo = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+		cabecalho = (
+			f"HTTP/1.1 {status} {_STATUS_TEXTO.get(status, 'OK')}\r\n"
+			"Content-Type: application/json; charset=utf-8\r\n"
+			f"Content-Length: {len(corpo)}\r\n"
+			f"Connection: {'keep-alive' if manter else 'close'}\r\n\r\n"
+		).encode("latin-1")
+		writer.write(cabecalho + corpo)
+		await writer.drain()
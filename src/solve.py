@@ -1,8 +1,7 @@
 import json
 import csv
+import logging
 from pathlib import Path
-import unicodedata
-import re
 
 # Importações Locais
 try:
@@ -25,20 +24,10 @@ OUT_DIR = REPO_ROOT / "out"
 # --- Funções Auxiliares ---
 
 def _get_nome_canonico(nome_bairro_raw: str, graph: Graph) -> str | None:
-    def _normalize_key(name: str) -> str:
-        name = (name or "").strip()
-        name = re.sub(r"\s+", " ", name)
-        name = ''.join(c for c in unicodedata.normalize('NFD', name)
-                       if unicodedata.category(c) != 'Mn')
-        return name.lower()
     nome_lower = nome_bairro_raw.lower()
     if "setúbal" in nome_lower or "boa viagem" in nome_lower:
          if "Boa Viagem" in graph.nodes_data: return "Boa Viagem"
-    try:
-        if not hasattr(graph, '_canon_map'):
-            graph._canon_map = { _normalize_key(n): n for n in graph.nodes_data.keys() }
-    except: graph._canon_map = {}
-    return graph._canon_map.get(_normalize_key(nome_bairro_raw), nome_bairro_raw.strip())
+    return graph.resolve_name(nome_bairro_raw) or nome_bairro_raw.strip()
 
 # --- Tasks de Processamento ---
 
@@ -85,6 +74,7 @@ def executar_task_6_percurso_especial(g: Graph) -> dict | None:
 # --- Main ---
 
 def main():
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     OUT_DIR.mkdir(parents=True, exist_ok=True)
     
     # =========================================================================
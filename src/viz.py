@@ -20,11 +20,19 @@ except ImportError:
 # Tenta importar Graph para Type Hinting
 try:
     from graphs.graph import Graph
+    from graphs.metrics import ego_metrics_all, triangle_summary
+    from graphs.centrality import pagerank, top_k_closeness
 except ImportError:
     try:
         from src.graphs.graph import Graph
+        from src.graphs.metrics import ego_metrics_all, triangle_summary
+        from src.graphs.centrality import pagerank, top_k_closeness
     except ImportError:
         Graph = typing.Any 
+        ego_metrics_all = None
+        triangle_summary = None
+        top_k_closeness = None
+        pagerank = None
 
 # Caminhos
 REPO_ROOT = Path(__file__).resolve().parents[1]
@@ -582,10 +590,13 @@ def gerar_html_customizado(g: Graph, resultado_percurso: dict | None):
 #  TASK 8: VISUALIZAÇÕES ANALÍTICAS (Matplotlib)
 # ==============================================================================
 
-def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = ""):
+def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = "", ranking_por: str = "grau"):
     """
     Gera gráficos estáticos (.png) adaptáveis (Recife ou Rotas).
     - file_prefix: prefixo para o arquivo (ex: 'rota_') para não sobrescrever.
+    - ranking_por: critério do Top 10 do gráfico 2: 'grau' (padrão), 'harmonic' ou 'closeness'
+      (centralidades de proximidade, calculadas só para os 10 primeiros via top_k_closeness)
+      ou 'pagerank'.
     """
     if plt is None: return
     print(f"  [viz.py] Gerando visualizações analíticas (prefixo='{file_prefix}')...")
@@ -614,7 +625,16 @@ def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = ""):
     # 2. Top 10 Circular
     try:
         # Identificar Top 10 bairros
-        ranking = sorted([(n, g.get_grau(n)) for n in g.nodes_data], key=lambda x: x[1], reverse=True)[:10]
+        if ranking_por in ("harmonic", "closeness") and top_k_closeness is not None:
+            ranking = top_k_closeness(g, 10, measure=ranking_por, weighted=getattr(g, "weighted", True))
+            criterio = "Mais Centrais (harmônica)" if ranking_por == "harmonic" else "Mais Centrais (proximidade)"
+        elif ranking_por == "pagerank" and pagerank is not None:
+            scores = pagerank(g)["scores"]
+            ranking = sorted(scores.items(), key=lambda item: (-item[1], item[0]))[:10]
+            criterio = "Mais Importantes (PageRank)"
+        else:
+            ranking = g.top_k_degree(10)
+            criterio = "Mais Conectados"
         top_nodes = [r[0] for r in ranking]
         
         if top_nodes:
@@ -630,33 +650,21 @@ def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = ""):
                 angle += math.pi / 2 
                 pos[node] = (radius * math.cos(angle), radius * math.sin(angle))
                 
-            # Desenhar Arestas (apenas entre os Top 10)
-            
-            # CORREÇÃO ROBUSTA: Usa getattr para evitar AttributeError se 'directed' falhar
-            is_directed = getattr(g, "directed", False)
-            
-            for i, u in enumerate(top_nodes):
-                for j, v in enumerate(top_nodes):
-                    if i >= j: continue 
-                    
-                    # Verifica adjacência no grafo 'g'
-                    conectados = False
-                    # Checa u->v
-                    for info in g.adj.get(u, []):
-                        if info["node"] == v:
-                            conectados = True; break
-                    
-                    # Se não achou e for dirigido, checa v->u? 
-                    # Se for dirigido (Rotas), queremos ver conexão em qualquer sentido para o desenho estático
-                    if not conectados and is_directed:
-                         for info in g.adj.get(v, []):
-                            if info["node"] == u:
-                                conectados = True; break
-
-                    if conectados:
-                        x_vals = [pos[u][0], pos[v][0]]
-                        y_vals = [pos[u][1], pos[v][1]]
-                        plt.plot(x_vals, y_vals, color='gray', alpha=0.5, linewidth=1.5, zorder=1)
+            # Desenhar Arestas (apenas entre os Top 10): a vista do subgrafo induzido já
+            # filtra a adjacência, sem varrer as listas inteiras de cada par de nós
+            sub = g.subgraph(top_nodes)
+            pares = set()
+            for u in top_nodes:
+                for info in sub.adj[u]:
+                    # dirigido (Rotas): conexão em qualquer sentido conta para o desenho estático
+                    if info["node"] != u:
+                        pares.add(frozenset((u, info["node"])))
+
+            for par in pares:
+                u, v = tuple(par)
+                x_vals = [pos[u][0], pos[v][0]]
+                y_vals = [pos[u][1], pos[v][1]]
+                plt.plot(x_vals, y_vals, color='gray', alpha=0.5, linewidth=1.5, zorder=1)
 
             # Desenhar Nós
             x_nodes = [pos[n][0] for n in top_nodes]
@@ -671,12 +679,13 @@ def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = ""):
                 dist = 1.15
                 plt.text(x * dist, y * dist, node, fontsize=10, ha='center', va='center', fontweight='bold', color='#333')
 
-            plt.title(f'Top {n_top} Nós Mais Conectados')
+            plt.title(f'Top {n_top} Nós {criterio}')
             plt.axis('off') 
             plt.xlim(-1.5, 1.5)
             plt.ylim(-1.5, 1.5)
             
-            nome_arq = OUT_DIR / f"{file_prefix}analise_2_subgrafo_top10.png"
+            sufixo = "" if ranking_por == "grau" else f"_{ranking_por}"
+            nome_arq = OUT_DIR / f"{file_prefix}analise_2_subgrafo_top10{sufixo}.png"
             plt.tight_layout()
             plt.savefig(nome_arq)
             plt.close()
@@ -689,12 +698,14 @@ def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = ""):
         micro_dens = {}
         # Verifica se há dados válidos de microrregião
         valid_micros = set()
+        # métricas de ego de todos os nós numa passada só (em vez de ego_metrics_for por nó)
+        ego = ego_metrics_all(g) if ego_metrics_all is not None else {}
         
         for n in bairros:
             m = g.get_microrregiao(n)
             if m and m not in ["DESCONHECIDA", "N/A", None]:
                 valid_micros.add(m)
-                try: d = g.ego_metrics_for(n).get("densidade_ego", 0)
+                try: d = ego[n].get("densidade_ego", 0) if ego else g.ego_metrics_for(n).get("densidade_ego", 0)
                 except: d = 0
                 micro_dens.setdefault(m, []).append(d)
         
@@ -711,4 +722,25 @@ def gerar_visualizacoes_analiticas(g: Graph, file_prefix: str = ""):
             plt.tight_layout(); plt.savefig(nome_arq); plt.close()
             print(f"  -> {nome_arq}")
             
-    except Exception as e: print(f"  [ERRO] G3: {e}")
\ No newline at end of file
+    except Exception as e: print(f"  [ERRO] G3: {e}")
+
+    # 4. Coeficiente de agrupamento local (triângulos contados uma vez para o grafo todo)
+    try:
+        if triangle_summary is not None:
+            tri = triangle_summary(g)
+            # só nós com 2+ vizinhos distintos no grafo simples (o mesmo grau de local_clustering)
+            vizinhos = g.compact().simple_neighbors()
+            coefs = [c for vs, c in zip(vizinhos, tri["local_clustering"].values()) if len(vs) >= 2]
+            if coefs:
+                plt.figure(figsize=(8, 5))
+                plt.hist(coefs, bins=20, range=(0, 1), color='#F5B041', edgecolor='black', alpha=0.8)
+                plt.title(f"Agrupamento Local (transitividade={tri['transitivity']:.3f}, "
+                          f"média={tri['average_clustering']:.3f})")
+                plt.ylabel('Qtd. Nós')
+                plt.xlabel('Coeficiente de agrupamento')
+                plt.tight_layout()
+                nome_arq = OUT_DIR / f"{file_prefix}analise_4_agrupamento.png"
+                plt.savefig(nome_arq)
+                plt.close()
+                print(f"  -> {nome_arq}")
+    except Exception as e: print(f"  [ERRO] G4: {e}")
\ No newline at end of file
@@ -0,0 +1,132 @@
+import asyncio
+import pytest
+import sys
+import threading
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra, shortest_path_tree, path_from_tree
+from graphs.async_query import AsyncPathService
+
+
+@pytest.fixture
+def grafo_async():
+
+    # Mesmo grafo do test_dijkstra (sem a aresta negativa).
+
+    g = Graph()
+    for node in ["A", "B", "C", "D", "E", "F"]:
+        g.add_node(node)
+    g.add_edge("A", "B", 1)
+    g.add_edge("A", "C", 4)
+    g.add_edge("B", "C", 2)
+    g.add_edge("B", "D", 5)
+    g.add_edge("C", "D", 1)
+    g.add_edge("E", "F", 1)
+    return g
+
+
+def test_arvore_igual_ao_dijkstra(grafo_async):
+    arvore = shortest_path_tree(grafo_async, "A")
+    for destino in grafo_async.nodes_data:
+        assert path_from_tree(arvore, destino) == dijkstra(grafo_async, "A", destino)
+
+
+def test_coalescing_por_origem(grafo_async):
+    async def cenario():
+        async with AsyncPathService(grafo_async) as svc:
+            resultados = await asyncio.gather(*(svc.shortest_path("A", d) for d in ["B", "C", "D", "E"]))
+            return resultados, svc.stats
+
+    resultados, stats = asyncio.run(cenario())
+    assert [r["cost"] for r in resultados] == [1, 3, 4, float("inf")]
+    # quatro consultas simultâneas da mesma origem -> uma única busca
+    assert stats["searches"] == 1
+    assert stats["coalesced"] == 3
+
+
+def test_backpressure_fila_limitada(grafo_async):
+    async def cenario():
+        async with AsyncPathService(grafo_async, max_pending=1, concurrency=1) as svc:
+            pares = [(o, "D") for o in ["A", "B", "C", "D", "E", "F"]]
+            return await svc.batch(pares), svc.stats
+
+    resultados, stats = asyncio.run(cenario())
+    assert [r["cost"] for r in resultados] == [4, 3, 1, 0, float("inf"), float("inf")]
+    assert stats["searches"] == 6
+
+
+def test_erros_por_par(grafo_async):
+    async def cenario():
+        async with AsyncPathService(grafo_async) as svc:
+            return await svc.batch([("A", "B"), ("Z", "B")])
+
+    ok, erro = asyncio.run(cenario())
+    assert ok["path"] == ["A", "B"]
+    assert "Nó de origem não encontrado" in erro["error"]
+
+
+
+def _busca_com_trava(g, trava):
+    # busca que só termina depois de 'trava' liberada: mantém o worker ocupado e a fila cheia
+    def busca(origem):
+        trava.wait(5)
+        return shortest_path_tree(g, origem)
+    return busca
+
+
+def test_cancelar_quem_enfileirou_nao_afeta_quem_se_juntou(grafo_async):
+    trava = threading.Event()
+
+    async def cenario():
+        svc = AsyncPathService(grafo_async, max_pending=1, concurrency=1, search=_busca_com_trava(grafo_async, trava))
+        async with svc:
+            ocupados = [asyncio.ensure_future(svc.tree("E"))]
+            await asyncio.sleep(0.01)  # o worker pega E e trava na busca
+            ocupados.append(asyncio.ensure_future(svc.tree("F")))  # ocupa a única vaga da fila
+            await asyncio.sleep(0.01)
+            dono = asyncio.ensure_future(svc.tree("A"))  # fica preso no put
+            await asyncio.sleep(0.01)
+            juntou = asyncio.ensure_future(svc.tree("A"))
+            await asyncio.sleep(0.01)
+            dono.cancel()
+            await asyncio.sleep(0.01)
+            trava.set()
+            arvore = await juntou
+            await asyncio.gather(*ocupados)
+            with pytest.raises(asyncio.CancelledError):
+                await dono
+            return arvore, svc.stats, svc.pending
+
+    arvore, stats, pendentes = asyncio.run(cenario())
+    assert path_from_tree(arvore, "D") == dijkstra(grafo_async, "A", "D")
+    assert stats["coalesced"] == 1 and stats["searches"] == 3
+    assert pendentes == 0
+
+
+def test_cancelar_sozinho_tira_a_origem_da_fila(grafo_async):
+    trava = threading.Event()
+
+    async def cenario():
+        svc = AsyncPathService(grafo_async, max_pending=1, concurrency=1, search=_busca_com_trava(grafo_async, trava))
+        async with svc:
+            ocupados = [asyncio.ensure_future(svc.tree("E"))]
+            await asyncio.sleep(0.01)
+            ocupados.append(asyncio.ensure_future(svc.tree("F")))
+            await asyncio.sleep(0.01)
+            sozinho = asyncio.ensure_future(svc.tree("A"))
+            await asyncio.sleep(0.01)
+            sozinho.cancel()
+            await asyncio.sleep(0.01)
+            trava.set()
+            await asyncio.gather(*ocupados)
+            await asyncio.sleep(0.01)
+            return svc.stats, svc.pending
+
+    stats, pendentes = asyncio.run(cenario())
+    assert stats["searches"] == 2
+    assert pendentes == 0
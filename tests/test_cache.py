@@ -0,0 +1,179 @@
+import argparse
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra
+from graphs.cache import PathCache, TreeCache, tamanho_busca
+from cli import _abrir_cache, _fechar_cache
+
+
+@pytest.fixture
+def grafo_cache():
+
+    # Caminho A-B-C-D com atalho caro A-D.
+
+    g = Graph()
+    g.add_edge("A", "B", 1)
+    g.add_edge("B", "C", 1)
+    g.add_edge("C", "D", 1)
+    g.add_edge("A", "D", 10)
+    return g
+
+
+class _Relogio:
+    def __init__(self):
+        self.agora = 0.0
+
+    def __call__(self):
+        return self.agora
+
+
+def test_hit_e_miss(grafo_cache):
+    cache = PathCache(grafo_cache)
+    assert cache.dijkstra("A", "D") == dijkstra(grafo_cache, "A", "D")
+    assert cache.dijkstra("A", "D")["cost"] == 3
+    assert cache.stats["misses"] == 1
+    assert cache.stats["hits"] == 1
+
+
+def test_lru_evicao(grafo_cache):
+    cache = PathCache(grafo_cache, max_entries=2)
+    cache.dijkstra("A", "B")
+    cache.dijkstra("A", "C")
+    cache.dijkstra("A", "B")      # A-B passa a ser o mais recente
+    cache.dijkstra("A", "D")      # expulsa A-C
+    assert cache.stats["evictions"] == 1
+    assert cache.get("A", "C") is None
+    assert cache.get("A", "B") is not None
+
+
+def test_ttl(grafo_cache):
+    relogio = _Relogio()
+    cache = PathCache(grafo_cache, ttl=5.0, clock=relogio)
+    cache.dijkstra("A", "D")
+    relogio.agora = 6.0
+    assert cache.get("A", "D") is None
+    assert cache.stats["expirations"] == 1
+
+
+def test_invalida_por_versao(grafo_cache):
+    cache = PathCache(grafo_cache)
+    assert cache.dijkstra("A", "D")["cost"] == 3
+    grafo_cache.add_edge("A", "D", 1)   # mutação muda a versão do grafo
+    assert cache.dijkstra("A", "D")["cost"] == 1
+    assert cache.stats["invalidations"] == 1
+
+
+def test_persistencia(grafo_cache, tmp_path):
+    arquivo = tmp_path / "cache.json"
+    cache = PathCache(grafo_cache)
+    cache.dijkstra("A", "D")
+    cache.save(arquivo, graph_key="k1")
+
+    novo = PathCache(grafo_cache)
+    assert novo.load(arquivo, graph_key="k1") == 1
+    assert novo.dijkstra("A", "D")["path"] == ["A", "B", "C", "D"]
+    assert novo.stats["hits"] == 1
+    # outra origem de dados: nada é reaproveitado
+    assert PathCache(grafo_cache).load(arquivo, graph_key="k2") == 0
+
+
+def test_tree_cache_reaproveita_origem(grafo_cache):
+    trees = TreeCache(grafo_cache)
+    for destino in ("B", "C", "D"):
+        assert trees.dijkstra("A", destino) == dijkstra(grafo_cache, "A", destino)
+    assert trees.stats["misses"] == 1
+    assert trees.stats["hits"] == 2
+    assert "A" in trees
+
+
+def test_tree_cache_orcamento_lru(grafo_cache):
+    completas = []
+    for n in "ABCD":
+        busca = TreeCache(grafo_cache).search(n)
+        busca.run_until(None)
+        completas.append(tamanho_busca(busca))
+    tamanho = max(completas)
+    trees = TreeCache(grafo_cache, max_bytes=2 * tamanho)
+    for origem in ("A", "B", "C"):
+        trees.tree(origem)
+    assert len(trees) == 2
+    assert "A" not in trees
+    assert trees.bytes_used <= trees.max_bytes
+    assert trees.stats["evictions"] == 1
+
+
+def test_path_cache_com_arvores_e_invalidacao(grafo_cache):
+    cache = PathCache(grafo_cache, trees=TreeCache(grafo_cache))
+    cache.dijkstra("A", "C")
+    cache.dijkstra("A", "D")
+    assert cache.trees.stats["hits"] == 1
+    grafo_cache.add_edge("A", "D", 1)
+    assert cache.dijkstra("A", "D")["cost"] == 1
+    assert cache.trees.stats["invalidations"] == 1
+
+
+def test_tree_cache_retoma_busca_parcial(grafo_cache):
+    trees = TreeCache(grafo_cache)
+    assert trees.dijkstra("A", "B")["cost"] == 1
+    busca = trees.search("A")
+    assert not busca.done and "D" not in busca.settled
+    assert trees.get("A") is None  # parcial não serve como árvore completa
+    assert trees.dijkstra("A", "D") == dijkstra(grafo_cache, "A", "D")
+    assert trees.stats["resumes"] == 1
+    assert trees.dijkstra("A", "C")["path"] == ["A", "B", "C"]  # já fechado: sem retomar
+    assert trees.stats["resumes"] == 1
+
+
+def test_update_edge_weight_paralelas_e_versao():
+    g = Graph()
+    g.add_edge("A", "B", 5)
+    g.add_edge("A", "B", 3)
+    versao = g.version
+    assert g.update_edge_weight("B", "A", 7) == 3
+    assert [e["weight"] for e in g.adj["A"]] == [7, 7]
+    assert [e["weight"] for e in g.adj["B"]] == [7, 7]
+    assert g.version == versao + 1
+    with pytest.raises(ValueError, match="Aresta não encontrada"):
+        g.update_edge_weight("A", "Z", 1)
+
+
+def test_tree_cache_repara_mudancas_de_peso(grafo_cache):
+    trees = TreeCache(grafo_cache)
+    trees.tree("A")
+    grafo_cache.update_edge_weight("B", "C", 20)  # aumento numa aresta da árvore
+    assert trees.dijkstra("A", "C") == dijkstra(grafo_cache, "A", "C")
+    assert trees.dijkstra("A", "C")["path"] == ["A", "D", "C"]
+    grafo_cache.update_edge_weight("A", "D", 1)  # redução fora da árvore
+    assert trees.dijkstra("A", "C")["cost"] == 2
+    assert trees.stats["repairs"] == 2
+    assert trees.stats["invalidations"] == 0
+    assert trees.stats["misses"] == 1
+
+
+def test_tree_cache_invalida_em_outras_mutacoes(grafo_cache):
+    trees = TreeCache(grafo_cache)
+    trees.tree("A")
+    grafo_cache.add_edge("A", "C", 1)
+    grafo_cache.update_edge_weight("A", "C", 2)  # não pode "esconder" o add_edge anterior
+    assert trees.dijkstra("A", "C")["cost"] == 2
+    assert trees.stats["invalidations"] == 1
+    assert trees.stats["repairs"] == 0
+
+
+def test_fechar_cache_do_cli_solta_o_grafo():
+    g = Graph()
+    g.add_edge("A", "B", 1)
+    args = argparse.Namespace(tree_cache_mb=1.0, cache_size=10, cache_ttl=None, path_cache=None)
+    cache = _abrir_cache(args, g, arvores=True)
+    assert cache.trees is not None and g._listeners
+    assert cache.dijkstra("A", "B")["path"] == ["A", "B"]
+    _fechar_cache(args, cache)
+    assert g._listeners == []
+    assert len(cache.trees) == 0
@@ -0,0 +1,161 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from cli import build_parser
+from graphs.centrality import (betweenness_centrality, closeness_centrality, eigenvector_centrality,
+                               export_centrality_csv, iter_closeness, pagerank, ranking, top_k_closeness)
+
+
+@pytest.fixture
+def losango():
+
+    # A-B-D e A-C-D com o mesmo custo (dois caminhos mínimos), D-E pendurado e
+    # um atalho A-D caro que só conta sem pesos.
+
+    g = Graph()
+    for u, v, w in [("A", "B", 1), ("B", "D", 1), ("A", "C", 1), ("C", "D", 1), ("D", "E", 1), ("A", "D", 5)]:
+        g.add_edge(u, v, w)
+    return g
+
+
+def test_brandes_com_pesos(losango):
+    bc = betweenness_centrality(losango, normalized=False)
+    # A-D e A-E dividem-se entre B e C; B-C passa por A ou D; D está entre E e {A, B, C}
+    assert bc == pytest.approx({"A": 0.5, "B": 1.0, "C": 1.0, "D": 3.5, "E": 0.0})
+    norm = betweenness_centrality(losango)
+    assert norm["D"] == pytest.approx(3.5 * 2 / (4 * 3))
+
+
+def test_brandes_em_saltos_e_dirigido(losango):
+    bc = betweenness_centrality(losango, weighted=False, normalized=False)
+    # em saltos o atalho A-D é direto: B e C não ficam entre ninguém
+    assert bc == pytest.approx({"A": 0.5, "B": 0.0, "C": 0.0, "D": 3.5, "E": 0.0})
+
+    g = Graph(directed=True)
+    for u, v in [("A", "B"), ("B", "C"), ("C", "A")]:
+        g.add_edge(u, v, 1)
+    assert betweenness_centrality(g, normalized=False) == pytest.approx({"A": 1.0, "B": 1.0, "C": 1.0})
+
+
+def test_amostragem_pool_e_csv(losango, tmp_path):
+    exato = betweenness_centrality(losango)
+    assert betweenness_centrality(losango, samples=10) == pytest.approx(exato)
+    assert betweenness_centrality(losango, workers=2) == pytest.approx(exato)
+    assert set(betweenness_centrality(losango, samples=2, seed=3)) == set(exato)
+    for invalido in (0, -2):
+        with pytest.raises(ValueError, match="samples"):
+            betweenness_centrality(losango, samples=invalido)
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["betweenness", "--samples", "0"])
+
+    saida = tmp_path / "btw.csv"
+    assert export_centrality_csv(exato, saida) == 5
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert linhas[0] == "posicao,no,betweenness"
+    assert linhas[1].startswith("1,D,")
+    assert [n for n, _ in ranking(exato, 3)] == ["D", "B", "C"]  # empate B/C pelo nome
+
+
+def test_peso_negativo():
+    g = Graph(directed=True)
+    g.add_edge("A", "B", -1)
+    with pytest.raises(ValueError, match="Peso negativo"):
+        betweenness_centrality(g)
+    assert betweenness_centrality(g, weighted=False, normalized=False) == {"A": 0.0, "B": 0.0}
+
+
+def test_closeness_e_harmonica(losango, tmp_path):
+    losango.add_node("F")  # isolado: alcança só a si mesmo
+    saida = tmp_path / "closeness.csv"
+    c = closeness_centrality(losango, saida=saida)
+    # de D: B, C, E a 1 e A a 2 -> S = 5, r = 5 (de 6 nós)
+    assert c["D"]["closeness"] == pytest.approx(4 / 5 * 4 / 5)
+    assert c["D"]["harmonic"] == pytest.approx(3 + 0.5)
+    assert c["F"] == {"closeness": 0.0, "harmonic": 0.0, "reachable": 1}
+    linhas = saida.read_text(encoding="utf-8").splitlines()
+    assert linhas[0] == "no,closeness,harmonic,reachable" and len(linhas) == 7
+    # lotes pequenos e pool de processos dão o mesmo resultado, na ordem dos nós
+    itens = list(iter_closeness(losango, batch_size=2, workers=2))
+    assert [i["no"] for i in itens] == list(losango.nodes_data)
+    assert {i["no"]: i["harmonic"] for i in itens} == pytest.approx({n: v["harmonic"] for n, v in c.items()})
+
+
+@pytest.mark.parametrize("measure", ["harmonic", "closeness"])
+@pytest.mark.parametrize("weighted", [True, False])
+def test_top_k_igual_ao_ranking_completo(measure, weighted):
+    import random
+    rnd = random.Random(5)
+    g = Graph()
+    for _ in range(120):
+        g.add_edge(f"n{rnd.randrange(60)}", f"n{rnd.randrange(60)}", rnd.randint(1, 4))
+    completo = closeness_centrality(g, weighted=weighted)
+    esperado = ranking({n: v[measure] for n, v in completo.items()}, 5)
+    obtido = top_k_closeness(g, 5, measure=measure, weighted=weighted)
+    assert [v for _, v in obtido] == pytest.approx([v for _, v in esperado])
+    with pytest.raises(ValueError):
+        top_k_closeness(g, 5, measure="grau")
+
+
+def test_pagerank_pendentes_e_personalizacao():
+    g = Graph(directed=True)
+    for u, v in [("A", "B"), ("B", "C"), ("C", "A"), ("A", "D")]:
+        g.add_edge(u, v, 1)
+    res = pagerank(g, tol=1e-10, backend="python")
+    assert res["converged"] and res["backend"] == "python"
+    assert sum(res["scores"].values()) == pytest.approx(1.0)
+    # D não tem saída: seu valor volta para todos (pendente), e A divide o seu entre B e D
+    assert res["scores"]["B"] == pytest.approx(res["scores"]["D"])
+    pessoal = pagerank(g, personalization={"C": 1}, tol=1e-10)["scores"]
+    assert max(pessoal, key=pessoal.get) == "C"
+    parado = pagerank(g, max_iter=1)
+    assert (parado["iterations"], parado["converged"]) == (1, False)
+    with pytest.raises(ValueError):
+        pagerank(g, personalization={"X": 1})
+
+
+
+def test_pagerank_saida_so_com_peso_zero():
+    g = Graph(directed=True)
+    g.add_edge("A", "B", 0)
+    g.add_edge("B", "A", 1)
+    res = pagerank(g, tol=1e-10)
+    assert res["converged"]
+    # A é pendente: devolve seu valor por igual, e B manda tudo para A
+    assert res["scores"]["A"] == pytest.approx(0.925 / 1.425)
+    assert sum(res["scores"].values()) == pytest.approx(1.0)
+
+
+def test_pagerank_com_pesos_e_autovetor():
+    g = Graph(directed=True)
+    g.add_edge("A", "B", 3)
+    g.add_edge("A", "C", 1)
+    g.add_edge("B", "A", 1)
+    g.add_edge("C", "A", 1)
+    pr = pagerank(g, tol=1e-8)["scores"]
+    # B recebe 3/4 do que sai de A; sem pesos, B e C empatam
+    assert pr["B"] == pytest.approx(0.15 / 3 + 0.85 * 0.75 * pr["A"], rel=1e-5)
+    sem_pesos = pagerank(g, weighted=False, tol=1e-8)["scores"]
+    assert sem_pesos["B"] == pytest.approx(sem_pesos["C"])
+
+    estrela = Graph()
+    for folha in "BCDE":
+        estrela.add_edge("A", folha, 1)
+    ev = eigenvector_centrality(estrela, tol=1e-10)
+    assert ev["converged"]
+    # estrela com 4 folhas: centro = 1/sqrt(2), cada folha = 1/(2*sqrt(2))
+    assert ev["scores"]["A"] == pytest.approx(2 ** -0.5, rel=1e-4)
+    assert ev["scores"]["B"] == pytest.approx(ev["scores"]["A"] / 2, rel=1e-4)
+
+
+def test_max_iter_invalido(losango):
+    for funcao in (pagerank, eigenvector_centrality):
+        with pytest.raises(ValueError, match="max_iter"):
+            funcao(losango, max_iter=0)
+    with pytest.raises(SystemExit):
+        build_parser().parse_args(["pagerank", "--max-iter", "0"])
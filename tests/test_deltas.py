@@ -0,0 +1,69 @@
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.deltas import append_delta, iter_deltas, load_snapshot, write_snapshot
+
+
+def _grafo_base():
+    g = Graph(directed=True)
+    g.add_edge("REC", "GRU", 3.0, airline="G3")
+    g.add_edge("REC", "GRU", 2.0, airline="LA")
+    g.add_edge("GRU", "SSA", 1.0, airline="G3")
+    return g
+
+
+def test_iter_deltas_csv_e_jsonl(tmp_path):
+    for nome in ("log.csv", "log.jsonl"):
+        log = tmp_path / nome
+        append_delta(log, "add", "REC", "FOR", 1.5, airline="AD")
+        append_delta(log, "reweight", "REC", "GRU", 4)
+        append_delta(log, "remove", "REC", "GRU", airline="G3")
+        deltas = list(iter_deltas(log))
+        assert [d["op"] for d in deltas] == ["add", "reweight", "remove"]
+        assert deltas[0]["data"] == {"airline": "AD"} and deltas[0]["weight"] == 1.5
+        assert [d["seq"] for d in iter_deltas(log, start=2)] == [3]
+
+
+def test_iter_deltas_ignora_linhas_invalidas(tmp_path):
+    log = tmp_path / "log.csv"
+    log.write_text("op,source,destination,weight\nadd,A,B,1\nbogus,A,B,\nreweight,A,B,\nremove,A,B,\n", encoding="utf-8")
+    assert [(d["seq"], d["op"]) for d in iter_deltas(log)] == [(1, "add"), (4, "remove")]
+
+
+def test_apply_deltas_em_lotes():
+    g = _grafo_base()
+    deltas = [
+        {"seq": 1, "op": "add", "source": "SSA", "destination": "REC", "weight": 1.0, "data": {}},
+        {"seq": 2, "op": "remove", "source": "REC", "destination": "GRU", "weight": None, "data": {"airline": "G3"}},
+        {"seq": 3, "op": "reweight", "source": "GRU", "destination": "SSA", "weight": 5.0, "data": {}},
+        {"seq": 4, "op": "remove", "source": "SSA", "destination": "FOR", "weight": None, "data": {}},
+    ]
+    lotes = list(g.apply_deltas(iter(deltas), batch_size=3))
+    assert [l["applied"] for l in lotes] == [3, 0]
+    assert lotes[-1]["errors"] == 1 and lotes[-1]["last_seq"] == 4
+    assert lotes[-1]["version"] == g.version
+    assert [(e["node"], e["data"]["airline"]) for e in g.adj["REC"]] == [("GRU", "LA")]
+    assert g.adj["GRU"][0]["weight"] == 5.0
+    assert g.num_edges == 3
+
+
+def test_snapshot_incremental(tmp_path):
+    g = _grafo_base()
+    log = tmp_path / "deltas.jsonl"
+    append_delta(log, "remove", "REC", "GRU", airline="LA")
+    snap = tmp_path / "snap.csv"
+    for lote in g.apply_deltas(iter_deltas(log)):
+        ultimo = lote["last_seq"]
+    assert write_snapshot(g, snap, deltas_applied=ultimo) == 2
+
+    append_delta(log, "add", "SSA", "REC", 2.0)
+    g2, ja = load_snapshot(snap, directed=True)
+    assert ja == 1 and g2.num_edges == 2
+    list(g2.apply_deltas(iter_deltas(log, start=ja)))
+    assert g2.num_edges == 3
+    assert [e["data"]["airline"] for e in g2.adj["REC"]] == ["G3"]
@@ -8,7 +8,8 @@ if str(SRC_DIR) not in sys.path:
 
 try:
     from graphs.graph import Graph
-    from graphs.algorithms import dijkstra
+    from graphs.algorithms import dijkstra, k_shortest_paths
+    from cli import build_parser
 except ImportError as e:
     print(f"Erro de importação: {e}")
     print(f"Verifique se os arquivos 'src/graphs/graph.py' e ")
@@ -88,4 +89,63 @@ def test_negative_weight_failure(test_graph):
     # falha ao encontrar peso negativo
     with pytest.raises(ValueError, match="Peso negativo encontrado"):
         # O caminho G -> H tem peso -1
-        dijkstra(test_graph, "G", "H")
\ No newline at end of file
+        dijkstra(test_graph, "G", "H")
+
+def test_no_stdout_in_hot_path(test_graph, capsys):
+    # Dijkstra não deve escrever no stdout (lotes com milhares de pares)
+    dijkstra(test_graph, "A", "D")
+    dijkstra(test_graph, "A", "E")
+    assert capsys.readouterr().out == ""
+
+
+def test_stats_counters(test_graph):
+    # Instrumentação opt-in: contadores preenchidos apenas quando 'stats' é passado
+    stats = {}
+    result = dijkstra(test_graph, "A", "D", stats=stats)
+    assert result["cost"] == 4
+    assert stats["nodes_settled"] == 4
+    assert stats["pops"] == stats["nodes_settled"] + stats["stale_pops"]
+    assert stats["pushes"] >= stats["pops"]
+    assert stats["peak_frontier"] >= 1
+    assert stats["edges_relaxed"] == 8  # graus de A (2), B (3) e C (3); D é o destino
+
+
+def test_dijkstra_search_retomavel(test_graph):
+    # mesma busca atende destinos em qualquer ordem, retomando a fronteira salva
+    from graphs.algorithms import DijkstraSearch, shortest_path_tree
+    busca = DijkstraSearch(test_graph, "A")
+    for destino in ("B", "D", "C", "A", "E"):
+        assert busca.path_to(destino) == dijkstra(test_graph, "A", destino)
+    assert busca.done
+    assert busca.tree()["distance"] == shortest_path_tree(test_graph, "A")["distance"]
+
+
+def test_k_caminhos_yen(test_graph):
+    caminhos = k_shortest_paths(test_graph, "A", "D", k=10)
+    assert caminhos == [
+        {"cost": 4, "path": ["A", "B", "C", "D"]},
+        {"cost": 5, "path": ["A", "C", "D"]},
+        {"cost": 6, "path": ["A", "B", "D"]},
+        {"cost": 11, "path": ["A", "C", "B", "D"]},
+    ]
+    assert caminhos[0] == dijkstra(test_graph, "A", "D")
+    assert k_shortest_paths(test_graph, "A", "D", k=2) == caminhos[:2]
+
+
+def test_k_caminhos_casos_limite(test_graph):
+    assert k_shortest_paths(test_graph, "A", "E", k=3) == []
+    assert k_shortest_paths(test_graph, "A", "A", k=3) == [{"cost": 0, "path": ["A"]}]
+    with pytest.raises(ValueError):
+        k_shortest_paths(test_graph, "A", "Z", k=3)
+    with pytest.raises(ValueError):
+        k_shortest_paths(test_graph, "A", "D", k=0)
+    with pytest.raises(ValueError):
+        k_shortest_paths(test_graph, "G", "H", k=2)
+
+
+@pytest.mark.parametrize("comando", [["dijkstra", "A", "D"], ["dijkstra-batch", "A", "D"], ["dijkstra-pairs", "pares.csv"]])
+def test_k_invalido_no_cli(comando):
+    assert build_parser().parse_args(comando + ["--k", "3"]).k == 3
+    for valor in ("0", "-3"):
+        with pytest.raises(SystemExit):
+            build_parser().parse_args(comando + ["--k", valor])
@@ -0,0 +1,114 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+
+
+@pytest.fixture
+def grafo_rotas():
+
+    # Grafo dirigido com rotas paralelas (companhias diferentes) entre REC e GRU.
+
+    g = Graph(directed=True)
+    g.add_edge("REC", "GRU", 3, airline="G3")
+    g.add_edge("REC", "GRU", 2, airline="LA")
+    g.add_edge("GRU", "REC", 3)
+    g.add_edge("REC", "SSA", 1)
+    g.add_edge("SSA", "GRU", 1)
+    return g
+
+
+def _indice_consistente(g):
+    for u, vizinhos in g.adj.items():
+        esperado = {}
+        for i, e in enumerate(vizinhos):
+            esperado.setdefault(e["node"], []).append(i)
+        assert {v: sorted(ps) for v, ps in g._pos[u].items()} == esperado
+
+
+def test_remove_edge_paralelas(grafo_rotas):
+    assert grafo_rotas.num_edges == 5
+    assert grafo_rotas.remove_edge("REC", "GRU", count=1) == 1
+    assert grafo_rotas.num_edges == 4
+    assert [e["node"] for e in grafo_rotas.adj["REC"]].count("GRU") == 1
+    assert grafo_rotas.remove_edge("REC", "GRU") == 1
+    assert grafo_rotas.num_edges == 3
+    _indice_consistente(grafo_rotas)
+    with pytest.raises(ValueError, match="Aresta não encontrada"):
+        grafo_rotas.remove_edge("REC", "GRU")
+
+
+def test_remove_node_dirigido(grafo_rotas):
+    versao = grafo_rotas.version
+    grafo_rotas.remove_node("GRU")
+    assert "GRU" not in grafo_rotas.nodes_data
+    assert grafo_rotas.num_edges == 1
+    assert all(e["node"] != "GRU" for vs in grafo_rotas.adj.values() for e in vs)
+    assert grafo_rotas.version == versao + 1
+    _indice_consistente(grafo_rotas)
+    grafo_rotas.add_edge("SSA", "GRU", 4)  # índice segue válido após novas inserções
+    _indice_consistente(grafo_rotas)
+
+
+def test_remove_nao_dirigido_mantem_espelho():
+    g = Graph()
+    g.add_edge("A", "B", 1)
+    g.add_edge("B", "C", 1)
+    g.add_edge("C", "C", 1)
+    g.remove_edge("B", "A")
+    assert g.adj["A"] == [] and [e["node"] for e in g.adj["B"]] == ["C"]
+    g.remove_node("C")
+    assert g.adj["B"] == [] and g.num_edges == 0
+    assert g.resolve_name("c") is None
+
+
+def test_graus_entrada_saida_dirigido(grafo_rotas):
+    assert grafo_rotas.degree("GRU") == grafo_rotas.get_grau("GRU") == 1
+    assert grafo_rotas.degree("GRU", "in") == 3
+    assert grafo_rotas.degree("GRU", "total") == 4
+    grafo_rotas.remove_node("SSA")
+    assert grafo_rotas.degree("GRU", "in") == 2
+    assert grafo_rotas.degree("REC", "out") == 2
+
+
+def test_top_k_e_distribuicao(grafo_rotas):
+    assert grafo_rotas.top_k_degree(2) == [("REC", 3), ("GRU", 1)]
+    assert grafo_rotas.top_k_degree(1, "in") == [("GRU", 3)]
+    assert grafo_rotas.degree_distribution() == {1: 2, 3: 1}
+    grafo_rotas.add_edge("SSA", "REC", 1)
+    grafo_rotas.add_edge("SSA", "FOR", 1)
+    grafo_rotas.add_edge("SSA", "NAT", 1)
+    assert grafo_rotas.top_k_degree(2) == [("SSA", 4), ("REC", 3)]
+    assert grafo_rotas.degree_distribution() == {0: 2, 1: 1, 3: 1, 4: 1}
+    assert grafo_rotas.get_bairro_maior_grau() == ("SSA", 4)
+    with pytest.raises(ValueError, match="Modo de grau"):
+        grafo_rotas.top_k_degree(1, "saida")
+
+
+def test_modo_de_grau_invalido_independe_da_direcao(grafo_rotas):
+    nao_dirigido = Graph()
+    nao_dirigido.add_edge("A", "B", 1)
+    for g in (grafo_rotas, nao_dirigido):
+        with pytest.raises(ValueError, match="Modo de grau"):
+            g.degree("A", "saida")
+        with pytest.raises(ValueError, match="Modo de grau"):
+            g.degrees("saida")
+
+
+def test_predecessores_e_arestas_de_entrada(grafo_rotas):
+    assert grafo_rotas._radj is None  # só é construída sob demanda
+    assert grafo_rotas.predecessors("GRU") == ["REC", "SSA"]
+    assert sorted(e["weight"] for _, e in grafo_rotas.in_edges("GRU")) == [1, 2, 3]
+    grafo_rotas.add_edge("FOR", "GRU", 4)
+    grafo_rotas.update_edge_weight("SSA", "GRU", 9)
+    assert ("SSA", 9) in [(u, e["weight"]) for u, e in grafo_rotas.in_edges("GRU")]
+    grafo_rotas.remove_edge("REC", "GRU")
+    assert grafo_rotas.predecessors("GRU") == ["SSA", "FOR"]
+    grafo_rotas.remove_node("SSA")
+    assert grafo_rotas.predecessors("GRU") == ["FOR"]
+    assert grafo_rotas.degree("GRU", "in") == len(grafo_rotas.in_edges("GRU")) == 1
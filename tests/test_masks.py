@@ -0,0 +1,60 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra, bfs, dfs, k_shortest_paths
+from graphs.masks import EdgeMask, compile_mask, route_filter
+
+
+@pytest.fixture
+def rotas():
+
+    # REC-GRU direto pela G3 (caro) ou REC-SSA-GRU pela AD; SSA-BSB só com escala.
+
+    g = Graph()
+    g.add_edge("REC", "GRU", 5.0, airline="G3", stops="0", equipment="738")
+    g.add_edge("REC", "SSA", 1.0, airline="AD", stops="0", equipment="E95")
+    g.add_edge("SSA", "GRU", 1.0, airline="AD", stops="0", equipment="320 E95")
+    g.add_edge("SSA", "BSB", 1.0, airline="AD", stops="1", equipment="E95")
+    return g
+
+
+def test_filtro_por_companhia(rotas):
+    assert dijkstra(rotas, "REC", "GRU")["path"] == ["REC", "SSA", "GRU"]
+    so_g3 = compile_mask(rotas, airlines=["g3"])
+    assert dijkstra(rotas, "REC", "GRU", edge_mask=so_g3) == {"cost": 5.0, "path": ["REC", "GRU"]}
+    assert dijkstra(rotas, "REC", "SSA", edge_mask=so_g3)["path"] == []
+    assert bfs(rotas, "REC", edge_mask=so_g3)["order"] == ["REC", "GRU"]
+    assert dfs(rotas, "SSA", edge_mask=so_g3)["order"] == ["SSA"]
+
+
+def test_filtro_por_escalas_e_equipamento(rotas):
+    diretos = compile_mask(rotas, max_stops=0)
+    assert "BSB" not in bfs(rotas, "REC", edge_mask=diretos)["order"]
+    a320 = EdgeMask(rotas, route_filter(equipment=["320"]))
+    assert bfs(rotas, "GRU", edge_mask=a320)["order"] == ["GRU", "SSA"]
+    assert compile_mask(rotas) is None
+
+
+def test_mascara_recompila_e_confere_o_grafo(rotas):
+    stats = {}
+    mascara = compile_mask(rotas, airlines=["AD"])
+    dfs(rotas, "REC", stats=stats, edge_mask=mascara)
+    assert stats["edges_relaxed"] == 6  # só as entradas AD: REC 1, SSA 3, GRU 1, BSB 1
+    rotas.add_edge("BSB", "POA", 1.0, airline="AD", stops="0")
+    assert "POA" in bfs(rotas, "REC", edge_mask=mascara)["order"]
+    outro = Graph()
+    outro.add_node("REC")
+    with pytest.raises(ValueError, match="outro grafo"):
+        bfs(outro, "REC", edge_mask=mascara)
+
+
+def test_k_caminhos_respeitam_mascara(rotas):
+    assert [c["path"] for c in k_shortest_paths(rotas, "REC", "GRU", k=3)] == [["REC", "SSA", "GRU"], ["REC", "GRU"]]
+    so_ad = compile_mask(rotas, airlines=["AD"])
+    assert k_shortest_paths(rotas, "REC", "GRU", k=3, edge_mask=so_ad) == [{"cost": 2.0, "path": ["REC", "SSA", "GRU"]}]
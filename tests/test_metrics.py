@@ -0,0 +1,113 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.metrics import ego_metrics_all, group_metrics, triangle_summary, approx_triangle_summary
+
+
+def _grafo(directed: bool) -> Graph:
+
+    # Dois triângulos (A-B-C, B-C-D) com aresta paralela, laço e um nó isolado.
+
+    g = Graph(directed=directed)
+    for u, v in [("A", "B"), ("B", "C"), ("C", "A"), ("B", "D"), ("D", "C"), ("B", "C"), ("D", "D"), ("E", "A")]:
+        g.add_edge(u, v, 1)
+    g.add_node("F")
+    return g
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_ego_all_igual_ao_por_no(directed):
+    g = _grafo(directed)
+    todas = ego_metrics_all(g)
+    assert list(todas) == list(g.nodes_data)
+    for v in g.nodes_data:
+        assert todas[v] == g.ego_metrics_for(v)
+
+
+def test_ego_triangulos_nao_dirigido():
+    g = Graph()
+    for u, v in [("A", "B"), ("B", "C"), ("C", "A"), ("C", "D")]:
+        g.add_edge(u, v, 1)
+    m = ego_metrics_all(g)
+    # ego de C = {A, B, C, D}: grau 3 + 1 triângulo
+    assert (m["C"]["ordem_ego"], m["C"]["tamanho_ego"]) == (4, 4)
+    assert m["A"]["densidade_ego"] == 1.0
+    assert g.get_bairro_mais_denso_ego()["bairro"] == "A"
+
+
+def test_compact_reaproveitado_por_versao():
+    g = _grafo(False)
+    cg = g.compact()
+    assert g.compact() is cg
+    assert cg.neighbors(cg.index["A"]) == [cg.index[n] for n in ("B", "C", "E")]
+    g.add_edge("E", "F", 1)
+    assert g.compact() is not cg
+
+
+@pytest.mark.parametrize("directed", [False, True])
+def test_triangulos_e_agrupamento(directed):
+    s = triangle_summary(_grafo(directed))
+    assert s["triangles"] == 2
+    assert s["per_node"] == {"A": 1, "B": 2, "C": 2, "D": 1, "E": 0, "F": 0}
+    # A tem vizinhos {B, C, E}: 1 de 3 cunhas fechada; B e C: 2 de 3
+    assert s["local_clustering"]["A"] == pytest.approx(1 / 3)
+    assert s["local_clustering"]["B"] == pytest.approx(2 / 3)
+    assert s["local_clustering"]["D"] == 1.0
+    assert s["wedges"] == 3 + 3 + 3 + 1
+    assert s["transitivity"] == pytest.approx(6 / 10)
+
+
+def test_triangulos_bruto_e_aproximado():
+    import itertools
+    import random
+    rnd = random.Random(7)
+    g = Graph()
+    nos = [f"n{i}" for i in range(40)]
+    for u, v in itertools.combinations(nos, 2):
+        if rnd.random() < 0.3:
+            g.add_edge(u, v, 1)
+    viz = {n: {e["node"] for e in g.adj[n]} for n in g.adj}
+    bruto = sum(1 for a, b, c in itertools.combinations(list(g.adj), 3)
+                if b in viz[a] and c in viz[a] and c in viz[b])
+    exato = triangle_summary(g)
+    assert exato["triangles"] == bruto
+    aprox = approx_triangle_summary(g, samples=20000, seed=1)
+    assert aprox["transitivity"] == pytest.approx(exato["transitivity"], abs=0.03)
+    assert aprox["average_clustering"] == pytest.approx(exato["average_clustering"], abs=0.03)
+
+
+def test_group_metrics_internas_e_corte():
+    g = Graph()
+    for nome, micro in [("A", "1.1"), ("B", "1.1"), ("C", " 1.1 "), ("D", "2.1"), ("E", "DESCONHECIDA"), ("F", "")]:
+        g.add_node(nome, microrregiao=micro)
+    for u, v in [("A", "B"), ("B", "C"), ("C", "D"), ("D", "E"), ("A", "F")]:
+        g.add_edge(u, v, 1)
+    m = g.group_metrics("microrregiao")
+    assert list(m) == ["1.1", "2.1", "DESCONHECIDA"]
+    assert m["1.1"] == {"group": "1.1", "order": 3, "internal": 2, "cut": 2, "density": pytest.approx(2 / 3)}
+    assert (m["2.1"]["internal"], m["2.1"]["cut"]) == (0, 2)
+    # função como atributo: agrupa por qualquer critério
+    por_letra = group_metrics(g, lambda nome, dados: "AB" if nome in "AB" else None)
+    assert (por_letra["AB"]["internal"], por_letra["AB"]["cut"]) == (1, 2)
+
+
+def test_export_microrregioes_igual_por_grupo(tmp_path):
+    import json
+    g = Graph()
+    for nome, micro in [("A", "1.1"), ("B", "1.1"), ("C", "2.1"), ("D", "DESCONHECIDA")]:
+        g.add_node(nome, microrregiao=micro)
+    for u, v in [("A", "B"), ("B", "C"), ("C", "D")]:
+        g.add_edge(u, v, 1)
+    saida = tmp_path / "micro.json"
+    g.export_microrregioes_json(saida)
+    dados = json.loads(saida.read_text(encoding="utf-8"))
+    assert dados == [
+        {"microrregiao": "1.1", "ordem": 2, "tamanho": 1, "densidade": 1.0},
+        {"microrregiao": "2.1", "ordem": 1, "tamanho": 0, "densidade": 0.0},
+    ]
@@ -0,0 +1,75 @@
+import pytest
+import random
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.algorithms import kruskal, prim
+
+
+@pytest.fixture
+def dois_componentes():
+
+    # Quadrado A-B-C-D com diagonal e uma aresta paralela; E-F isolado do resto.
+
+    g = Graph()
+    g.add_edge("A", "B", 1.0)
+    g.add_edge("B", "C", 2.0)
+    g.add_edge("C", "D", 1.0)
+    g.add_edge("D", "A", 4.0)
+    g.add_edge("A", "C", 3.0)
+    g.add_edge("C", "D", 0.5)
+    g.add_edge("B", "B", 0.1)
+    g.add_edge("E", "F", 7.0)
+    return g
+
+
+def _arestas(res):
+    return sorted((tuple(sorted((e["source"], e["destination"]))), e["weight"]) for e in res["edges"])
+
+
+@pytest.mark.parametrize("algoritmo", [kruskal, prim])
+def test_floresta_minima(dois_componentes, algoritmo):
+    res = algoritmo(dois_componentes)
+    assert res["algorithm"] == algoritmo.__name__
+    assert res["total_weight"] == pytest.approx(10.5)
+    assert res["nodes"] == 6
+    assert res["components"] == 2
+    assert _arestas(res) == [(("A", "B"), 1.0), (("B", "C"), 2.0), (("C", "D"), 0.5), (("E", "F"), 7.0)]
+
+
+def test_prim_comeca_pela_origem(dois_componentes):
+    res = prim(dois_componentes, start_node="E")
+    assert res["edges"][0] == {"source": "E", "destination": "F", "weight": 7.0}
+    with pytest.raises(ValueError):
+        prim(dois_componentes, start_node="Z")
+
+
+def test_dirigido_usa_grafo_subjacente():
+    g = Graph(directed=True)
+    g.add_edge("A", "B", 5.0)
+    g.add_edge("B", "A", 2.0)
+    g.add_edge("C", "B", 1.0)
+    for algoritmo in (kruskal, prim):
+        res = algoritmo(g)
+        assert res["total_weight"] == pytest.approx(3.0)
+        assert res["components"] == 1
+
+
+def test_kruskal_e_prim_concordam_em_grafos_aleatorios():
+    for semente in range(30):
+        rnd = random.Random(semente)
+        g = Graph()
+        n = rnd.randint(1, 12)
+        for i in range(n):
+            g.add_node(f"n{i}")
+        for _ in range(rnd.randint(0, 30)):
+            g.add_edge(f"n{rnd.randrange(n)}", f"n{rnd.randrange(n)}", float(rnd.randint(-3, 9)))
+        k, p = kruskal(g), prim(g)
+        assert k["total_weight"] == pytest.approx(p["total_weight"])
+        assert k["components"] == p["components"]
+        assert len(k["edges"]) == n - k["components"]
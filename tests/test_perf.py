@@ -0,0 +1,37 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.perf import percentil, resumir_amostras, medir
+
+
+def test_percentil_interpolado():
+    dados = [1.0, 2.0, 3.0, 4.0, 5.0]
+    assert percentil(dados, 0) == 1.0
+    assert percentil(dados, 50) == 3.0
+    assert percentil(dados, 100) == 5.0
+    assert percentil(dados, 25) == 2.0
+    assert percentil([10.0, 20.0], 50) == 15.0
+
+
+def test_resumo_amostras():
+    resumo = resumir_amostras([4.0, 1.0, 3.0, 2.0])
+    assert resumo["n"] == 4
+    assert resumo["min_ms"] == 1.0
+    assert resumo["max_ms"] == 4.0
+    assert resumo["mean_ms"] == 2.5
+    assert resumo["stdev_ms"] == pytest.approx(1.291, abs=1e-3)
+    assert resumir_amostras([7.0])["stdev_ms"] == 0.0
+
+
+def test_medir_conta_execucoes():
+    chamadas = []
+    resumo = medir(lambda: chamadas.append(1), repeticoes=3, aquecimento=2, memoria=True)
+    # 2 de aquecimento + 3 cronometradas + 1 para medir memória
+    assert len(chamadas) == 6
+    assert resumo["n"] == 3
+    assert "peak_mem_kb" in resumo
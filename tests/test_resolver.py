@@ -0,0 +1,54 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.resolver import normalize_key
+
+
+@pytest.fixture
+def grafo_nomes():
+
+    # Grafo com nomes acentuados, como os bairros do Recife.
+
+    g = Graph()
+    for node in ["Boa Vista", "Boa Viagem", "Graças", "Várzea", "Santo Amaro"]:
+        g.add_node(node)
+    return g
+
+
+def test_normalize_key():
+    assert normalize_key("  Graças ") == "gracas"
+    assert normalize_key("Boa\t  Vista") == "boa vista"
+
+
+def test_resolve_exato(grafo_nomes):
+    # acentos, caixa e espaços extras não importam
+    assert grafo_nomes.resolve_name("gracas") == "Graças"
+    assert grafo_nomes.resolve_name("  VARZEA  ") == "Várzea"
+    assert grafo_nomes.resolve_name("Inexistente") is None
+
+
+def test_resolver_acompanha_add_node(grafo_nomes):
+    # o resolvedor já construído deve enxergar nós adicionados depois
+    assert grafo_nomes.resolve_name("torre") is None
+    grafo_nomes.add_node("Torre")
+    assert grafo_nomes.resolve_name("torre") == "Torre"
+
+
+def test_prefixo(grafo_nomes):
+    assert grafo_nomes.resolver.prefix("boa") == ["Boa Viagem", "Boa Vista"]
+    assert grafo_nomes.resolver.prefix("xyz") == []
+
+
+def test_fuzzy(grafo_nomes):
+    # prefixo único
+    assert grafo_nomes.resolve_name("sant", fuzzy=True) == "Santo Amaro"
+    # erro de digitação
+    assert grafo_nomes.resolve_name("Boa Vsita", fuzzy=True) == "Boa Vista"
+    # prefixo ambíguo sem nome parecido o bastante
+    assert grafo_nomes.resolve_name("bo", fuzzy=True) is None
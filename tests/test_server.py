@@ -0,0 +1,98 @@
+import asyncio
+import json
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from server import QueryServer, executar_consulta
+
+
+@pytest.fixture
+def grafo_server():
+
+    # Grafo pequeno de "bairros" (nomes acentuados) para o servidor.
+
+    g = Graph()
+    for node in ["Boa Vista", "Graças", "Torre", "Várzea"]:
+        g.add_node(node)
+    g.add_edge("Boa Vista", "Graças", 1.0)
+    g.add_edge("Graças", "Torre", 2.0)
+    g.add_edge("Boa Vista", "Torre", 5.0)
+    return g
+
+
+async def _requisicoes(server: QueryServer, pedidos: list[bytes]) -> list[tuple[int, dict]]:
+    # Envia várias requisições na MESMA conexão (keep-alive) e lê as respostas
+    srv = await server.start(port=0)
+    porta = srv.sockets[0].getsockname()[1]
+    reader, writer = await asyncio.open_connection("127.0.0.1", porta)
+    respostas = []
+    for pedido in pedidos:
+        writer.write(pedido)
+        await writer.drain()
+        status = int((await reader.readline()).split()[1])
+        tamanho = 0
+        while True:
+            linha = await reader.readline()
+            if linha == b"\r\n":
+                break
+            if linha.lower().startswith(b"content-length:"):
+                tamanho = int(linha.split(b":")[1])
+        respostas.append((status, json.loads(await reader.readexactly(tamanho))))
+    writer.close()
+    srv.close()
+    await srv.wait_closed()
+    await server.aclose()
+    return respostas
+
+
+def test_executar_consulta_mesmo_payload_do_cli(grafo_server):
+    payload = executar_consulta(grafo_server, False, "dijkstra", {"start": "boa vista", "end": "torre"})
+    assert payload == {"algorithm": "dijkstra", "from": "Boa Vista", "to": "Torre", "cost": 3.0, "path": ["Boa Vista", "Graças", "Torre"]}
+    with pytest.raises(ValueError, match="Parâmetro obrigatório ausente"):
+        executar_consulta(grafo_server, False, "bfs", {})
+
+
+def test_servidor_http_keep_alive(grafo_server):
+    corpo = json.dumps({"start": "Boa Vista"}).encode()
+    pedidos = [
+        b"GET /dijkstra?start=Boa%20Vista&end=Torre HTTP/1.1\r\nHost: x\r\n\r\n",
+        b"POST /bfs HTTP/1.1\r\nContent-Length: " + str(len(corpo)).encode() + b"\r\n\r\n" + corpo,
+        b"GET /dfs?start=Inexistente HTTP/1.1\r\n\r\n",
+        b"GET /nada HTTP/1.1\r\n\r\n",
+        b"GET /health HTTP/1.1\r\n\r\n",
+    ]
+    respostas = asyncio.run(_requisicoes(QueryServer(grafo_server, workers=2), pedidos))
+
+    assert respostas[0] == (200, {"algorithm": "dijkstra", "from": "Boa Vista", "to": "Torre", "cost": 3.0, "path": ["Boa Vista", "Graças", "Torre"]})
+    assert respostas[1][0] == 200
+    assert respostas[1][1]["order"][0] == "Boa Vista"
+    assert respostas[1][1]["distance"]["Várzea"] == -1
+    assert respostas[2][0] == 400
+    assert respostas[3][0] == 404
+    assert respostas[4][1]["status"] == "ok"
+    assert respostas[4][1]["nodes"] == 4
+
+
+def test_dijkstra_batch_pelo_servidor(grafo_server):
+    corpo = json.dumps({"pairs": [["Boa Vista", "Torre"], ["Boa Vista", "Graças"], ["Boa Vista", "Várzea"], ["X", "Torre"]]}).encode()
+    pedidos = [b"POST /dijkstra-batch HTTP/1.1\r\nContent-Length: " + str(len(corpo)).encode() + b"\r\n\r\n" + corpo]
+    [(status, payload)] = asyncio.run(_requisicoes(QueryServer(grafo_server, workers=2), pedidos))
+    assert status == 200
+    assert payload["count"] == 4
+    assert payload["results"][0]["path"] == ["Boa Vista", "Graças", "Torre"]
+    assert payload["results"][2]["path"] == []
+    assert "error" in payload["results"][3]
+
+
+@pytest.mark.parametrize("tamanho", [b"abc", b"-5"])
+def test_content_length_invalido(grafo_server, tamanho):
+    pedidos = [b"POST /bfs HTTP/1.1\r\nContent-Length: " + tamanho + b"\r\n\r\n"]
+    [(status, payload)] = asyncio.run(_requisicoes(QueryServer(grafo_server, workers=2), pedidos))
+    assert status == 400
+    assert "Content-Length" in payload["error"]
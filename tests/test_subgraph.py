@@ -0,0 +1,62 @@
+import pytest
+import sys
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parents[1] / "src"
+if str(SRC_DIR) not in sys.path:
+    sys.path.insert(0, str(SRC_DIR))
+
+from graphs.graph import Graph
+from graphs.algorithms import dijkstra, bfs, dfs, bellman_ford
+from graphs.metrics import group_metrics
+
+
+@pytest.fixture
+def grafo():
+
+    # A-B-C-D em linha, com um atalho A-D mais caro e E ligado a todos por fora.
+
+    g = Graph()
+    for u, v, w in [("A", "B", 1), ("B", "C", 1), ("C", "D", 1), ("A", "D", 5),
+                    ("E", "A", 1), ("E", "D", 1)]:
+        g.add_edge(u, v, w, airline="G3")
+    return g
+
+
+def test_vista_filtra_adjacencia_sem_copiar(grafo):
+    sub = grafo.subgraph(["A", "B", "D"])
+    assert list(sub.nodes_data) == ["A", "B", "D"]
+    assert "C" not in sub.adj and "E" not in sub.nodes_data
+    assert [e["node"] for e in sub.adj["A"]] == ["B", "D"]
+    # mesmas entradas (e dados) do grafo pai
+    assert sub.adj["A"][0] is grafo.adj["A"][0]
+    assert sub.nodes_data["A"] is grafo.nodes_data["A"]
+    assert (sub.num_vertices, sub.num_edges, sub.get_grau("D")) == (3, 2, 1)
+    with pytest.raises(ValueError):
+        grafo.subgraph(["A", "X"])
+
+
+def test_algoritmos_na_vista(grafo):
+    sub = grafo.subgraph(["A", "B", "C", "D"])
+    # sem E, o caminho A->D passa pela linha (custo 3) e não por E (custo 2)
+    assert dijkstra(grafo, "A", "D")["path"] == ["A", "E", "D"]
+    assert dijkstra(sub, "A", "D") == {"cost": 3, "path": ["A", "B", "C", "D"]}
+    assert bfs(sub, "A")["distance"] == {"A": 0, "B": 1, "C": 2, "D": 1}
+    assert dfs(sub, "A")["order"] == ["A", "B", "C", "D"]
+    assert bellman_ford(sub, "A")["distance"]["D"] == 3
+    with pytest.raises(ValueError):
+        dijkstra(sub, "A", "E")
+    assert group_metrics(sub, lambda nome, dados: "linha")["linha"]["internal"] == 4
+
+
+def test_vista_acompanha_o_pai(grafo):
+    sub = grafo.subgraph(["A", "B", "C"])
+    assert bfs(sub, "A")["order"] == ["A", "B", "C"]
+    grafo.remove_edge("A", "B")
+    assert bfs(sub, "A")["order"] == ["A"]
+    grafo.add_edge("A", "C", 1)
+    grafo.remove_node("B")
+    assert list(sub.nodes_data) == ["A", "C"]
+    assert bfs(sub, "A")["order"] == ["A", "C"]
+    # vista de vista continua apontando para o grafo original
+    assert list(sub.subgraph(["C"]).nodes_data) == ["C"]